@@ -0,0 +1,114 @@
+"""
+Benchmark the latency of a slider event on the normal distribution page.
+
+The page is run headless with Streamlit's AppTest and the "Mean" slider is
+moved through a range of values; every move is one rerun. The same events are
+replayed on the previous version of the page (fresh samples and a Matplotlib
+figure per rerun) for comparison. Besides the rerun time, the size of the
+chart payload sent to the browser is reported.
+
+Run from the Test directory:
+    python benchmarks/bench_normal_slider.py
+"""
+
+import json
+import os
+import statistics
+import sys
+import time
+
+from streamlit.testing.v1 import AppTest
+
+TEST_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MEAN_VALUES = [round(-5 + 0.5 * i, 1) for i in range(21)]
+
+
+def current_page(test_dir):
+    import sys
+
+    sys.path.insert(0, test_dir)
+    from concepts import normal_distribution
+
+    normal_distribution.app()
+
+
+def legacy_page():
+    import streamlit as st
+    import numpy as np
+    import matplotlib.pyplot as plt
+
+    mean = st.slider("Mean", -10.0, 10.0, 0.0)
+    std_dev = st.slider("Standard Deviation", 0.1, 5.0, 1.0)
+
+    data = np.random.normal(mean, std_dev, 1000)
+
+    fig, ax = plt.subplots(figsize=(8, 5))
+    ax.hist(data, bins=30, color='#7fb2e2', edgecolor='black')
+    ax.set_xlabel('Value')
+    ax.set_ylabel('Frequency')
+    ax.set_xlim([-20, 30])
+    ax.set_ylim([0, 105])
+    st.pyplot(fig)
+    plt.close(fig)
+
+
+def chart_payload_bytes(at):
+    """Size of the Vega-Lite spec (with its inline data) sent to the browser in the last rerun."""
+    chart = at.get("vega_lite_chart")[0]
+    return len(chart.proto.spec.encode("utf-8"))
+
+
+def legacy_payload_bytes():
+    """Size of the PNG st.pyplot sends for the legacy figure."""
+    import io
+
+    import matplotlib.pyplot as plt
+    import numpy as np
+
+    fig, ax = plt.subplots(figsize=(8, 5))
+    ax.hist(np.random.normal(0, 1, 1000), bins=30, color='#7fb2e2', edgecolor='black')
+    ax.set_xlim([-20, 30])
+    ax.set_ylim([0, 105])
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", bbox_inches="tight", dpi=200)
+    plt.close(fig)
+    return len(buffer.getvalue())
+
+
+def slider_latencies(at):
+    at.run()
+    latencies = []
+    for mean in MEAN_VALUES:
+        start = time.perf_counter()
+        at.slider[0].set_value(mean).run()
+        latencies.append(time.perf_counter() - start)
+        assert not at.exception, at.exception
+    return latencies
+
+
+def main():
+    results = {}
+    for name, at, payload in [
+        ("cached samples + Vega-Lite", AppTest.from_function(current_page, args=(TEST_DIR,), default_timeout=60),
+         chart_payload_bytes),
+        ("legacy Matplotlib", AppTest.from_function(legacy_page, default_timeout=60),
+         lambda at: legacy_payload_bytes()),
+    ]:
+        latencies = slider_latencies(at)
+        results[name] = {
+            "median_ms": round(1000 * statistics.median(latencies), 2),
+            "max_ms": round(1000 * max(latencies), 2),
+            "chart_payload_bytes": payload(at),
+        }
+
+    print(f"{'page':<28} {'median [ms]':>12} {'max [ms]':>10} {'payload [B]':>12}")
+    for name, result in results.items():
+        print(f"{name:<28} {result['median_ms']:12.2f} {result['max_ms']:10.2f} {result['chart_payload_bytes']:>12}")
+
+    if "--json" in sys.argv:
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
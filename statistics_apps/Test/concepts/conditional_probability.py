@@ -1,9 +1,7 @@
 import streamlit as st
-import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib_venn import venn2
 import matplotlib.patches as mpatches
-from scipy.stats import alpha
 
 def app():
     st.write("## Conditional Probability")
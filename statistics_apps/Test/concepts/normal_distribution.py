@@ -1,25 +1,89 @@
+import functools
+import math
+import secrets
+
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib_venn import venn2
-import matplotlib.patches as mpatches
-from scipy.stats import alpha
+
+N_SAMPLES = 1000
+N_BINS = 30
+
+
+@functools.lru_cache(maxsize=16)
+def standard_normal_histogram(seed, n_samples=N_SAMPLES, bins=N_BINS):
+    """
+    Histogram of standard normal samples, computed once per seed.
+
+    If Z ~ N(0, 1) then Z·σ+μ ~ N(μ, σ²), and the histogram of the transformed
+    samples has the same counts with the bin edges transformed the same way.
+    So a slider move only rescales the edges instead of resampling.
+
+    Returns:
+        tuple: Bin counts and bin edges of the standard normal samples (read-only)
+    """
+    samples = np.random.default_rng(seed).standard_normal(n_samples)
+    counts, edges = np.histogram(samples, bins=bins)
+    counts.setflags(write=False)
+    edges.setflags(write=False)
+    return counts, edges
+
+
+def normal_density(x, mean, std_dev):
+    return np.exp(-0.5 * ((x - mean) / std_dev) ** 2) / (std_dev * math.sqrt(2 * math.pi))
+
+
+def histogram_chart(mean, std_dev, seed, show_density):
+    """
+    Vega-Lite spec of the histogram of N_SAMPLES normal samples.
+
+    Only the ~30 bars (and the density curve) are sent, the browser draws the chart.
+    """
+    counts, edges = standard_normal_histogram(seed)
+    edges = edges * std_dev + mean
+
+    bars = [{"start": float(start), "end": float(end), "count": int(count)}
+            for start, end, count in zip(edges[:-1], edges[1:], counts)]
+    layers = [{
+        "data": {"values": bars},
+        "mark": {"type": "bar", "color": "#7fb2e2", "stroke": "black", "strokeWidth": 1, "clip": True},
+        "encoding": {
+            "x": {"field": "start", "type": "quantitative", "title": "Value",
+                  "scale": {"domain": [-20, 30]}},
+            "x2": {"field": "end"},
+            "y": {"field": "count", "type": "quantitative", "title": "Frequency",
+                  "scale": {"domain": [0, 105]}},
+        },
+    }]
+
+    if show_density:
+        # Expected count per bin: N · bin width · density
+        x = np.linspace(max(mean - 4 * std_dev, -20), min(mean + 4 * std_dev, 30), 200)
+        expected = N_SAMPLES * (edges[1] - edges[0]) * normal_density(x, mean, std_dev)
+        curve = [{"x": float(xi), "y": float(yi)} for xi, yi in zip(x, expected)]
+        layers.append({
+            "data": {"values": curve},
+            "mark": {"type": "line", "color": "red", "strokeWidth": 2, "clip": True},
+            "encoding": {
+                "x": {"field": "x", "type": "quantitative"},
+                "y": {"field": "y", "type": "quantitative"},
+            },
+        })
+
+    return {"layer": layers, "height": 400}
+
 
 def app():
     st.write("## Normal Distribution Histogram")
 
+    if 'normal_seed' not in st.session_state:
+        st.session_state['normal_seed'] = secrets.randbelow(2 ** 32)  # Every session starts from its own sample
+
     mean = st.slider("Mean", -10.0, 10.0, 0.0)
     std_dev = st.slider("Standard Deviation", 0.1, 5.0, 1.0)
+    show_density = st.checkbox("Show the analytic density")
 
-    data = np.random.normal(mean, std_dev, 1000)
-
-    fig, ax = plt.subplots(figsize=(8, 5))
-    ax.hist(data, bins=30, color='#7fb2e2', edgecolor='black')
-    # ax.set_title('Histogram of Normal Distribution')
-    ax.set_xlabel('Value')
-    ax.set_ylabel('Frequency')
-    ax.set_xlim([-20, 30])
-    ax.set_ylim([0, 105])
+    if st.button("New sample"):
+        st.session_state['normal_seed'] += 1
 
     # Place the plot in the center column
     col1, col2, col3 = st.columns([1, 5, 1])
@@ -28,7 +92,8 @@ def app():
 
     with col2:
         # Display the plot in the second column
-        st.pyplot(fig)
+        st.vega_lite_chart(histogram_chart(mean, std_dev, st.session_state['normal_seed'], show_density),
+                           width="stretch")
 
     with col3:
-        st.write("")  # Placeholder for the third column
\ No newline at end of file
+        st.write("")  # Placeholder for the third column
@@ -1,14 +1,25 @@
+import importlib
+
 import streamlit as st
-import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib_venn import venn2, venn2_circles, venn3
-import matplotlib.patches as mpatches
-from scipy.stats import alpha
-from concepts import basic_terms, basic_definitions, conditional_probability, normal_distribution
 
 # Set the password for the app
 PASSWORD = "BGU123"
 
+# Sidebar entry -> concept module. A module (and matplotlib with it) is imported
+# only when its entry is first selected, so the login screen loads streamlit alone.
+CONCEPTS = {
+    "Basic Terms": "concepts.basic_terms",
+    "Basic Definitions": "concepts.basic_definitions",
+    "Conditional Probability": "concepts.conditional_probability",
+    "Normal Distribution": "concepts.normal_distribution",
+}
+
+
+def load_concept(section):
+    """Import the module of a sidebar entry (cached by Python after the first call)."""
+    return importlib.import_module(CONCEPTS[section])
+
+
 # Initialize session state variable for password attempts
 if 'authenticated' not in st.session_state:
     st.session_state['authenticated'] = False
@@ -36,23 +47,10 @@ if st.session_state['authenticated']:
     st.markdown("<h1 style='font-size: 50px; font-weight: bold; color: #139dd1;'>🔢 Statistical Visualizations</h1>", unsafe_allow_html=True)
 
     # Sidebar for navigation
-    section = st.sidebar.radio("Select a Concept", ["Basic Terms", "Basic Definitions", "Conditional Probability",
-                                                    "Normal Distribution"])
-
-    # Visualize union an intersection concepts
-    if section == "Basic Terms":
-        basic_terms.app()
-
-    elif section == "Basic Definitions":
-        basic_definitions.app()
-
-    # Visualize conditional probability
-    elif section == "Conditional Probability":
-        conditional_probability.app()
+    section = st.sidebar.radio("Select a Concept", list(CONCEPTS))
 
-    # Visualize normal distribution
-    elif section == "Normal Distribution":
-        normal_distribution.app()
+    # Visualize the selected concept
+    load_concept(section).app()
 
 
 else:
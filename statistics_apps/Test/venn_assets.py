@@ -0,0 +1,120 @@
+"""
+On-disk cache of the static Venn diagram figures.
+
+A figure is described by a plain spec (dict/list of strings and numbers) and
+stored as a PNG named after a hash of the spec, so the figure is drawn by
+matplotlib-venn only the first time it is requested (or ahead of time, by
+running this module), and every later request just reads the file. Changing
+a spec changes its hash, so stale files are never served.
+
+Spec format:
+    {
+        "sets": 2 or 3,
+        "grid": [rows, cols],
+        "figsize": [width, height],
+        "panels": [
+            {"shaded": [...], "thick": [...], "transparent": [...]},  # region ids, e.g. "10", "011"
+            ...
+        ],
+        "signs": [[panel index, text, x, horizontal alignment], ...],
+    }
+"""
+
+import hashlib
+import io
+import json
+import os
+
+# Bump to invalidate every cached file after a change in draw_venn_figure
+RENDER_VERSION = 1
+
+CACHE_DIR = os.environ.get("VENN_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".venn_cache"))
+
+SHADE_COLOR = '#af8bce'
+OUTLINE_COLORS = ['#e2877f', '#7fb2e2', '#6bca93']  # Circles A, B, C
+
+REGIONS = {
+    2: ['10', '01', '11'],
+    3: ['100', '010', '001', '110', '101', '011', '111'],
+}
+
+
+def spec_hash(spec):
+    """Content hash of a figure spec (and of the renderer version)."""
+    payload = json.dumps([RENDER_VERSION, spec], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def draw_venn_figure(spec):
+    """Draw the figure of a spec and return it as PNG bytes."""
+    import matplotlib.pyplot as plt
+    from matplotlib_venn import venn2, venn3
+
+    n_sets = spec["sets"]
+    rows, cols = spec["grid"]
+    regions = REGIONS[n_sets]
+    circles = [region_id for region_id in regions if region_id.count('1') == 1]
+
+    fig, ax = plt.subplots(figsize=spec["figsize"])
+    ax.axis('off')
+
+    panel_axes = []
+    for index, panel in enumerate(spec["panels"]):
+        panel_ax = fig.add_subplot(rows, cols, index + 1)
+        panel_axes.append(panel_ax)
+        if n_sets == 2:
+            venn = venn2(subsets=(1, 1, 1), set_labels=('A', 'B'), ax=panel_ax)
+        else:
+            venn = venn3(subsets=(1, 1, 1, 1, 1, 1, 1), set_labels=('A', 'B', 'C'), ax=panel_ax)
+
+        for region_id in regions:
+            venn.get_label_by_id(region_id).set_text('')
+            venn.get_patch_by_id(region_id).set_color(SHADE_COLOR if region_id in panel["shaded"] else 'white')
+        for region_id, color in zip(circles, OUTLINE_COLORS):
+            venn.get_patch_by_id(region_id).set_edgecolor(color)
+        for region_id in panel["thick"]:
+            venn.get_patch_by_id(region_id).set_linewidth(2)
+        for region_id in panel["transparent"]:
+            venn.get_patch_by_id(region_id).set_alpha(0.7)
+
+    for index, text, x, ha in spec["signs"]:
+        panel_axes[index].annotate(text, xy=(x, 0.0), fontsize=24, ha=ha, va='center', color='black')
+
+    fig.subplots_adjust(wspace=0.1)
+
+    # Same output as st.pyplot
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", bbox_inches="tight", dpi=200)
+    plt.close(fig)
+    return buffer.getvalue()
+
+
+def get_venn_figure(spec):
+    """
+    Return the PNG bytes of a spec's figure, drawing and caching it on the first request.
+    """
+    path = os.path.join(CACHE_DIR, f"{spec_hash(spec)}.png")
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        pass
+
+    image = draw_venn_figure(spec)
+
+    # Write to a temporary file first so concurrent sessions never read a partial file
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(image)
+    os.replace(tmp_path, path)
+    return image
+
+
+if __name__ == "__main__":
+    # Build the cache ahead of time: python venn_assets.py
+    from concepts import basic_definitions
+
+    for figure_spec in basic_definitions.FIGURES:
+        get_venn_figure(figure_spec)
+        print(os.path.join(CACHE_DIR, f"{spec_hash(figure_spec)}.png"))
@@ -0,0 +1,126 @@
+"""
+Memoized rendering of two-set Venn diagrams with a colored set operation.
+
+The circle geometry of a pair of sets is computed by matplotlib-venn once and
+kept as plain region paths. An operation is then drawn by filling those paths
+with its coloring, and the resulting PNG is memoized per (sets, operation), so
+switching between operations is a cache lookup after the first time.
+"""
+
+import functools
+import io
+from dataclasses import dataclass
+
+from venn_assets import OUTLINE_COLORS, REGIONS, SHADE_COLOR
+
+# Number of rendered (sets, operation) images kept in memory
+RENDER_CACHE_SIZE = 32
+
+# Operation -> (shaded regions, regions with a thick outline, transparent regions,
+#               title, title font size, title padding or None for the default)
+OPERATIONS = {
+    "Union": (['10', '01', '11'], ['10', '01'], ['10', '01', '11'], r'$A \cup B$', 20, 0.1),
+    "Intersection": (['11'], ['10', '01'], ['11'], r'$A \cap B$', 20, 0.1),
+    "Difference": (['10'], ['10', '01', '11'], ['10'], r"A\B = $A \cap \overline{B}$", 18, None),
+}
+
+
+@dataclass(frozen=True)
+class Venn2Geometry:
+    """
+    Layout of a two-set Venn diagram.
+
+    Attributes:
+        regions (dict): Region id ('10', '01', '11') -> matplotlib Path in data coordinates
+        set_labels (list): (x, y, text, ha, va) of the set labels
+        xlim (tuple): x limits of the diagram
+        ylim (tuple): y limits of the diagram
+    """
+    regions: dict
+    set_labels: list
+    xlim: tuple
+    ylim: tuple
+
+
+@functools.lru_cache(maxsize=8)
+def venn2_geometry(sets, set_labels=('A', 'B')):
+    """
+    Compute the layout of a two-set Venn diagram.
+
+    Args:
+        sets (tuple): Two frozensets
+        set_labels (tuple): Names of the sets
+
+    Returns:
+        Venn2Geometry: The region paths, set label positions and limits
+    """
+    import matplotlib.pyplot as plt
+    from matplotlib_venn import venn2
+
+    fig, ax = plt.subplots()
+    venn = venn2([set(s) for s in sets], set_labels=set_labels, ax=ax)
+
+    regions = {}
+    for region_id in REGIONS[2]:
+        patch = venn.get_patch_by_id(region_id)
+        if patch is not None:  # Empty regions have no patch
+            regions[region_id] = patch.get_patch_transform().transform_path(patch.get_path())
+
+    labels = [(*label.get_position(), label.get_text(), label.get_ha(), label.get_va())
+              for label in venn.set_labels]
+    geometry = Venn2Geometry(regions, labels, ax.get_xlim(), ax.get_ylim())
+    plt.close(fig)
+    return geometry
+
+
+@functools.lru_cache(maxsize=RENDER_CACHE_SIZE)
+def render_venn2(sets, operation):
+    """
+    Draw the diagram of two sets with the regions of an operation colored.
+
+    The diagram sits inside a rectangle marking the sample space Ω.
+
+    Args:
+        sets (tuple): Two frozensets
+        operation (str): A key of OPERATIONS
+
+    Returns:
+        bytes: PNG image (same format as st.pyplot)
+    """
+    import matplotlib.patches as mpatches
+    import matplotlib.pyplot as plt
+
+    shaded, thick, transparent, title, title_size, title_pad = OPERATIONS[operation]
+    geometry = venn2_geometry(sets)
+
+    fig, ax = plt.subplots()
+    ax.set_aspect('equal')
+    ax.set_xlim(geometry.xlim)
+    ax.set_ylim(geometry.ylim)
+    ax.set_axis_off()
+
+    # Fill the precomputed regions with the operation's coloring
+    outline_colors = dict(zip(['10', '01'], OUTLINE_COLORS))
+    for region_id, path in geometry.regions.items():
+        patch = mpatches.PathPatch(path)
+        patch.set_color(SHADE_COLOR if region_id in shaded else 'white')
+        if region_id in outline_colors:
+            patch.set_edgecolor(outline_colors[region_id])
+        if region_id in thick:
+            patch.set_linewidth(2)
+        patch.set_alpha(0.7 if region_id in transparent else 0.4)  # 0.4 is matplotlib-venn's default
+        ax.add_patch(patch)
+
+    for x, y, text, ha, va in geometry.set_labels:
+        ax.text(x, y, text, size='large', ha=ha, va=va)
+
+    # Sample space rectangle with the Ω label at the bottom right
+    ax.add_patch(mpatches.Rectangle((-0.74, -0.557), 1.47, 1.06, linewidth=2, edgecolor='black', facecolor='none'))
+    ax.text(0.65, -0.48, r'$\Omega$', fontsize=30, ha='center', va='center')
+
+    ax.set_title(title, fontsize=title_size, pad=title_pad)
+
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", bbox_inches="tight", dpi=200)
+    plt.close(fig)
+    return buffer.getvalue()
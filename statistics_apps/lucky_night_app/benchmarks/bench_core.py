@@ -0,0 +1,46 @@
+"""
+Benchmark the simulations of lucky_night_core on their own, without Streamlit.
+
+Every game simulation is timed at growing batch sizes with a fixed seed, so
+a change to a hot path can be measured without running a page.
+
+Run from the lucky_night_app directory:
+    python benchmarks/bench_core.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lucky_night_core import flip_coins, roll_dice, simulate_money_drop, simulate_throws
+
+BATCH_SIZES = [1_000, 100_000, 1_000_000]
+REPEATS = 5
+
+SIMULATIONS = {
+    "simulate_throws": lambda n: simulate_throws(n, 0.39, 0.71, seed=0),
+    "roll_dice": lambda n: roll_dice(n, seed=0),
+    "flip_coins": lambda n: flip_coins(n, seed=0),
+    "simulate_money_drop": lambda n: simulate_money_drop(rate=5, num_rounds=n, seed=0),
+}
+
+
+def best_seconds(run, n):
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        run(n)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    print(f"{'simulation':<20}" + "".join(f"{f'{n:,} [ms]':>16}" for n in BATCH_SIZES))
+    for name, run in SIMULATIONS.items():
+        print(f"{name:<20}" + "".join(f"{1000 * best_seconds(run, n):16.2f}" for n in BATCH_SIZES))
+
+
+if __name__ == "__main__":
+    main()
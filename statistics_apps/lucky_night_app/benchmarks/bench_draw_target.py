@@ -0,0 +1,74 @@
+"""
+Benchmark the render time of the target board as the number of throws grows.
+
+Each figure is built and serialized to PNG the same way st.pyplot does it, once
+with the single-artist path of draw_target and once with the old one-Line2D-per-throw
+path (only for small counts, it is far too slow beyond that).
+
+Run from the lucky_night_app directory:
+    python benchmarks/bench_draw_target.py
+"""
+
+import io
+import os
+import sys
+import time
+
+import matplotlib
+
+matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lucky_night_core.target_board import calculate_radii_from_percentages, draw_target
+
+THROW_COUNTS = [10, 100, 1500, 10_000, 100_000, 1_000_000]
+LEGACY_MAX_THROWS = 1500
+REPEATS = 3
+
+
+def random_throws(n_throws, rng):
+    angle = rng.uniform(0, 2 * np.pi, n_throws)
+    r = np.sqrt(rng.uniform(0, 1, n_throws))
+    return r * np.cos(angle), r * np.sin(angle)
+
+
+def draw_target_legacy(radius_a, radius_b, throws):
+    fig = draw_target(radius_a, radius_b)
+    ax = fig.axes[0]
+    for x, y in zip(*throws):
+        ax.plot(x, y, 'k.', markersize=2)
+    return fig
+
+
+def render_seconds(build_figure):
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fig = build_figure()
+        fig.savefig(io.BytesIO(), format='png', dpi=200, bbox_inches='tight')
+        best = min(best, time.perf_counter() - start)
+        plt.close(fig)
+    return best
+
+
+def main():
+    rng = np.random.default_rng(0)
+    radius_a, radius_b = calculate_radii_from_percentages(15, 35)
+
+    print(f"{'throws':>10} {'draw_target [s]':>16} {'legacy [s]':>12}")
+    for n_throws in THROW_COUNTS:
+        throws = random_throws(n_throws, rng)
+        current = render_seconds(lambda: draw_target(radius_a, radius_b, throws=throws))
+        if n_throws <= LEGACY_MAX_THROWS:
+            legacy = f"{render_seconds(lambda: draw_target_legacy(radius_a, radius_b, throws)):12.3f}"
+        else:
+            legacy = f"{'-':>12}"
+        print(f"{n_throws:>10} {current:16.3f} {legacy}")
+
+
+if __name__ == "__main__":
+    main()
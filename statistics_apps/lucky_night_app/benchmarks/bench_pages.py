@@ -0,0 +1,171 @@
+"""
+Headless benchmark of the home page and every game page.
+
+Each scenario loads a page with Streamlit's AppTest, sets the batch size and
+clicks the game's button, and measures that rerun:
+    - wall time (median and min over several fresh sessions)
+    - peak Python memory during the rerun (tracemalloc, numpy included)
+    - payload size: the serialized page elements plus the media files (images)
+
+The results are written to a JSON file, so two commits can be compared:
+    python benchmarks/bench_pages.py --output before.json
+    python benchmarks/bench_pages.py --output after.json --compare before.json
+
+Run from the lucky_night_app directory. Needs no network or browser.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
+
+import numpy as np
+import streamlit
+from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+from streamlit.testing.v1 import AppTest
+
+HOME_PAGE = "עמוד_הבית.py"
+
+# (name, page file, label of the batch size input, label of the button, batch sizes)
+SCENARIOS = [
+    ("home", HOME_PAGE, None, None, [None]),
+    ("target", "pages/1_קליעה_למטרה.py", "מספר זריקות (1-1,000,000)", "זרקו חצים", [1, 1_000, 100_000]),
+    ("dice", "pages/2_קוביות_מזל.py", "מספר הטלות (1-1,000,000):", "הטלת קוביות", [1, 1_000, 100_000]),
+    ("coin", "pages/3_מטבע_הזהב.py", "מספר הטלות (1-1,000,000):", "הטלת המטבעות", [1, 1_000, 100_000]),
+    ("money", "pages/4_גשם_של_שטרות.py", "מספר משחקים (1-1,000,000):", "התחלת המשחק", [1, 1_000, 100_000]),
+]
+
+# Bytes of the media files (images) saved during the current rerun
+_media_bytes = [0]
+_load_and_get_id = MemoryMediaFileStorage.load_and_get_id
+
+
+def _counting_load_and_get_id(self, path_or_data, *args, **kwargs):
+    if isinstance(path_or_data, (bytes, bytearray)):
+        _media_bytes[0] += len(path_or_data)
+    else:
+        _media_bytes[0] += os.path.getsize(path_or_data)
+    return _load_and_get_id(self, path_or_data, *args, **kwargs)
+
+
+MemoryMediaFileStorage.load_and_get_id = _counting_load_and_get_id
+
+
+def element_bytes(node):
+    """Serialized size of every element of the page tree."""
+    size = node.proto.ByteSize() if getattr(node, "proto", None) is not None else 0
+    for child in getattr(node, "children", {}).values():
+        size += element_bytes(child)
+    return size
+
+
+def prepare(page, input_label, button_label, batch):
+    """Load the page and set the batch size, returning the session and the rerun to measure."""
+    at = AppTest.from_file(os.path.join(APP_DIR, page), default_timeout=120)
+    if button_label is None:
+        return at, at.run
+
+    at.run()
+    number_input = next(n for n in at.number_input if n.label == input_label)
+    number_input.set_value(batch)
+    button = next(b for b in at.button if b.label == button_label)
+    return at, button.click().run
+
+
+def measure(page, input_label, button_label, batch, repeats):
+    times = []
+    for _ in range(repeats):
+        at, rerun = prepare(page, input_label, button_label, batch)
+        _media_bytes[0] = 0
+        start = time.perf_counter()
+        rerun()
+        times.append(time.perf_counter() - start)
+        if at.exception:
+            raise RuntimeError(f"{page}: {at.exception}")
+    media = _media_bytes[0]
+    elements = element_bytes(at._tree)
+
+    # A separate session for the memory, tracemalloc slows the rerun down
+    at, rerun = prepare(page, input_label, button_label, batch)
+    tracemalloc.start()
+    rerun()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "wall_s": {"median": round(statistics.median(times), 4), "min": round(min(times), 4)},
+        "peak_memory_mb": round(peak / 2 ** 20, 2),
+        "payload_bytes": {"elements": elements, "media": media, "total": elements + media},
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=APP_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_path):
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {(r["page"], r["batch"]): r for r in json.load(f)["results"]}
+
+    print(f"\n{'page':<8} {'batch':>8} {'time ratio':>11} {'memory ratio':>13} {'payload ratio':>14}")
+    for result in results:
+        old = baseline.get((result["page"], result["batch"]))
+        if old is None:
+            continue
+        time_ratio = result["wall_s"]["median"] / old["wall_s"]["median"]
+        memory_ratio = result["peak_memory_mb"] / max(old["peak_memory_mb"], 1e-9)
+        payload_ratio = result["payload_bytes"]["total"] / max(old["payload_bytes"]["total"], 1)
+        print(f"{result['page']:<8} {str(result['batch']):>8} {time_ratio:11.2f} {memory_ratio:13.2f} {payload_ratio:14.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", default="bench_pages.json", help="JSON file to write the results to")
+    parser.add_argument("--repeats", type=int, default=5, help="fresh sessions timed per scenario")
+    parser.add_argument("--compare", help="JSON file of a previous run to compare with")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'page':<8} {'batch':>8} {'median [s]':>11} {'peak [MB]':>10} {'payload [KB]':>13}")
+    for name, page, input_label, button_label, batches in SCENARIOS:
+        for batch in batches:
+            result = {"page": name, "batch": batch, **measure(page, input_label, button_label, batch, args.repeats)}
+            results.append(result)
+            print(f"{name:<8} {str(batch):>8} {result['wall_s']['median']:11.3f} {result['peak_memory_mb']:10.1f} "
+                  f"{result['payload_bytes']['total'] / 1024:13.1f}")
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "streamlit": streamlit.__version__,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "repeats": args.repeats,
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\nWrote {args.output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
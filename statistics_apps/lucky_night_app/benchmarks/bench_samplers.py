@@ -0,0 +1,81 @@
+"""
+Error of the estimate of P(A) against the throw budget, for every sampler backend.
+
+For every budget, simulate_throws is run with REPEATS seeds per sampler and
+the hit fraction of area A is compared with the exact ratio percent_a / 100.
+The table shows the root-mean-square error and the median time, then the
+smallest budget that reaches TARGET_RMSE with each sampler.
+
+Only the radius coordinate decides the area, and the Latin hypercube puts
+exactly one throw in each of n equal slices of it. So its error is below 1/n,
+and it is zero whenever percent_a / 100 is a multiple of 1/n.
+
+Run from the lucky_night_app directory:
+    python benchmarks/bench_samplers.py
+    python benchmarks/bench_samplers.py --percent-a 15 --percent-b 35 --repeats 50
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lucky_night_core.darts import simulate_throws
+from lucky_night_core.samplers import SAMPLERS
+from lucky_night_core.target_board import calculate_radii_from_percentages
+
+BUDGETS = [100, 1_000, 10_000, 100_000, 1_000_000]
+REPEATS = 20
+
+# Accuracy asked of P(A): 0.1 percentage point
+TARGET_RMSE = 1e-3
+
+
+def measure(sampler, n_throws, radius_a, radius_b, exact, repeats):
+    errors, times = [], []
+    for seed in range(repeats):
+        start = time.perf_counter()
+        _, _, hits = simulate_throws(n_throws, radius_a, radius_b, seed=seed, sampler=sampler)
+        times.append(time.perf_counter() - start)
+        errors.append(hits['A'] / n_throws - exact)
+    return float(np.sqrt(np.mean(np.square(errors)))), statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--percent-a", type=float, default=15, help="size of area A in percent")
+    parser.add_argument("--percent-b", type=float, default=35, help="size of area B in percent")
+    parser.add_argument("--repeats", type=int, default=REPEATS, help="seeds per sampler and budget")
+    args = parser.parse_args()
+
+    radius_a, radius_b = calculate_radii_from_percentages(args.percent_a, args.percent_b)
+    exact = args.percent_a / 100
+
+    for sampler in SAMPLERS:
+        # Warm-up, so the lazy scipy import is not timed
+        simulate_throws(16, radius_a, radius_b, seed=0, sampler=sampler)
+
+    print(f"P(A) = {exact:g}, {args.repeats} seeds per cell\n")
+    print(f"{'throws':>10}" + "".join(f"{f'{sampler} rmse':>17} {'[ms]':>8}" for sampler in SAMPLERS))
+    reached = {}
+    for n_throws in BUDGETS:
+        row = f"{n_throws:>10}"
+        for sampler in SAMPLERS:
+            rmse, seconds = measure(sampler, n_throws, radius_a, radius_b, exact, args.repeats)
+            row += f"{rmse:17.2e} {1000 * seconds:8.2f}"
+            if rmse <= TARGET_RMSE:
+                reached.setdefault(sampler, n_throws)
+        print(row)
+
+    print(f"\nSmallest budget with rmse <= {TARGET_RMSE:g}:")
+    for sampler in SAMPLERS:
+        print(f"    {sampler:<12} {reached.get(sampler, f'> {BUDGETS[-1]:,}')}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Cold start of every page: first-render time in a fresh process, and what the page imports.
+
+Each page is rendered once with Streamlit's AppTest in a new Python process,
+the way a freshly started server worker renders it for the first student.
+Streamlit itself is imported before the clock starts, so the time covers
+what the page adds: its own imports and its first run.
+
+The import report runs the same process under `python -X importtime` and
+lists the top-level modules the page pulled in, by cumulative import time.
+
+The first render of every page must stay under the budget, otherwise the
+script exits with status 1:
+    python benchmarks/bench_startup.py                 # budget of BUDGET_S seconds
+    python benchmarks/bench_startup.py --budget 1.0 --top 15
+
+Run from the lucky_night_app directory.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PAGES = {
+    "home": "עמוד_הבית.py",
+    "target": "pages/1_קליעה_למטרה.py",
+    "dice": "pages/2_קוביות_מזל.py",
+    "coin": "pages/3_מטבע_הזהב.py",
+    "money": "pages/4_גשם_של_שטרות.py",
+}
+
+# Seconds a cold first render may take (measured on a single slow core)
+BUDGET_S = 1.5
+
+# Marks where the page's imports start in the -X importtime output
+MARKER = "-- page imports start --"
+
+# Runs in the fresh process: argv[1] is the page file
+_CHILD = f"""
+import json, sys, time
+import streamlit
+from streamlit.testing.v1 import AppTest
+
+print({MARKER!r}, file=sys.stderr, flush=True)
+at = AppTest.from_file(sys.argv[1], default_timeout=120)
+start = time.perf_counter()
+at.run()
+elapsed = time.perf_counter() - start
+print(json.dumps({{"first_render_s": elapsed, "exception": [str(e.value) for e in at.exception]}}))
+"""
+
+
+def run_child(page, importtime=False):
+    command = [sys.executable] + (["-X", "importtime"] if importtime else []) + ["-c", _CHILD, page]
+    result = subprocess.run(command, cwd=APP_DIR, capture_output=True, text=True, check=True)
+    output = json.loads(result.stdout.strip().splitlines()[-1])
+    if output["exception"]:
+        raise RuntimeError(f"{page}: {output['exception']}")
+    return output["first_render_s"], result.stderr
+
+
+def page_imports(stderr):
+    """
+    Top-level modules imported after the marker, from the -X importtime output.
+
+    Returns:
+        list: (module, cumulative seconds), slowest first
+    """
+    lines = stderr.splitlines()
+    lines = lines[lines.index(MARKER) + 1:] if MARKER in lines else []
+    imports = []
+    for line in lines:
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Nested imports are indented by two spaces per level
+        if name.startswith(" ") and not name.startswith("   "):
+            imports.append((name.strip(), int(cumulative) / 1e6))
+    return sorted(imports, key=lambda item: item[1], reverse=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget", type=float, default=BUDGET_S, help="seconds a cold first render may take")
+    parser.add_argument("--repeats", type=int, default=3, help="fresh processes timed per page")
+    parser.add_argument("--top", type=int, default=8, help="imports listed per page")
+    parser.add_argument("--json", help="also write the results to this JSON file")
+    args = parser.parse_args()
+
+    results = {}
+    for name, page in PAGES.items():
+        times = [run_child(page)[0] for _ in range(args.repeats)]
+        _, stderr = run_child(page, importtime=True)
+        imports = page_imports(stderr)
+        results[name] = {
+            "first_render_s": round(statistics.median(times), 3),
+            "import_s": round(sum(seconds for _, seconds in imports), 3),
+            "imports": [{"module": module, "cumulative_s": round(seconds, 3)} for module, seconds in imports[:args.top]],
+        }
+
+    over_budget = []
+    for name, result in results.items():
+        status = "ok" if result["first_render_s"] <= args.budget else "OVER BUDGET"
+        if status != "ok":
+            over_budget.append(name)
+        print(f"\n{name}: first render {result['first_render_s']:.3f} s "
+              f"(imports {result['import_s']:.3f} s) - {status}")
+        for item in result["imports"]:
+            print(f"    {item['cumulative_s']:7.3f} s  {item['module']}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"budget_s": args.budget, "results": results}, f, ensure_ascii=False, indent=2)
+
+    if over_budget:
+        print(f"\nOver the budget of {args.budget} s: {', '.join(over_budget)}")
+        sys.exit(1)
+    print(f"\nEvery page renders within {args.budget} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""
+Classroom load generator: many student sessions doing the same thing at once.
+
+Every simulated student follows a scripted path through one page (open it,
+run the simulation, answer a couple of practice questions). The sessions are
+driven headless with Streamlit's AppTest and split between worker processes.
+Each worker keeps all of its sessions alive and plays them in lockstep: every
+student does step 1, then every student does step 2, and so on, which is what
+a lecture hall does when the lecturer says "now press the button".
+
+A worker runs its reruns one at a time, like the script threads of a single
+Streamlit server process sharing the GIL, so one worker with all the students
+models one server process. The report has:
+    - throughput: reruns per second over the whole run
+    - latency percentiles of a single rerun, per step
+    - burst time: how long until the slowest student finished a step
+    - RSS: peak resident memory of every worker, and the growth per session
+
+Examples (run from the lucky_night_app directory):
+    python benchmarks/load_classroom.py --sessions 150
+    python benchmarks/load_classroom.py --sessions 150 --workers 4 --path dice
+    python benchmarks/load_classroom.py --sessions 40 --sqlite /tmp/answers.db --json load.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import time
+
+import numpy as np
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PAGES = {
+    "home": "עמוד_הבית.py",
+    "target": "pages/1_קליעה_למטרה.py",
+    "dice": "pages/2_קוביות_מזל.py",
+    "coin": "pages/3_מטבע_הזהב.py",
+    "money": "pages/4_גשם_של_שטרות.py",
+}
+
+# A step is (name, action, argument):
+#   ("open", None, None)              first run of the page
+#   ("simulate", (input, button), n)  set the batch size input to n and click the button
+#   ("answer", question id, value)    submit value to the practice question
+PATHS = {
+    "home": [("open", None, None)],
+    "target": [
+        ("open", None, None),
+        ("simulate", ("מספר זריקות (1-1,000,000)", "זרקו חצים"), 1_000),
+        ("simulate", ("מספר זריקות (1-1,000,000)", "זרקו חצים"), 10_000),
+        ("answer", "q1", 15),
+        ("answer", "q2", 50),
+    ],
+    "dice": [
+        ("open", None, None),
+        ("simulate", ("מספר הטלות (1-1,000,000):", "הטלת קוביות"), 100),
+        ("simulate", ("מספר הטלות (1-1,000,000):", "הטלת קוביות"), 10_000),
+        ("answer", "q1_dice", 50),
+    ],
+    "coin": [
+        ("open", None, None),
+        ("simulate", ("מספר הטלות (1-1,000,000):", "הטלת המטבעות"), 100),
+        ("simulate", ("מספר הטלות (1-1,000,000):", "הטלת המטבעות"), 10_000),
+        ("answer", "q1_coin", 50),
+    ],
+    "money": [
+        ("open", None, None),
+        ("simulate", ("מספר משחקים (1-1,000,000):", "התחלת המשחק"), 100),
+        ("simulate", ("מספר משחקים (1-1,000,000):", "התחלת המשחק"), 10_000),
+        ("answer", "q1_money", 50),
+    ],
+}
+
+
+def step_label(index, step):
+    name, _, argument = step
+    return f"{index + 1}. {name}" + (f" {argument}" if argument is not None else "")
+
+
+def peak_rss_bytes():
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def play_step(at, step):
+    """Run one step of the path on the session, returning the time of the rerun."""
+    name, action, argument = step
+    if name == "open":
+        rerun = at.run
+    elif name == "simulate":
+        input_label, button_label = action
+        next(n for n in at.number_input if n.label == input_label).set_value(argument)
+        rerun = next(b for b in at.button if b.label == button_label).click().run
+    elif name == "answer":
+        at.number_input(key=f"{action}_input").set_value(argument)
+        rerun = next(b for b in at.button if b.proto.form_id == f"{action}_form").click().run
+    else:
+        raise ValueError(f"Unknown step: {name}")
+
+    start = time.perf_counter()
+    rerun()
+    elapsed = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(f"{name} {action}: {at.exception}")
+    return elapsed
+
+
+def run_worker(path_name, n_sessions):
+    """
+    Play the path on n_sessions sessions in lockstep inside this process.
+
+    Returns:
+        dict: Rerun latencies and burst time per step, and the RSS before and after the sessions
+    """
+    sys.path.insert(0, APP_DIR)
+    from streamlit.testing.v1 import AppTest
+
+    page = os.path.join(APP_DIR, PAGES[path_name])
+    path = PATHS[path_name]
+
+    # Warm up the imports and the caches with a throwaway session, so the
+    # RSS growth below is what the sessions themselves cost
+    warmup = AppTest.from_file(page, default_timeout=120)
+    for step in path:
+        play_step(warmup, step)
+    del warmup
+    rss_before = peak_rss_bytes()
+
+    sessions = [AppTest.from_file(page, default_timeout=120) for _ in range(n_sessions)]
+    latencies, bursts = [], []
+    for step in path:
+        start = time.perf_counter()
+        latencies.append([play_step(at, step) for at in sessions])
+        bursts.append(time.perf_counter() - start)
+
+    return {
+        "sessions": n_sessions,
+        "latencies": latencies,
+        "bursts": bursts,
+        "rss_before": rss_before,
+        "rss_peak": peak_rss_bytes(),
+    }
+
+
+def split(n_sessions, n_workers):
+    """Spread the sessions as evenly as possible between the workers."""
+    base, extra = divmod(n_sessions, n_workers)
+    return [base + (i < extra) for i in range(n_workers) if base + (i < extra) > 0]
+
+
+def summarize(path_name, workers, wall):
+    path = PATHS[path_name]
+    steps = []
+    for index, step in enumerate(path):
+        values = np.concatenate([worker["latencies"][index] for worker in workers]) * 1000
+        p50, p95, p99 = np.percentile(values, [50, 95, 99])
+        steps.append({
+            "step": step_label(index, step),
+            "p50_ms": round(float(p50), 1),
+            "p95_ms": round(float(p95), 1),
+            "p99_ms": round(float(p99), 1),
+            "max_ms": round(float(values.max()), 1),
+            # The workers run side by side, the slowest one decides
+            "burst_s": round(max(worker["bursts"][index] for worker in workers), 2),
+        })
+
+    n_reruns = sum(worker["sessions"] for worker in workers) * len(path)
+    return {
+        "path": path_name,
+        "sessions": sum(worker["sessions"] for worker in workers),
+        "workers": len(workers),
+        "reruns": n_reruns,
+        "wall_s": round(wall, 2),
+        "throughput_reruns_per_s": round(n_reruns / wall, 2),
+        "steps": steps,
+        "rss_mb": [{
+            "sessions": worker["sessions"],
+            "peak": round(worker["rss_peak"] / 2 ** 20, 1),
+            "per_session": round((worker["rss_peak"] - worker["rss_before"]) / worker["sessions"] / 2 ** 20, 2),
+        } for worker in workers],
+    }
+
+
+def print_report(report):
+    print(f"path {report['path']}: {report['sessions']} sessions on {report['workers']} worker(s), "
+          f"{report['reruns']} reruns in {report['wall_s']} s "
+          f"-> {report['throughput_reruns_per_s']} reruns/s\n")
+    print(f"{'step':<20} {'p50 [ms]':>9} {'p95 [ms]':>9} {'p99 [ms]':>9} {'max [ms]':>9} {'burst [s]':>10}")
+    for step in report["steps"]:
+        print(f"{step['step']:<20} {step['p50_ms']:9.1f} {step['p95_ms']:9.1f} {step['p99_ms']:9.1f} "
+              f"{step['max_ms']:9.1f} {step['burst_s']:10.2f}")
+    print(f"\n{'worker':<8} {'sessions':>9} {'peak RSS [MB]':>14} {'MB/session':>11}")
+    for index, rss in enumerate(report["rss_mb"]):
+        print(f"{index:<8} {rss['sessions']:>9} {rss['peak']:14.1f} {rss['per_session']:11.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=30, help="number of simulated students")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes (1 models a single server process)")
+    parser.add_argument("--path", choices=sorted(PATHS), default="target", help="scripted path every student follows")
+    parser.add_argument("--sqlite", help="keep the answers in this SQLite file instead of the session memory")
+    parser.add_argument("--json", help="also write the report to this JSON file")
+    args = parser.parse_args()
+
+    if args.sqlite:
+        # Read by utils.answer_store in the workers
+        os.environ["LUCKY_NIGHT_ANSWER_DB"] = os.path.abspath(args.sqlite)
+
+    shares = split(args.sessions, args.workers)
+    # spawn, so every worker starts from a clean interpreter like a fresh server
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(len(shares)) as pool:
+        workers = pool.starmap(run_worker, [(args.path, share) for share in shares])
+    # The wall time of the lockstep part, without the start-up and the warm-up
+    wall = max(sum(worker["bursts"]) for worker in workers)
+    report = summarize(args.path, workers, wall)
+
+    print_report(report)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
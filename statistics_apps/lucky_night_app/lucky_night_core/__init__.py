@@ -0,0 +1,65 @@
+"""
+Simulation and statistics core of the lucky night games, with no Streamlit in it.
+
+Every function is vectorized and takes an optional seed, so it can be imported,
+tested and benchmarked without running a page:
+
+    from lucky_night_core import simulate_throws
+    x, y, hits = simulate_throws(1_000_000, 0.4, 0.7, seed=0)
+
+The names below are the stable API. They are loaded on first access, so
+importing the package does not pull in matplotlib (target_board) or scipy
+(poisson) for a caller that does not use them.
+"""
+
+import importlib
+
+# Public name -> submodule that defines it
+_API = {
+    # Target shooting
+    "calculate_score": "darts",
+    "simulate_throws": "darts",
+    "calculate_radii_from_percentages": "target_board",
+    "draw_target": "target_board",
+    "render_target_board": "target_board",
+    "running_hit_counts": "convergence",
+    "wilson_interval": "convergence",
+    # Lucky dice
+    "LUCKY_SUMS": "dice",
+    "roll_dice": "dice",
+    "is_lucky_sum": "dice",
+    "dice_sum_pmf": "dice_distribution",
+    "RollHistory": "roll_history",
+    # Golden coin
+    "flip_coins": "coin_flips",
+    "run_lengths": "coin_flips",
+    "flips_until_heads": "coin_flips",
+    "negative_binomial_pmf": "coin_flips",
+    "FlipHistory": "coin_flips",
+    # Money rain
+    "simulate_money_drop": "poisson_process",
+    "simulate_poisson_rounds": "poisson_process",
+    "gap_histogram_edges": "poisson_process",
+    "poisson_pmf": "poisson",
+    "poisson_cdf": "poisson",
+    "poisson_pmf_table": "poisson",
+    "RunningStats": "running_stats",
+    # Random streams
+    "SessionRNG": "rng",
+    "SAMPLERS": "samplers",
+    "uniform_sampler": "samplers",
+}
+
+__all__ = list(_API)
+
+
+def __getattr__(name):
+    if name not in _API:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{_API[name]}"), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_API))
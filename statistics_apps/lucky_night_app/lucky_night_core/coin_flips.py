@@ -0,0 +1,114 @@
+"""
+Boolean-array coin flips and the run-length analytics of the golden coin page.
+
+A flip is True for heads ("עץ", the winning side) and False for tails ("פלי").
+"""
+
+import math
+
+import numpy as np
+
+
+def flip_coins(num_flips, p_heads=0.5, seed=None):
+    """
+    Flip the coin num_flips times in a single array draw.
+
+    Args:
+        num_flips (int): Number of flips
+        p_heads (float): Probability of heads
+        seed (int | Generator | None): Seed for reproducible flips, or a generator to draw them from
+
+    Returns:
+        numpy.ndarray: Boolean array, True for heads
+    """
+    rng = np.random.default_rng(seed)
+    return rng.random(num_flips) < p_heads
+
+
+def run_lengths(flips):
+    """
+    Run-length encode the flips.
+
+    Returns:
+        tuple: The value of each run (bool array) and its length
+    """
+    flips = np.asarray(flips, dtype=bool)
+    if len(flips) == 0:
+        return flips, np.zeros(0, dtype=np.int64)
+
+    run_starts = np.concatenate(([0], np.flatnonzero(flips[1:] != flips[:-1]) + 1))
+    lengths = np.diff(np.append(run_starts, len(flips)))
+    return flips[run_starts], lengths
+
+
+def flips_until_heads(flips, r=1):
+    """
+    Split the flips into the waits for every r-th heads.
+
+    With r=1 these are samples of the geometric distribution (flips until the
+    first heads), and with r>1 of the negative binomial distribution (flips
+    until the r-th heads). The unfinished wait at the end is left out.
+
+    Args:
+        flips (array): Boolean array of flips, True for heads
+        r (int): Number of heads that ends each wait
+
+    Returns:
+        numpy.ndarray: Number of flips of each completed wait
+    """
+    heads_positions = np.flatnonzero(flips)
+    wait_ends = heads_positions[r - 1::r]
+    return np.diff(wait_ends, prepend=-1)
+
+
+def negative_binomial_pmf(k, r, q):
+    """
+    Probability that the r-th heads arrives exactly on flip k (geometric for r=1).
+
+    Args:
+        k (array): Number of flips
+        r (int): Number of heads
+        q (float): Probability of heads
+
+    Returns:
+        numpy.ndarray: The probability of each k
+    """
+    k = np.asarray(k, dtype=np.int64)
+    ways = np.array([math.comb(int(n) - 1, r - 1) if n >= r else 0 for n in k.ravel()], dtype=float)
+    return ways.reshape(k.shape) * q ** r * (1 - q) ** np.maximum(k - r, 0)
+
+
+class FlipHistory:
+    """
+    History of coin flips stored as a boolean array that grows by amortized doubling,
+    with a running count of heads.
+    """
+
+    def __init__(self, capacity=64):
+        self._flips = np.empty(capacity, dtype=bool)
+        self._size = 0
+        self.heads_count = 0
+
+    def __len__(self):
+        return self._size
+
+    def extend(self, flips):
+        """Add a batch of flips to the history in one operation."""
+        flips = np.asarray(flips, dtype=bool)
+        end = self._size + len(flips)
+
+        if end > len(self._flips):
+            capacity = max(len(self._flips), 1)  # Doubling an empty buffer would never grow it
+            while capacity < end:
+                capacity *= 2
+            grown = np.empty(capacity, dtype=bool)
+            grown[:self._size] = self._flips[:self._size]
+            self._flips = grown
+
+        self._flips[self._size:end] = flips
+        self._size = end
+        self.heads_count += int(np.count_nonzero(flips))
+
+    @property
+    def flips(self):
+        return self._flips[:self._size]
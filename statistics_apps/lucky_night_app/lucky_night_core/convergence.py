@@ -0,0 +1,87 @@
+"""
+Running Monte Carlo estimates of the hit probabilities of the target board.
+
+The darts are thrown in chunks, and only the cumulative number of hits per
+area is kept at the end of each chunk. The chunks end at log-spaced
+checkpoints, so 10^6 throws give ~100 points of the running estimate, and the
+early, noisy part of the curve is as visible as the converged tail.
+"""
+
+import numpy as np
+
+from lucky_night_core.samplers import uniform_sampler
+
+# Largest number of darts drawn at once, to bound the memory of a chunk
+BLOCK_SIZE = 2 ** 20
+
+# z of a two-sided 95% confidence interval
+Z_95 = 1.959963984540054
+
+
+def checkpoints(n_throws, n_points=100):
+    """Log-spaced throw counts from 1 to n_throws (at most n_points, fewer for small n_throws)."""
+    return np.unique(np.geomspace(1, n_throws, n_points).round().astype(np.int64))
+
+
+def running_hit_counts(n_throws, radius_a, radius_b, n_points=100, seed=None, sampler="pseudo"):
+    """
+    Throw n_throws darts uniformly over the unit-radius board, chunk by chunk.
+
+    A dart at distance r = sqrt(U) of the center, U ~ U(0, 1), is uniform over
+    the disk, so comparing U with the squared radii classifies it without
+    drawing its angle. With another sampler, U is the radius coordinate of its
+    points (the second one, as in simulate_throws), and the sequence continues
+    from chunk to chunk.
+
+    Args:
+        n_throws (int): Number of darts to throw
+        radius_a (float): Outer radius of area A
+        radius_b (float): Outer radius of area B
+        n_points (int): Number of checkpoints
+        seed (int | Generator | None): Seed for reproducible throws, or a generator to draw them from
+        sampler (str): Sampler backend, one of lucky_night_core.samplers.SAMPLERS
+
+    Returns:
+        tuple: Throw counts at the checkpoints, and a dict of the cumulative hits per area at them
+    """
+    rng = np.random.default_rng(seed)
+    points = None if sampler == "pseudo" else uniform_sampler(sampler, 2, rng)
+
+    def draw(n):
+        if points is None:
+            return rng.random(n, dtype=np.float32)
+        return points(n)[:, 1].astype(np.float32)
+
+    ends = checkpoints(n_throws, n_points)
+    limit_a, limit_b = np.float32(radius_a ** 2), np.float32(radius_b ** 2)
+
+    in_a = np.empty(len(ends), dtype=np.int64)
+    in_a_or_b = np.empty(len(ends), dtype=np.int64)
+    count_a = count_a_or_b = thrown = 0
+    for i, end in enumerate(ends):
+        while thrown < end:
+            u = draw(min(end - thrown, BLOCK_SIZE))
+            count_a += int(np.count_nonzero(u <= limit_a))
+            count_a_or_b += int(np.count_nonzero(u <= limit_b))
+            thrown += len(u)
+        in_a[i], in_a_or_b[i] = count_a, count_a_or_b
+
+    return ends, {'A': in_a, 'B': in_a_or_b - in_a, 'C': ends - in_a_or_b}
+
+
+def wilson_interval(hits, n, z=Z_95):
+    """
+    Wilson score interval of a proportion, elementwise.
+
+    Unlike the normal approximation p ± z·sqrt(p(1-p)/n), it neither collapses
+    to a point when p is 0 or 1 nor leaves [0, 1], so it holds from the first throw.
+
+    Returns:
+        tuple: Lower and upper bounds
+    """
+    n = np.asarray(n, dtype=float)
+    p = np.asarray(hits, dtype=float) / n
+    denominator = 1 + z ** 2 / n
+    center = (p + z ** 2 / (2 * n)) / denominator
+    half_width = z * np.sqrt(p * (1 - p) / n + z ** 2 / (4 * n ** 2)) / denominator
+    return center - half_width, center + half_width
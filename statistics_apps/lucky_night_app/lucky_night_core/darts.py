@@ -0,0 +1,53 @@
+"""
+Dart throws at the target board of the target-shooting page.
+"""
+
+import numpy as np
+
+from lucky_night_core.samplers import uniform_sampler
+
+
+def calculate_score(area_percent):
+    return max(1, int(10 - (area_percent / 10)))
+
+
+def simulate_throws(n_throws, radius_a, radius_b, seed=None, sampler="pseudo"):
+    """
+    Throw all the darts at once, uniformly over the unit-radius board.
+
+    Angles and radii are drawn as whole arrays (float32, which keeps 10^7 throws
+    well under a second) and every dart is classified with array comparisons.
+    The other samplers of lucky_night_core.samplers give the (angle, radius) pairs
+    as points of the unit square instead.
+
+    Args:
+        n_throws (int): Number of darts to throw
+        radius_a (float): Outer radius of area A
+        radius_b (float): Outer radius of area B
+        seed (int | Generator | None): Seed for reproducible throws, or a generator to draw them from
+        sampler (str): Sampler backend, one of lucky_night_core.samplers.SAMPLERS
+
+    Returns:
+        tuple: x coordinates, y coordinates and a dict of hit counts per area
+    """
+    rng = np.random.default_rng(seed)
+
+    if sampler == "pseudo":
+        angle = rng.random(n_throws, dtype=np.float32)
+        r = rng.random(n_throws, dtype=np.float32)
+    else:
+        points = uniform_sampler(sampler, 2, rng)(n_throws)
+        angle, r = np.ascontiguousarray(points.T, dtype=np.float32)
+    angle *= np.float32(2 * np.pi)
+    np.sqrt(r, out=r)  # sqrt keeps the density uniform over the disk area
+
+    x = np.cos(angle)
+    x *= r
+    y = np.sin(angle, out=angle)
+    y *= r
+
+    in_a = int(np.count_nonzero(r <= radius_a))
+    in_a_or_b = int(np.count_nonzero(r <= radius_b))
+    hits = {'A': in_a, 'B': in_a_or_b - in_a, 'C': n_throws - in_a_or_b}
+
+    return x, y, hits
@@ -0,0 +1,28 @@
+"""
+Rolls of the two dice of the lucky dice page.
+"""
+
+import numpy as np
+
+# Sums that win a roll
+LUCKY_SUMS = (6, 9)
+
+
+def roll_dice(num_rolls, seed=None):
+    """
+    Roll both dice num_rolls times in a single array draw.
+
+    Args:
+        num_rolls (int): Number of rolls
+        seed (int | Generator | None): Seed for reproducible rolls, or a generator to draw them from
+
+    Returns:
+        tuple: uint8 arrays with the results of the first and the second die
+    """
+    rng = np.random.default_rng(seed)
+    dice1, dice2 = rng.integers(1, 7, size=(2, num_rolls), dtype=np.uint8)
+    return dice1, dice2
+
+
+def is_lucky_sum(sum_dice):
+    return np.isin(sum_dice, LUCKY_SUMS)
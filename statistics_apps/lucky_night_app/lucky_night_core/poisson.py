@@ -0,0 +1,58 @@
+"""
+Numerically stable Poisson distribution functions (array in, array out).
+"""
+
+import functools
+
+import numpy as np
+
+
+def poisson_pmf(k, lam):
+    """
+    Calculate the Poisson probability mass function in log space.
+
+    Computing exp(k*log(lam) - lam - log(k!)) never forms lam**k or k! directly,
+    so it neither overflows nor loses precision for large k or lam.
+
+    Args:
+        k (int | array): The number of occurrences
+        lam (float): The rate parameter (lambda)
+
+    Returns:
+        float | numpy.ndarray: The probability of exactly k occurrences
+    """
+    from scipy.special import gammaln, xlogy  # Heavy import, not needed before the first game
+
+    k = np.asarray(k, dtype=float)
+    log_pmf = xlogy(k, lam) - lam - gammaln(k + 1)  # xlogy(0, 0) == 0, so lam=0 works too
+    valid = (k >= 0) & (k == np.floor(k))
+    return np.where(valid, np.exp(log_pmf), 0.0)[()]
+
+
+def poisson_cdf(k, lam):
+    """
+    Calculate the Poisson cumulative distribution function P(X <= k).
+
+    Args:
+        k (int | array): The number of occurrences
+        lam (float): The rate parameter (lambda)
+
+    Returns:
+        float | numpy.ndarray: The probability of at most k occurrences
+    """
+    from scipy.special import pdtr
+
+    k = np.floor(np.asarray(k, dtype=float))
+    return np.where(k >= 0, pdtr(np.maximum(k, 0), lam), 0.0)[()]
+
+
+@functools.lru_cache(maxsize=128)
+def poisson_pmf_table(lam, kmax):
+    """
+    Return the Poisson PMF of k = 0..kmax, cached by (lam, kmax).
+
+    The returned array is shared between callers and therefore read-only.
+    """
+    table = poisson_pmf(np.arange(kmax + 1), lam)
+    table.setflags(write=False)
+    return table
@@ -0,0 +1,107 @@
+"""
+Event-level simulation of a Poisson process, built from exponential inter-arrival times.
+"""
+
+import math
+
+import numpy as np
+
+# Upper bound on the number of simulated gaps held in memory at once
+CHUNK_ELEMENTS = 2 ** 20
+
+
+def gap_histogram_edges(rate, bins=30):
+    """
+    Bin edges for the histogram of the gaps between arrivals.
+
+    The edges cover [0, 6/rate], which holds all but e^-6 (~0.25%) of the gaps.
+    """
+    return np.linspace(0, 6 / rate, bins + 1)
+
+
+def _simulate_rounds(durations, rate, n_columns, rng):
+    """
+    Simulate one round of the process for every entry of durations.
+
+    Each round draws n_columns exponential gaps at once and turns them into
+    arrival times with a cumulative sum. The rare rounds whose n_columns
+    arrivals all fall inside the window are continued from their last arrival,
+    which is exact thanks to the memoryless property.
+
+    Returns:
+        tuple: Number of arrivals in each round and the gaps that started inside the window
+    """
+    gaps = rng.exponential(1 / rate, size=(len(durations), n_columns))
+    arrival_times = np.cumsum(gaps, axis=1)
+    window = durations[:, None]
+
+    counts = np.count_nonzero(arrival_times <= window, axis=1)
+    # The gaps until each arrival in the window plus the one that crosses its end
+    gap_samples = gaps[arrival_times - gaps <= window]
+
+    overflow = counts == n_columns
+    if overflow.any():
+        remaining = durations[overflow] - arrival_times[overflow, -1]
+        extra_counts, extra_gaps = _simulate_rounds(remaining, rate, n_columns, rng)
+        counts[overflow] += extra_counts
+        gap_samples = np.concatenate([gap_samples, extra_gaps])
+
+    return counts, gap_samples
+
+
+def simulate_poisson_rounds(num_rounds, rate, gap_edges, duration=1.0, seed=None):
+    """
+    Simulate the arrivals of many rounds of a Poisson process.
+
+    Rounds are processed in chunks so that at most about CHUNK_ELEMENTS gaps are
+    held in memory, whatever the number of rounds. Pooling the gaps of every
+    round up to and including the one that crosses the end of the window gives
+    an unbiased sample of the exponential distribution (Wald's identity).
+
+    Args:
+        num_rounds (int): Number of rounds
+        rate (float): Average number of arrivals per time unit (lambda)
+        gap_edges (array): Bin edges for the histogram of the gaps
+        duration (float): Length of each round in time units
+        seed (int | Generator | None): Seed for reproducible rounds, or a generator to draw them from
+
+    Returns:
+        tuple: Number of arrivals in each round, histogram counts of the gaps
+               and the total number of gaps (including those outside gap_edges)
+    """
+    rng = np.random.default_rng(seed)
+
+    # Enough columns for almost every round to finish in a single draw
+    expected = rate * duration
+    n_columns = max(1, math.ceil(expected + 6 * math.sqrt(expected) + 6))
+    chunk_rounds = max(1, CHUNK_ELEMENTS // n_columns)
+
+    counts = np.empty(num_rounds, dtype=np.int64)
+    gap_counts = np.zeros(len(gap_edges) - 1, dtype=np.int64)
+    total_gaps = 0
+
+    for start in range(0, num_rounds, chunk_rounds):
+        stop = min(start + chunk_rounds, num_rounds)
+        durations = np.full(stop - start, float(duration))
+        counts[start:stop], gap_samples = _simulate_rounds(durations, rate, n_columns, rng)
+
+        gap_counts += np.histogram(gap_samples, bins=gap_edges)[0]
+        total_gaps += len(gap_samples)
+
+    return counts, gap_counts, total_gaps
+
+
+def simulate_money_drop(rate=5, num_rounds=1, seed=None):
+    """
+    Simulate the money rain game: one-minute rounds of bills dropping at rate per minute.
+
+    Args:
+        rate (float): Average number of bills dropped per minute (lambda)
+        num_rounds (int): Number of one-minute rounds to simulate
+        seed (int | Generator | None): Seed for reproducible rounds, or a generator to draw them from
+
+    Returns:
+        tuple: Number of bills dropped in each round, histogram counts of the gaps
+               between bills (over gap_histogram_edges(rate)) and the total number of gaps.
+    """
+    return simulate_poisson_rounds(num_rounds, rate, gap_histogram_edges(rate), seed=seed)
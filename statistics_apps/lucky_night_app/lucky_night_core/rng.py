@@ -0,0 +1,50 @@
+"""
+Reproducible random streams: one seed per session, one independent stream per game.
+
+A session seed feeds a SeedSequence, which spawns a child sequence for every
+game. Each child drives its own PCG64DXSM generator, so the games never share
+state, and a game's results depend only on the session seed and on what was
+played in that game. Playing the same games again from the same seed gives
+the same results.
+"""
+
+import secrets
+
+import numpy as np
+
+# The games with a stream of their own, in spawn order (append only, or old seeds replay differently)
+GAMES = ("target", "dice", "coin", "money")
+
+# Session seeds are kept short enough to be read out or typed in by hand
+MAX_SEED = 10 ** 8
+
+
+def new_seed():
+    """A fresh random session seed."""
+    return secrets.randbelow(MAX_SEED)
+
+
+class SessionRNG:
+    """
+    Random generators of a single session.
+
+    Args:
+        seed (int | None): Session seed; a fresh one is drawn when None
+    """
+
+    def __init__(self, seed=None):
+        self.seed = new_seed() if seed is None else int(seed)
+        children = np.random.SeedSequence(self.seed).spawn(len(GAMES))
+        self._generators = {
+            game: np.random.Generator(np.random.PCG64DXSM(child))
+            for game, child in zip(GAMES, children)
+        }
+
+    def generator(self, game):
+        """
+        The generator of a game, to pass as the seed of the lucky_night_core simulations.
+
+        Returns:
+            numpy.random.Generator: The same generator on every call, so the stream continues
+        """
+        return self._generators[game]
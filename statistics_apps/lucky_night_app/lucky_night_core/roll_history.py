@@ -0,0 +1,100 @@
+"""
+Compact, array-backed history of the dice game rolls.
+"""
+
+import numpy as np
+
+# Largest possible sum of two dice, used to size the running histogram
+MAX_SUM = 12
+
+
+class RollHistory:
+    """
+    History of dice rolls stored as typed columns (die1 and die2 as uint8, lucky as bool).
+
+    The columns grow by amortized doubling, and the histogram of the sums and
+    the number of lucky rolls are kept as running counts, so reading them costs
+    O(1) no matter how long the session is.
+    """
+
+    def __init__(self, capacity=64):
+        self._die1 = np.empty(capacity, dtype=np.uint8)
+        self._die2 = np.empty(capacity, dtype=np.uint8)
+        self._lucky = np.empty(capacity, dtype=bool)
+        self._size = 0
+        self.sum_counts = np.zeros(MAX_SUM + 1, dtype=np.int64)  # Indexed by the sum itself
+        self.lucky_count = 0
+
+    def __len__(self):
+        return self._size
+
+    def _reserve(self, extra):
+        """Make room for extra more rolls, doubling the capacity as needed."""
+        needed = self._size + extra
+        capacity = len(self._die1)
+        if needed <= capacity:
+            return
+
+        capacity = max(capacity, 1)  # Doubling an empty buffer would never grow it
+        while capacity < needed:
+            capacity *= 2
+        for name in ('_die1', '_die2', '_lucky'):
+            column = getattr(self, name)
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            setattr(self, name, grown)
+
+    def append(self, die1, die2, lucky):
+        """Add a single roll to the history."""
+        self.extend([die1], [die2], [lucky])
+
+    def extend(self, die1, die2, lucky):
+        """
+        Add a batch of rolls to the history in one operation.
+
+        Args:
+            die1 (array): Results of the first die
+            die2 (array): Results of the second die
+            lucky (array): Whether each roll has a lucky sum
+        """
+        die1 = np.asarray(die1, dtype=np.uint8)
+        die2 = np.asarray(die2, dtype=np.uint8)
+        lucky = np.asarray(lucky, dtype=bool)
+        n_rolls = len(die1)
+
+        self._reserve(n_rolls)
+        end = self._size + n_rolls
+        self._die1[self._size:end] = die1
+        self._die2[self._size:end] = die2
+        self._lucky[self._size:end] = lucky
+        self._size = end
+
+        sums = die1.astype(np.intp) + die2
+        self.sum_counts += np.bincount(sums, minlength=MAX_SUM + 1)
+        self.lucky_count += int(np.count_nonzero(lucky))
+
+    @property
+    def die1(self):
+        return self._die1[:self._size]
+
+    @property
+    def die2(self):
+        return self._die2[:self._size]
+
+    @property
+    def lucky(self):
+        return self._lucky[:self._size]
+
+    def tail(self, n):
+        """
+        Return the last n rolls, newest first.
+
+        Returns:
+            tuple: Roll numbers, die1, die2 and lucky flags of the last n rolls
+        """
+        start = max(0, self._size - n)
+        roll_numbers = np.arange(self._size, start, -1)
+        return (roll_numbers,
+                self._die1[start:self._size][::-1],
+                self._die2[start:self._size][::-1],
+                self._lucky[start:self._size][::-1])
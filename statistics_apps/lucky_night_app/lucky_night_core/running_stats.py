@@ -0,0 +1,66 @@
+"""
+Incrementally updated statistics of non-negative integer observations.
+"""
+
+import numpy as np
+
+
+class RunningStats:
+    """
+    Running mean, variance, maximum and histogram of non-negative integer observations.
+
+    Every update merges a whole batch with the Welford/Chan parallel update, so
+    it costs O(batch) and never revisits earlier observations.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0  # Sum of squared deviations from the mean
+        self.max = 0
+        self.counts = np.zeros(0, dtype=np.int64)  # counts[v] = number of observations equal to v
+
+    def update(self, values):
+        """
+        Add a batch of observations.
+
+        Args:
+            values (array): Non-negative integer observations
+        """
+        values = np.asarray(values, dtype=np.int64).ravel()
+        n_values = len(values)
+        if n_values == 0:
+            return
+
+        batch_mean = values.mean()
+        batch_m2 = np.square(values - batch_mean).sum()
+
+        total = self.count + n_values
+        delta = batch_mean - self.mean
+        self.mean += delta * n_values / total
+        self._m2 += batch_m2 + delta ** 2 * self.count * n_values / total
+        self.count = total
+
+        self.max = max(self.max, int(values.max()))
+
+        batch_counts = np.bincount(values)
+        if len(batch_counts) > len(self.counts):
+            self.counts = np.pad(self.counts, (0, len(batch_counts) - len(self.counts)))
+        self.counts[:len(batch_counts)] += batch_counts
+
+    @property
+    def variance(self):
+        """Sample variance (ddof=1), 0 while there are fewer than 2 observations."""
+        if self.count < 2:
+            return 0.0
+        return self._m2 / (self.count - 1)
+
+    def distribution(self):
+        """
+        Return the observed values and how many times each was observed.
+
+        Returns:
+            tuple: Arrays of the observed values (sorted) and their counts
+        """
+        values = np.flatnonzero(self.counts)
+        return values, self.counts[values]
@@ -0,0 +1,61 @@
+"""
+Sampler backends for the points of a Monte Carlo simulation.
+
+Every backend gives points in the unit square [0, 1)^d, which the games map
+onto their own space (the target board maps (u, v) to the angle 2*pi*u and the
+radius sqrt(v), an area-preserving map onto the disk):
+
+    pseudo      independent pseudo-random points, error ~ 1/sqrt(n)
+    stratified  Latin hypercube: every axis cut into n equal strata, one point in each
+    sobol       scrambled Sobol low-discrepancy sequence, error close to ~ 1/n
+    halton      scrambled Halton low-discrepancy sequence, error close to ~ 1/n
+
+All of them are randomized, so the estimates stay unbiased and a seed
+reproduces them.
+"""
+
+import warnings
+
+import numpy as np
+
+SAMPLERS = ("pseudo", "stratified", "sobol", "halton")
+
+
+def latin_hypercube(n, d, rng):
+    """n points in [0, 1)^d with exactly one point in each of the n strata of every axis."""
+    strata = rng.permuted(np.broadcast_to(np.arange(n), (d, n)), axis=1)  # Shuffled independently per axis
+    return ((strata + rng.random((d, n))) / n).T
+
+
+def uniform_sampler(sampler, d=2, seed=None):
+    """
+    Point source of a sampler backend.
+
+    Args:
+        sampler (str): One of SAMPLERS
+        d (int): Dimension of the points
+        seed (int | Generator | None): Seed for reproducible points, or a generator to draw them from
+
+    Returns:
+        callable: draw(n) -> (n, d) array of points in [0, 1)^d. Successive draws
+                  continue the sequence (a Latin hypercube is stratified per draw).
+    """
+    rng = np.random.default_rng(seed)
+    if sampler == "pseudo":
+        return lambda n: rng.random((n, d))
+    if sampler == "stratified":
+        return lambda n: latin_hypercube(n, d, rng)
+    if sampler not in SAMPLERS:
+        raise ValueError(f"Unknown sampler {sampler!r}, expected one of {SAMPLERS}")
+
+    from scipy.stats import qmc  # Heavy import, only needed for the low-discrepancy samplers
+
+    engine = qmc.Sobol(d, rng=rng) if sampler == "sobol" else qmc.Halton(d, rng=rng)
+
+    def draw(n):
+        with warnings.catch_warnings():
+            # Sobol is best balanced at powers of 2, but any prefix of it is still a valid sample
+            warnings.filterwarnings("ignore", message=".*balance properties.*")
+            return engine.random(n)
+
+    return draw
@@ -0,0 +1,121 @@
+"""
+Drawing helpers for the target board of the target-shooting page.
+"""
+
+import functools
+import io
+import math
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.colors import LinearSegmentedColormap
+from matplotlib.patches import Circle
+
+# Above this many throws the darts are drawn as a density image instead of points
+DENSITY_THRESHOLD = 20000
+
+# Resolution (per axis) of the density image
+DENSITY_BINS = 200
+
+# Number of distinct static boards kept in memory by render_target_board
+BOARD_CACHE_SIZE = 16
+
+# Black with an alpha ramp, so the board colors show through sparse areas
+_DENSITY_CMAP = LinearSegmentedColormap.from_list('dart_density', [(0, 0, 0, 0), (0, 0, 0, 1)])
+
+
+def calculate_radii_from_percentages(percent_a, percent_b):
+    radius_a = math.sqrt(percent_a / 100)
+    radius_b = math.sqrt((percent_a + percent_b) / 100)
+    return radius_a, radius_b
+
+
+def draw_throws(ax, x, y, density_threshold=DENSITY_THRESHOLD):
+    """
+    Draw all the throws on the axes as a single artist.
+
+    Up to density_threshold throws are drawn as one scatter collection; above it
+    the throws are binned into a 2D histogram and drawn as one image, so the
+    render time stays flat no matter how many darts were thrown.
+
+    Args:
+        ax (Axes): The axes of the target board
+        x (array): x coordinates of the throws
+        y (array): y coordinates of the throws
+        density_threshold (int): Maximal number of throws drawn as points
+    """
+    if len(x) <= density_threshold:
+        ax.scatter(x, y, s=4, c='k', marker='.', linewidths=0)
+        return
+
+    # Bin on the [-1, 1] square with a single bincount (much cheaper than np.histogram2d)
+    col = np.clip(((np.asarray(x) + 1) * (DENSITY_BINS / 2)).astype(np.intp), 0, DENSITY_BINS - 1)
+    row = np.clip(((np.asarray(y) + 1) * (DENSITY_BINS / 2)).astype(np.intp), 0, DENSITY_BINS - 1)
+    counts = np.bincount(row * DENSITY_BINS + col, minlength=DENSITY_BINS ** 2).reshape(DENSITY_BINS, DENSITY_BINS)
+
+    ax.imshow(counts, origin='lower', extent=(-1, 1, -1, 1),
+              cmap=_DENSITY_CMAP, vmin=0, vmax=counts.max(), interpolation='nearest')
+
+
+def draw_target(radius_a, radius_b, radius_c=1, throws=None, figsize=(2, 2), show_square=False,
+                density_threshold=DENSITY_THRESHOLD):
+    fig, ax = plt.subplots(figsize=figsize)
+
+    circle_c = Circle((0, 0), radius_c, color='lightgray', alpha=0.8)
+    circle_b = Circle((0, 0), radius_b, color='lightblue', alpha=0.8)
+    circle_a = Circle((0, 0), radius_a, color='pink', alpha=0.8)
+
+    ax.add_patch(circle_c)
+    ax.add_patch(circle_b)
+    ax.add_patch(circle_a)
+
+    ax.text(0, 0, 'A', horizontalalignment='center', verticalalignment='center')
+    ax.text(radius_a + (radius_b - radius_a) / 2, 0, 'B', horizontalalignment='center')
+    ax.text(radius_b + (radius_c - radius_b) / 2, 0, 'C', horizontalalignment='center')
+
+    if show_square:
+        side = radius_c * np.sqrt(2)
+        half_side = side / 2
+        square = plt.Rectangle((-half_side, -half_side), side, side,
+                             fill=False, color='red', linestyle='--')
+        ax.add_patch(square)
+
+    if throws is not None:
+        x, y = throws
+        draw_throws(ax, x, y, density_threshold=density_threshold)
+
+    ax.set_xlim(-1.2, 1.2)
+    ax.set_ylim(-1.2, 1.2)
+    ax.axis('equal')
+    ax.grid(False)
+    ax.axis('off')
+
+    fig.patch.set_facecolor('none')  # Make the background transparent
+    fig.patch.set_edgecolor('none')  # Remove the edge color
+
+    return fig
+
+
+@functools.lru_cache(maxsize=BOARD_CACHE_SIZE)
+def render_target_board(radius_a, radius_b, radius_c=1, show_square=False, image_format='png'):
+    """
+    Render a board without throws once per process and return the image bytes.
+
+    The figure is closed right after it is saved, so repeated reruns neither
+    rebuild it nor leave figures behind in pyplot's registry.
+
+    Args:
+        radius_a (float): Outer radius of area A
+        radius_b (float): Outer radius of area B
+        radius_c (float): Outer radius of area C
+        show_square (bool): Whether to draw the square inscribed in the board
+        image_format (str): 'png' or 'svg'
+
+    Returns:
+        bytes: The rendered board
+    """
+    fig = draw_target(radius_a, radius_b, radius_c=radius_c, show_square=show_square)
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format=image_format, dpi=200, bbox_inches='tight', transparent=True)
+    plt.close(fig)
+    return buffer.getvalue()
@@ -1,89 +1,72 @@
 import streamlit as st
+import plotly.graph_objects as go
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.patches import Circle
-import math
-import os
+from utils.assets import show_logo
 from utils.helper_functions import setup_page
+from utils.profiling import PageProfiler
+from utils.questions import Question, render_questions
+from utils.session_rng import game_rng, show_seed_panel
+from lucky_night_core.convergence import running_hit_counts, wilson_interval
+from lucky_night_core.darts import calculate_score, simulate_throws
+from lucky_night_core.target_board import calculate_radii_from_percentages, draw_target, render_target_board
 
 # --- Helper Functions ---
-def calculate_radii_from_percentages(percent_a, percent_b):
-    radius_a = math.sqrt(percent_a / 100)
-    radius_b = math.sqrt((percent_a + percent_b) / 100)
-    return radius_a, radius_b
-
-def calculate_score(area_percent):
-    return max(1, int(10 - (area_percent / 10)))
-
-def draw_target(radius_a, radius_b, radius_c=1, throws=None, figsize=(2, 2), show_square=False):
-    fig, ax = plt.subplots(figsize=figsize)
-
-    circle_c = Circle((0, 0), radius_c, color='lightgray', alpha=0.8)
-    circle_b = Circle((0, 0), radius_b, color='lightblue', alpha=0.8)
-    circle_a = Circle((0, 0), radius_a, color='pink', alpha=0.8)
-
-    ax.add_patch(circle_c)
-    ax.add_patch(circle_b)
-    ax.add_patch(circle_a)
-
-    plt.text(0, 0, 'A', horizontalalignment='center', verticalalignment='center')
-    plt.text(radius_a + (radius_b - radius_a) / 2, 0, 'B', horizontalalignment='center')
-    plt.text(radius_b + (radius_c - radius_b) / 2, 0, 'C', horizontalalignment='center')
-
-    if show_square:
-        side = radius_c * np.sqrt(2)
-        half_side = side / 2
-        square = plt.Rectangle((-half_side, -half_side), side, side,
-                             fill=False, color='red', linestyle='--')
-        ax.add_patch(square)
-
-    if throws is not None:
-        for x, y in throws:
-            ax.plot(x, y, 'k.', markersize=2)
-
-    ax.set_xlim(-1.2, 1.2)
-    ax.set_ylim(-1.2, 1.2)
-    ax.axis('equal')
-    ax.grid(False)
-    ax.axis('off')
+AREA_COLORS = {'A': 'palevioletred', 'B': 'steelblue', 'C': 'gray'}
+
+# Label -> sampler backend of lucky_night_core.samplers
+SAMPLER_LABELS = {
+    "פסאודו-אקראית": "pseudo",
+    "מרובדת (Latin hypercube)": "stratified",
+    "סדרת Sobol": "sobol",
+    "סדרת Halton": "halton",
+}
 
-    fig.patch.set_facecolor('none')  # Make the background transparent
-    fig.patch.set_edgecolor('none')  # Remove the edge color
 
+def convergence_chart(throws, hits, area_percents):
+    """
+    Running estimate of the probability of every area, with its 95% confidence band,
+    against the area ratio.
+
+    Args:
+        throws (array): Throw counts at the checkpoints
+        hits (dict): Cumulative hits of every area at the checkpoints
+        area_percents (dict): Percentage of the board taken by every area
+    """
+    fig = go.Figure()
+    for area, color in AREA_COLORS.items():
+        low, high = wilson_interval(hits[area], throws)
+        fig.add_trace(go.Scatter(
+            x=np.concatenate([throws, throws[::-1]]),
+            y=np.concatenate([high, low[::-1]]),
+            fill='toself', fillcolor=color, opacity=0.2, line=dict(width=0),
+            hoverinfo='skip', showlegend=False,
+        ))
+        fig.add_trace(go.Scatter(
+            x=throws, y=hits[area] / throws, mode='lines', name=f"אזור {area}", line=dict(color=color, width=2),
+        ))
+        fig.add_trace(go.Scatter(
+            x=[throws[0], throws[-1]], y=[area_percents[area] / 100] * 2, mode='lines',
+            name=f"יחס השטחים {area}", line=dict(color=color, width=1, dash='dash'),
+        ))
+
+    fig.update_layout(
+        xaxis=dict(title="מספר זריקות", type='log'),
+        yaxis=dict(title="הסתברות", range=[0, 1]),
+        height=450,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+    )
     return fig
 
 
-def simulate_throws(n_throws, radius_a, radius_b):
-    throws = []
-    hits = {'A': 0, 'B': 0, 'C': 0}
-
-    for _ in range(n_throws):
-        angle = np.random.uniform(0, 2 * np.pi)
-        r = np.sqrt(np.random.uniform(0, 1))
-        x = r * np.cos(angle)
-        y = r * np.sin(angle)
-        throws.append((x, y))
-
-        distance = np.sqrt(x ** 2 + y ** 2)
-        if distance <= radius_a:
-            hits['A'] += 1
-        elif distance <= radius_b:
-            hits['B'] += 1
-        else:
-            hits['C'] += 1
-
-    return throws, hits
-
-
 # --- Page Content ---
+profiler = PageProfiler("target")
 st.set_page_config(layout="wide")
 setup_page()
+profiler.lap("setup_page")
 
 # -- Sidebar --
-current_dir = os.path.dirname(os.path.abspath(__file__))
-
-logo_path = os.path.join(current_dir, 'bgu_logo.png')
-st.sidebar.image(logo_path)
+show_logo()
 st.sidebar.markdown("""
 
         <div style="text-align: center;">
@@ -91,9 +74,12 @@ st.sidebar.markdown("""
             <h4>362.1.3071</h4>
         </div>
     """, unsafe_allow_html=True)
+show_seed_panel()
 
 st.markdown('<div class="top-header"><h1>קליעה למטרה 🎯</h1></div>', unsafe_allow_html=True)
 
+profiler.lap("sidebar")
+
 # --- game explanation ---
 st.markdown('<div class="section-header"><h2>🎮 המשחק</h2></div>', unsafe_allow_html=True)
 
@@ -123,8 +109,9 @@ with col1:
 
 with col2:
     radius_a, radius_b = calculate_radii_from_percentages(15, 40)
-    fig = draw_target(radius_a, radius_b)
-    st.pyplot(fig)
+    st.image(render_target_board(radius_a, radius_b), width="stretch")
+
+profiler.lap("game explanation")
 
 
 # --- game-zone ---
@@ -142,16 +129,38 @@ with col1:
     if total_percent != 100:
         st.error("סך כל האחוזים חייב להיות 100!")
 
-    n_throws = st.number_input("מספר זריקות (1-1500)", 1, 1500, 1)
+    n_throws = st.number_input("מספר זריקות (1-1,000,000)", 1, 1_000_000, 1)
+    streaming = st.toggle("מצב התכנסות: הצגת ההערכה הרצה של ההסתברויות במקום הלוח")
+    sampler = SAMPLER_LABELS[st.selectbox(
+        "שיטת הדגימה:", list(SAMPLER_LABELS),
+        help="סדרות Sobol ו-Halton מפזרות את החצים על הלוח באופן אחיד יותר מדגימה אקראית, "
+             "ולכן ההערכה מתקרבת ליחס השטחים עם הרבה פחות זריקות.",
+    )]
     if total_percent == 100:
         if st.button("זרקו חצים"):
             radius_a, radius_b = calculate_radii_from_percentages(percent_a, percent_b)
-            throws, hits = simulate_throws(n_throws, radius_a, radius_b)
-            fig = draw_target(radius_a, radius_b, throws=throws)
-            with col2:
-                st.text('\n')
-                st.text('\n')
-                st.pyplot(fig)
+            if streaming:
+                # Only the cumulative hits at ~100 checkpoints are kept, whatever the number of throws
+                with profiler.section("game-zone/simulate"):
+                    throws, running_hits = running_hit_counts(n_throws, radius_a, radius_b, seed=game_rng("target"),
+                                                              sampler=sampler)
+                hits = {area: int(counts[-1]) for area, counts in running_hits.items()}
+                with col2:
+                    with profiler.section("game-zone/plotly_chart"):
+                        st.plotly_chart(convergence_chart(throws, running_hits,
+                                                          {'A': percent_a, 'B': percent_b, 'C': percent_c}),
+                                        width="stretch")
+            else:
+                with profiler.section("game-zone/simulate"):
+                    x, y, hits = simulate_throws(n_throws, radius_a, radius_b, seed=game_rng("target"), sampler=sampler)
+                with profiler.section("game-zone/draw_target"):
+                    fig = draw_target(radius_a, radius_b, throws=(x, y))
+                with col2:
+                    st.text('\n')
+                    st.text('\n')
+                    with profiler.section("game-zone/st.pyplot"):
+                        st.pyplot(fig)
+                plt.close(fig)
 
             #  Presenting the results
             st.markdown('<div class="game-explanation-header"><h3>תוצאות הזריקות:</h3></div>', unsafe_allow_html=True)
@@ -183,6 +192,8 @@ with col1:
 
             st.markdown(f"**סך הנקודות הכולל:** {(hits['A'] * score_a + hits['B'] * score_b + hits['C'] * score_c)}")
 
+profiler.lap("game-zone")
+
 
 # --- Theory Section ---
 st.markdown('<div class="section-header"><h2>📚 רקע תיאורטי</h2></div>', unsafe_allow_html=True)
@@ -210,6 +221,8 @@ with col1:
         </div>
     """, unsafe_allow_html=True)
 
+profiler.lap("theory")
+
 # --- Practice Section ---
 st.markdown('<div class="section-header"><h2>✍️ בואו נתרגל!</h2></div>', unsafe_allow_html=True)
 
@@ -235,309 +248,74 @@ with col1:
 
 with col2:
     radius_a_default, radius_b_default = calculate_radii_from_percentages(4.76, 24.99)
-    fig_default = draw_target(radius_a_default, radius_b_default)
-    st.pyplot(fig_default)
-
-# Definition of correct answers
-correct_answers = {
-    "q1": 4.76,
-    "q2": 42.55,
-    "q3": 16.0,
-    "q4": 7.48
-}
-
-# Question 1
-col1, col2 = st.columns(2)
+    st.image(render_target_board(radius_a_default, radius_b_default), width="stretch")
 
-with col1:
-    st.markdown("""
+# Practice questions
+questions = [
+    Question(
+        id="q1",
+        prompt="""
         <div class='question-box'>
         <h3>שאלה 1️⃣</h3>
          מה ההסתברות לפגוע באזור A?
         </div>
-    """, unsafe_allow_html=True)
-
-    # Get the current attempt count from URL parameters
-    q1_attempt_count = int(st.query_params.get("q1_attempts", "0"))
-
-    # Use a form for question 1
-    with st.form(key="question1_form"):
-        q1_answer = st.number_input(
-            "הכניסו את תשובתכם באחוזים:",
-            min_value=0.0,
-            max_value=100.0,
-            step=0.1,
-            key="q1_input"
-        )
-
-        # Submit button (disabled if max attempts reached)
-        q1_submit = st.form_submit_button(
-            "בדיקת תשובה",
-            disabled=(q1_attempt_count >= 10 or st.query_params.get("q1_status") == "success")
-        )
-
-        # Process form submission inside the form
-        if q1_submit:
-            # Check if answer is correct
-            is_correct = abs(q1_answer - correct_answers["q1"]) < 0.1
-
-            if is_correct:
-                st.query_params["q1_status"] = "success"
-            else:
-                # Increment attempt counter
-                q1_attempt_count += 1
-
-                # Update URL parameter
-                st.query_params["q1_attempts"] = str(q1_attempt_count)
-
-                if q1_attempt_count >= 10:
-                    st.query_params["q1_status"] = "failed"
-                else:
-                    st.query_params["q1_status"] = "trying"
-
-        # Check if we need to show a previous result
-        if "q1_status" in st.query_params:
-            status = st.query_params["q1_status"]
-            if status == "success":
-                st.success(f"כל הכבוד! התשובה הנכונה היא {correct_answers['q1']}%. \n"
-                           "\n"
-                           f"**הסבר:** ההסתברות לפגיעה באזור A נקבעת על פי יחס השטחים בין אזור A לכל לוח המטרה.")
-            elif status == "failed":
-                st.error(f"כל הכבוד על הניסיון! בפעם הבאה תצליחו יותר. \n"
-                         "\n"
-                         f"התשובה הנכונה היא {correct_answers['q1']}%. \n"
-                         "\n"
-                         f"**הסבר:** ההסתברות לפגיעה באזור A נקבעת על פי יחס השטחים בין אזור A לכל לוח המטרה.")
-            elif status == "trying":
-                current_attempts = int(st.query_params.get("q1_attempts", "0"))
-                remaining = 10 - current_attempts
-                st.error(f"לא מדויק. נסו שוב! נותרו {remaining} ניסיונות.")
-
-# Question 2
-with col1:
-    st.markdown("""
+    """,
+        answer=4.76,
+        explanation=(
+            "**הסבר:** ההסתברות לפגיעה באזור A נקבעת על פי יחס השטחים בין אזור A לכל לוח המטרה."
+        ),
+    ),
+    Question(
+        id="q2",
+        prompt="""
         <div class='question-box'>
         <h3>שאלה 2️⃣</h3>
         מקטינים את אזור C בחצי, כאשר החצי שהוקטן מתחלק באופן שווה בין אזור A לאזור B (השטח הכולל של לוח המטרה נשמר). מה ההסתברות לפגוע באזור B?
         </div>
-    """, unsafe_allow_html=True)
-
-    # Get the current attempt count from URL parameters
-    q2_attempt_count = int(st.query_params.get("q2_attempts", "0"))
-
-    # Use a form for question 2
-    with st.form(key="question2_form"):
-        q2_answer = st.number_input(
-            "הכניסו את תשובתכם באחוזים:",
-            min_value=0.0,
-            max_value=100.0,
-            step=0.1,
-            key="q2_input"
-        )
-
-        # Submit button (disabled if max attempts reached)
-        q2_submit = st.form_submit_button(
-            "בדיקת תשובה",
-            disabled=(q2_attempt_count >= 10 or st.query_params.get("q2_status") == "success")
-        )
-
-        # Process form submission inside the form
-        if q2_submit:
-            # Check if answer is correct
-            is_correct = abs(q2_answer - correct_answers["q2"]) < 0.1
-
-            if is_correct:
-                st.query_params["q2_status"] = "success"
-            else:
-                # Increment attempt counter
-                q2_attempt_count += 1
-
-                # Update URL parameter
-                st.query_params["q2_attempts"] = str(q2_attempt_count)
-
-                if q2_attempt_count >= 10:
-                    st.query_params["q2_status"] = "failed"
-                else:
-                    st.query_params["q2_status"] = "trying"
-
-        # Check if we need to show a previous result
-        if "q2_status" in st.query_params:
-            status = st.query_params["q2_status"]
-            if status == "success":
-                st.success(f"כל הכבוד! התשובה הנכונה היא {correct_answers['q2']:.2f}%. \n"
-                           f"\n"
-                           f"**הסבר:** ההסתברות לפגיעה באזור B נקבעת על פי יחס השטחים בין אזור B לכל לוח המטרה. השטח של אזור B גדל ברבע מהשטח המקורי של אזור C. חלוקה בין השטח החדש של אזור B לשטח הכולל של לוח המטרה (שנשמר זהה) מניבה את התוצאה הנכונה.")
-            elif status == "failed":
-                st.error(f"כל הכבוד על הניסיון! בפעם הבאה תצליחו יותר. \n"
-                         "\n"
-                         f"התשובה הנכונה היא {correct_answers['q2']:.2f}%. \n"
-                         "\n"
-                         f"**הסבר:** ההסתברות לפגיעה באזור B נקבעת על פי יחס השטחים בין אזור B לכל לוח המטרה. השטח של אזור B גדל ברבע מהשטח המקורי של אזור C. חלוקה בין השטח החדש של אזור B לשטח הכולל של לוח המטרה (שנשמר זהה) מניבה את התוצאה הנכונה.")
-            elif status == "trying":
-                current_attempts = int(st.query_params.get("q2_attempts", "0"))
-                remaining = 10 - current_attempts
-                st.error(f"לא מדויק. נסו שוב! נותרו {remaining} ניסיונות.")
-
-# Question 3
-with col1:
-    st.markdown("""
+    """,
+        answer=42.55,
+        explanation=(
+            "**הסבר:** ההסתברות לפגיעה באזור B נקבעת על פי יחס השטחים בין אזור B לכל לוח המטרה. השטח של אזור B גדל ברבע מהשטח המקורי של אזור C. חלוקה בין השטח החדש של אזור B לשטח הכולל של לוח המטרה (שנשמר זהה) מניבה את התוצאה הנכונה."
+        ),
+    ),
+    Question(
+        id="q3",
+        prompt="""
         <div class='question-box'>
         <h3>שאלה 3️⃣</h3>
         סטודנט מצטיין בזריקת חצים בטוח פוגע באזור A או B. מה הסיכוי שהוא יפגע באזור A?
         </div>
-    """, unsafe_allow_html=True)
-
-    # Get the current attempt count from URL parameters
-    q3_attempt_count = int(st.query_params.get("q3_attempts", "0"))
-
-    # Use a form for question 3
-    with st.form(key="question3_form"):
-        q3_answer = st.number_input(
-            "הכניסו את תשובתכם באחוזים:",
-            min_value=0.0,
-            max_value=100.0,
-            step=0.1,
-            key="q3_input"
-        )
-
-        # Submit button (disabled if max attempts reached)
-        q3_submit = st.form_submit_button(
-            "בדיקת תשובה",
-            disabled=(q3_attempt_count >= 10 or st.query_params.get("q3_status") == "success")
-        )
-
-        # Process form submission inside the form
-        if q3_submit:
-            # Check if answer is correct
-            is_correct = abs(q3_answer - correct_answers["q3"]) < 0.1
-
-            # Display result with special visualization for question 3
-            if is_correct:
-                st.query_params["q3_status"] = "success"
-            else:
-                # Increment attempt counter
-                q3_attempt_count += 1
-
-                # Update URL parameter
-                st.query_params["q3_attempts"] = str(q3_attempt_count)
-
-                if q3_attempt_count >= 10:
-                    st.query_params["q3_status"] = "failed"
-                else:
-                    st.query_params["q3_status"] = "trying"
-
-        if "q3_status" in st.query_params:
-            status = st.query_params["q3_status"]
-            if status == "success":
-                col1_vis, col2_vis = st.columns(2)
-                with col1_vis:
-                    st.success(f"כל הכבוד! התשובה הנכונה היא {correct_answers['q3']:.0f}%. \n"
-                               "\n"
-                               f"**הסבר:** כאשר ידוע שהחץ פגע באזור A או B, מרחב המדגם מצטמצם לאזורים A ו-B בלבד ולכן ההסתברות לפגיעה באזור A משתנה. חלוקה בין שטח אזור A לסכום השטחים של אזור A ו-B (מרחב המדגם החדש) מניבה את התוצאה הנכונה.")
-
-                with col2_vis:
-                    radius_a_default, radius_b_default = calculate_radii_from_percentages(4.76, 24.99)
-                    fig_reduced = draw_target(radius_a_default, radius_b_default, radius_c=radius_b_default)
-                    st.pyplot(fig_reduced)
-            elif status == "failed":
-                col1_vis, col2_vis = st.columns(2)
-                with col1_vis:
-                    st.error(f"כל הכבוד על הניסיון! בפעם הבאה תצליחו יותר. \n"
-                             "\n"
-                             f"התשובה הנכונה היא {correct_answers['q3']:.0f}%. \n"
-                             "\n"
-                             f"**הסבר:** כאשר ידוע שהחץ פגע באזור A או B, מרחב המדגם מצטמצם לאזורים A ו-B בלבד ולכן ההסתברות לפגיעה באזור A משתנה. חלוקה בין שטח אזור A לסכום השטחים של אזור A ו-B (מרחב המדגם החדש) מניבה את התוצאה הנכונה.")
-
-                with col2_vis:
-                    radius_a_default, radius_b_default = calculate_radii_from_percentages(4.76, 24.99)
-                    fig_reduced = draw_target(radius_a_default, radius_b_default, radius_c=radius_b_default)
-                    st.pyplot(fig_reduced)
-            elif status == "trying":
-                current_attempts = int(st.query_params.get("q3_attempts", "0"))
-                remaining = 10 - current_attempts
-                st.error(f"לא מדויק. נסו שוב! נותרו {remaining} ניסיונות.")
-
-# Question 4
-with col1:
-    st.markdown("""
+    """,
+        answer=16.0,
+        explanation=(
+            "**הסבר:** כאשר ידוע שהחץ פגע באזור A או B, מרחב המדגם מצטמצם לאזורים A ו-B בלבד ולכן ההסתברות לפגיעה באזור A משתנה. חלוקה בין שטח אזור A לסכום השטחים של אזור A ו-B (מרחב המדגם החדש) מניבה את התוצאה הנכונה."
+        ),
+        figure=lambda: render_target_board(radius_a_default, radius_b_default, radius_c=radius_b_default),
+    ),
+    Question(
+        id="q4",
+        prompt="""
         <div class='question-box'>
         <h3>שאלה 4️⃣</h3>
         כעת, מגבילים את אזור הפגיעה לכדי ריבוע החסום על ידי המעגל הגדול ביותר.
         \n
         מה ההסתברות לפגוע באזור A?
         </div>
-    """, unsafe_allow_html=True)
+    """,
+        answer=7.48,
+        explanation=(
+            "**הסבר:** כאשר הריבוע חסום על ידי המעגל החיצוני, צלע הריבוע שווה לרדיוס המעגל החיצוני כפול 2√. "
+            "היחס בין שטח מעגל A לשטח הריבוע הוא ²(2√12²π/(55. "
+            "לכן ההסתברות לפגוע באזור A היא 7.48%."
+        ),
+        figure=lambda: render_target_board(radius_a_default, radius_b_default, show_square=True),
+    ),
+]
 
-    # Get the current attempt count from URL parameters
-    q4_attempt_count = int(st.query_params.get("q4_attempts", "0"))
-
-    # Use a form for question 4
-    with st.form(key="question4_form"):
-        q4_answer = st.number_input(
-            "הכניסו את תשובתכם באחוזים:",
-            min_value=0.0,
-            max_value=100.0,
-            step=0.1,
-            key="q4_input"
-        )
-
-        # Submit button (disabled if max attempts reached)
-        q4_submit = st.form_submit_button(
-            "בדיקת תשובה",
-            disabled=(q4_attempt_count >= 10 or st.query_params.get("q4_status") == "success")
-        )
-
-        # Process form submission inside the form
-        if q4_submit:
-            # Check if answer is correct
-            is_correct = abs(q4_answer - correct_answers["q4"]) < 0.1
-
-            # Display result with special visualization for question 4
-            if is_correct:
-                st.query_params["q4_status"] = "success"
-            else:
-                # Increment attempt counter
-                q4_attempt_count += 1
-
-                # Update URL parameter
-                st.query_params["q4_attempts"] = str(q4_attempt_count)
-
-                if q4_attempt_count >= 10:
-                    st.query_params["q4_status"] = "failed"
-                else:
-                    st.query_params["q4_status"] = "trying"
-
-        if "q4_status" in st.query_params:
-            status = st.query_params["q4_status"]
-            if status == "success":
-                col1_vis, col2_vis = st.columns(2)
-                with col1_vis:
-                    st.success(f"כל הכבוד! התשובה הנכונה היא {correct_answers['q4']:.2f}%. \n"
-                               "\n"
-                               f"**הסבר:** כאשר הריבוע חסום על ידי המעגל החיצוני, צלע הריבוע שווה לרדיוס המעגל החיצוני כפול 2√. "
-                               f"היחס בין שטח מעגל A לשטח הריבוע הוא ²(2√12²π/(55. "
-                               f"לכן ההסתברות לפגוע באזור A היא 7.48%.")
-
-                with col2_vis:
-                    radius_a_default, radius_b_default = calculate_radii_from_percentages(4.76, 24.99)
-                    fig_reduced = draw_target(radius_a_default, radius_b_default, show_square=True)
-                    st.pyplot(fig_reduced)
-            elif status == "failed":
-                col1_vis, col2_vis = st.columns(2)
-                with col1_vis:
-                    st.error(f"כל הכבוד על הניסיון! בפעם הבאה תצליחו יותר. \n"
-                             "\n"
-                             f"התשובה הנכונה היא {correct_answers['q4']:.2f}%. \n"
-                             "\n"
-                             f"**הסבר:** כאשר הריבוע חסום על ידי המעגל החיצוני, צלע הריבוע שווה לרדיוס המעגל החיצוני כפול 2√. "
-                             f"היחס בין שטח מעגל A לשטח הריבוע הוא ²(2√12²π/(55. "
-                             f"לכן ההסתברות לפגוע באזור A היא 7.48%.")
-
-                with col2_vis:
-                    radius_a_default, radius_b_default = calculate_radii_from_percentages(4.76, 24.99)
-                    fig_reduced = draw_target(radius_a_default, radius_b_default, show_square=True)
-                    st.pyplot(fig_reduced)
-            elif status == "trying":
-                current_attempts = int(st.query_params.get("q4_attempts", "0"))
-                remaining = 10 - current_attempts
-                st.error(f"לא מדויק. נסו שוב! נותרו {remaining} ניסיונות.")
\ No newline at end of file
+col1, col2 = st.columns(2)
+
+with col1:
+    render_questions(questions)
+
+profiler.lap("practice")
+profiler.finish()
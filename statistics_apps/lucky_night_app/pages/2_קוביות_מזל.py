@@ -1,26 +1,17 @@
 import streamlit as st
 import plotly.graph_objects as go
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.patches import Circle
-import math
-import os
-import random
-import pandas as pd
-from utils.helper_functions import setup_page, under_development_page
+from utils.assets import show_logo
+from utils.helper_functions import setup_page
+from lucky_night_core.dice import is_lucky_sum, roll_dice
+from lucky_night_core.dice_distribution import dice_sum_pmf
+from lucky_night_core.roll_history import RollHistory
+from utils.profiling import PageProfiler
+from utils.questions import Question, render_questions
+from utils.session_rng import game_rng, show_seed_panel
 
 
 # --- Helper Functions ---
-def roll_dice():
-    dice1 = random.randint(1, 6)
-    dice2 = random.randint(1, 6)
-    return dice1, dice2
-
-
-def is_lucky_sum(sum_dice):
-    return sum_dice in [6, 9]
-
-
 def get_all_dice_combinations():
     combinations = []
     for i in range(1, 7):
@@ -53,19 +44,14 @@ def create_dice_svg(number):
 
 
 def reset_game():
-    st.session_state.game_history = []
+    st.session_state.game_history = RollHistory()
     st.session_state.score = 0
     st.session_state.roll_count = 0
 
 
 def calculate_roll_distribution(history):
     sums = list(range(2, 13))
-    counts = [0] * 11  # 11 possible sums (2-12)
-
-    if history:
-        for roll in history:
-            idx = roll['סכום'] - 2  # Convert sum to index (2->0, 3->1, etc)
-            counts[idx] += 1
+    counts = history.sum_counts[2:].tolist()  # Running counts, indexed by the sum itself
 
     return sums, counts
 
@@ -75,7 +61,7 @@ def calculate_success_rate(history):
         return {"הצלחה": 0, "כישלון": 0}
 
     total_rolls = len(history)
-    success_count = sum(1 for roll in history if roll['מספר מזל'] == 'כן')
+    success_count = history.lucky_count
 
     success_rate = (success_count / total_rolls) * 100
     failure_rate = 100 - success_rate
@@ -86,15 +72,55 @@ def calculate_success_rate(history):
     }
 
 
+def show_recorded_rolls():
+    """Show the 24 recorded rolls of question 4 side by side."""
+    col1_dice, col2_dice = st.columns(2)
+
+    with col1_dice:
+        st.markdown("""
+        | הטלה | קובייה 1 | קובייה 2 |
+        |:---:|:---:|:---:|
+        | 1 | 3 | 6 |
+        | 2 | 5 | 4 |
+        | 3 | 6 | 6 |
+        | 4 | 2 | 3 |
+        | 5 | 1 | 5 |
+        | 6 | 4 | 6 |
+        | 7 | 3 | 2 |
+        | 8 | 5 | 5 |
+        | 9 | 2 | 6 |
+        | 10 | 6 | 1 |
+        | 11 | 1 | 5 |
+        | 12 | 4 | 6 |
+        """)
+
+    with col2_dice:
+        st.markdown("""
+        | הטלה | קובייה 1 | קובייה 2 |
+        |:---:|:---:|:---:|
+        | 13 | 2 | 4 |
+        | 14 | 5 | 6 |
+        | 15 | 3 | 3 |
+        | 16 | 6 | 5 |
+        | 17 | 4 | 6 |
+        | 18 | 1 | 2 |
+        | 19 | 3 | 5 |
+        | 20 | 5 | 6 |
+        | 21 | 2 | 1 |
+        | 22 | 6 | 5 |
+        | 23 | 4 | 6 |
+        | 24 | 1 | 4 |
+        """)
+
+
 # --- Page Content ---
+profiler = PageProfiler("dice")
 st.set_page_config(layout="wide")
 setup_page()
+profiler.lap("setup_page")
 
 # -- Sidebar --
-current_dir = os.path.dirname(os.path.abspath(__file__))
-
-logo_path = os.path.join(current_dir, 'bgu_logo.png')
-st.sidebar.image(logo_path)
+show_logo()
 st.sidebar.markdown("""
 
         <div style="text-align: center;">
@@ -102,9 +128,12 @@ st.sidebar.markdown("""
             <h4>362.1.3071</h4>
         </div>
     """, unsafe_allow_html=True)
+show_seed_panel()
 
 st.markdown('<div class="top-header"><h1>קוביות מזל 🎲</h1></div>', unsafe_allow_html=True)
 
+profiler.lap("sidebar")
+
 # --- game explanation ---
 st.markdown('<div class="section-header"><h2>🎮 המשחק</h2></div>', unsafe_allow_html=True)
 
@@ -126,6 +155,8 @@ with col1:
         </div>
     """, unsafe_allow_html=True)
 
+profiler.lap("game explanation")
+
 # --- game-zone ---
 col1, col2 = st.columns([4, 1])
 
@@ -134,7 +165,7 @@ with col1:
 
     # Initialize session state for game history and score
     if 'game_history' not in st.session_state:
-        st.session_state.game_history = []
+        st.session_state.game_history = RollHistory()
     if 'score' not in st.session_state:
         st.session_state.score = 0
     if 'roll_count' not in st.session_state:
@@ -146,9 +177,9 @@ with col1:
 
     with col_rolls_input:
         num_rolls = st.number_input(
-            "מספר הטלות (1-100):",
+            "מספר הטלות (1-1,000,000):",
             min_value=1,
-            max_value=100,
+            max_value=1_000_000,
             value=1,
             step=1
         )
@@ -162,23 +193,20 @@ with col1:
 
     st.markdown('ההטלה האחרונה:')
     if roll_button:
-        for _ in range(num_rolls):
-            st.session_state.roll_count += 1
-            dice1, dice2 = roll_dice()
-            sum_dice = dice1 + dice2
-            is_lucky = is_lucky_sum(sum_dice)
-
-            if is_lucky:
-                st.session_state.score += 1
-
-            # Add roll to history
-            st.session_state.game_history.append({
-                'מספר הטלה': st.session_state.roll_count,
-                'קובייה 1': dice1,
-                'קובייה 2': dice2,
-                'סכום': sum_dice,
-                'מספר מזל': "כן" if is_lucky else "לא"
-            })
+        with profiler.section("game-zone/simulate"):
+            all_dice1, all_dice2 = roll_dice(num_rolls, seed=game_rng("dice"))
+        all_lucky = is_lucky_sum(all_dice1.astype(int) + all_dice2)
+
+        st.session_state.roll_count += num_rolls
+        st.session_state.score += int(np.count_nonzero(all_lucky))
+
+        # Add the whole batch to history
+        st.session_state.game_history.extend(all_dice1, all_dice2, all_lucky)
+
+        # The last roll is the one shown
+        dice1, dice2 = int(all_dice1[-1]), int(all_dice2[-1])
+        sum_dice = dice1 + dice2
+        is_lucky = bool(all_lucky[-1])
 
         # Display last roll with dice visualization (showing only the last roll)
         col_dice1, col_dice2, col_result = st.columns([1, 1, 2])
@@ -219,24 +247,45 @@ with col1:
                 sums, counts = calculate_roll_distribution(st.session_state.game_history)
 
                 fig = go.Figure(data=[
-                    go.Bar(x=[str(x) for x in sums], y=counts)
+                    go.Bar(x=[str(x) for x in sums], y=counts, name="מספר ההטלות")
                 ])
 
+                # Expected counts from the exact distribution of the sum of 2 dice
+                _, expected_probs = dice_sum_pmf(2)
+                expected_counts = expected_probs * len(st.session_state.game_history)
+
+                fig.add_trace(
+                    go.Scatter(
+                        x=[str(x) for x in sums],
+                        y=expected_counts,
+                        mode='lines+markers',
+                        name='התפלגות תיאורטית',
+                        line=dict(color='red', width=2)
+                    )
+                )
+
                 fig.update_layout(
                     xaxis_title="סכום",
                     yaxis_title="מספר הופעות",
                     title="                                                                           :התפלגות התוצאות",
-                    showlegend=False,
+                    legend=dict(
+                        orientation="h",
+                        yanchor="bottom",
+                        y=1.02,
+                        xanchor="right",
+                        x=1
+                    ),
                     height=500,
                     yaxis=dict(
-                        dtick=10  # Set y-axis tick interval to 1
+                        dtick=10 if max(counts) <= 100 else None  # Fixed ticks only while the bars are short
                     ),
                     xaxis=dict(
                         dtick=1  # Set x-axis tick interval to 1
                     )
                 )
 
-                st.plotly_chart(fig, use_container_width=True)
+                with profiler.section("game-zone/plotly_chart"):
+                    st.plotly_chart(fig, width="stretch")
 
             with col_pie:
                 success_data = calculate_success_rate(st.session_state.game_history)
@@ -261,13 +310,19 @@ with col1:
                     st.markdown("\n")
                     st.markdown("10 הטלות אחרונות:")
 
-                    # Get last 10 rolls (reversed to show newest first)
-                    last_10_rolls = list(reversed(st.session_state.game_history[-10:]))
+                    import pandas as pd  # Heavy import, only needed once there are rolls to show
+
+                    # Get last 10 rolls (newest first)
+                    roll_numbers, dice1_col, dice2_col, lucky_col = st.session_state.game_history.tail(10)
 
                     # Create DataFrame with right-to-left column order
-                    df = pd.DataFrame(last_10_rolls, index=None)
-                    columns = ['מספר מזל', 'סכום', 'קובייה 2', 'קובייה 1', 'מספר הטלה']
-                    df = df[columns]
+                    df = pd.DataFrame({
+                        'מספר מזל': np.where(lucky_col, "כן", "לא"),
+                        'סכום': dice1_col.astype(int) + dice2_col,
+                        'קובייה 2': dice2_col,
+                        'קובייה 1': dice1_col,
+                        'מספר הטלה': roll_numbers
+                    })
 
 
                     # Style the DataFrame
@@ -278,14 +333,17 @@ with col1:
                             row)
 
 
-                    styled_df = df.style.apply(highlight_lucky, axis=1).set_table_attributes('style="direction: rtl"')
+                    with profiler.section("game-zone/styled table"):
+                        styled_df = df.style.apply(highlight_lucky, axis=1).set_table_attributes('style="direction: rtl"')
 
-                    # Display DataFrame without index
-                    st.dataframe(
-                        styled_df,
-                        use_container_width=True,
-                        hide_index=True
-                    )
+                        # Display DataFrame without index
+                        st.dataframe(
+                            styled_df,
+                            width="stretch",
+                            hide_index=True
+                        )
+
+profiler.lap("game-zone")
 
 # --- Theory Section ---
 st.markdown('<div class="section-header"><h2>📚 רקע תיאורטי</h2></div>', unsafe_allow_html=True)
@@ -317,6 +375,27 @@ with col1:
         </div>
     """, unsafe_allow_html=True)
 
+with col2:
+    # Exact distribution of the sum of any number of dice
+    n_dice = st.slider("מספר קוביות:", min_value=1, max_value=100, value=2)
+    dice_sums, sum_probs = dice_sum_pmf(n_dice)
+
+    fig = go.Figure(data=[
+        go.Bar(x=dice_sums, y=sum_probs)
+    ])
+
+    fig.update_layout(
+        xaxis_title="סכום",
+        yaxis_title="הסתברות",
+        title=f"התפלגות סכום {n_dice} קוביות",
+        showlegend=False,
+        height=400
+    )
+
+    st.plotly_chart(fig, width="stretch")
+
+profiler.lap("theory")
+
 # --- Practice Section ---
 st.markdown('<div class="section-header"><h2>✍️ בואו נתרגל!</h2></div>', unsafe_allow_html=True)
 
@@ -335,259 +414,76 @@ with col1:
         </div>
     """, unsafe_allow_html=True)
 
-    # Definition of correct answers
-    correct_answers = {
-        "q1_dice": 21,
-        "q2_dice": 4,
-        "q3_dice": 25,
-        "q4_dice": 2,
-        "q5_dice": 19.43
-    }
-
-# Question 1
-with col1:
-    st.markdown("""
+# Practice questions
+questions = [
+    Question(
+        id="q1_dice",
+        prompt="""
         <div class='question-box'>
         <h3>שאלה 1️⃣</h3>
          כמה צמדים שונים קיימים כאשר מטילים 2 קוביות?
          \n
          הסדר אינו חשוב.
         </div>
-    """, unsafe_allow_html=True)
-
-    # Get the current attempt count from URL parameters
-    q1_attempt_count = int(st.query_params.get("q1_dice_attempts", "0"))
-
-    # Use a form for question 1
-    with st.form(key="question1_dice_form"):
-        q1_answer = st.number_input(
-            "הכניסו את תשובתכם:",
-            min_value=0.0,
-            max_value=100.0,
-            step=0.1,
-            key="q1_dice_input"
-        )
-
-        # Submit button (disabled if max attempts reached)
-        q1_submit = st.form_submit_button(
-            "בדיקת תשובה",
-            disabled=(q1_attempt_count >= 10 or st.query_params.get("q1_dice_status") == "success")
-        )
-
-        # Process form submission inside the form
-        if q1_submit:
-            # Check if answer is correct
-            is_correct = abs(q1_answer - correct_answers["q1_dice"]) < 0.1
-
-            if is_correct:
-                st.query_params["q1_dice_status"] = "success"
-            else:
-                # Increment attempt counter
-                q1_attempt_count += 1
-
-                # Update URL parameter
-                st.query_params["q1_dice_attempts"] = str(q1_attempt_count)
-
-                if q1_attempt_count >= 10:
-                    st.query_params["q1_dice_status"] = "failed"
-                else:
-                    st.query_params["q1_dice_status"] = "trying"
-
-        # Check if we need to show a previous result
-        if "q1_dice_status" in st.query_params:
-            status = st.query_params["q1_dice_status"]
-            if status == "success":
-                st.success(f"כל הכבוד! התשובה הנכונה היא {correct_answers['q1_dice']}. \n"
-                           "\n"
-                           "**הסבר:** כשהסדר לא חשוב, אנחנו משתמשים בנוסחת הצירופים (combinations):\n\n"
-                           "* זוגות זהים (1,1), (2,2) וכו׳: 6 אפשרויות.\n"
-                           "* זוגות שונים: המספרים שונים זה מזה, ולכן זה בעצם בחירת 2 מספרים מתוך 6, כשהסדר לא חשוב.\n"
-                           "* נשתמש בנוסחה: $15 = \\frac{6 \\cdot 5}{2 \\cdot 1} = \\frac{!6}{!2!(6-2)} = \\binom{6}{2} $ \n"
-                           "* סה\"כ: 6 + 15 = 21 צמדים שונים")
-            elif status == "failed":
-                st.error(f"כל הכבוד על הניסיון! בפעם הבאה תצליחו יותר. \n"
-                         "\n"
-                         f"התשובה הנכונה היא {correct_answers['q1_dice']}. \n"
-                         "\n"
-                         "**הסבר:** כשהסדר לא חשוב, אנחנו משתמשים בנוסחת הצירופים (combinations):\n\n"
-                         "* זוגות זהים (1,1), (2,2) וכו׳: 6 אפשרויות.\n"
-                         "* זוגות שונים: המספרים שונים זה מזה, ולכן זה בעצם בחירת 2 מספרים מתוך 6, כשהסדר לא חשוב.\n"
-                         "* נשתמש בנוסחה: $15 = \\frac{6 \\cdot 5}{2 \\cdot 1} = \\frac{!6}{!2!(6-2)} = \\binom{6}{2} $ \n"
-                         "* סה\"כ: 6 + 15 = 21 צמדים שונים")
-            elif status == "trying":
-                current_attempts = int(st.query_params.get("q1_dice_attempts", "0"))
-                remaining = 10 - current_attempts
-                st.error(f"לא מדויק. נסו שוב! נותרו {remaining} ניסיונות.")
-
-# Question 2
-with col1:
-    st.markdown("""
+    """,
+        answer=21,
+        explanation=(
+            "**הסבר:** כשהסדר לא חשוב, אנחנו משתמשים בנוסחת הצירופים (combinations):\n\n"
+            "* זוגות זהים (1,1), (2,2) וכו׳: 6 אפשרויות.\n"
+            "* זוגות שונים: המספרים שונים זה מזה, ולכן זה בעצם בחירת 2 מספרים מתוך 6, כשהסדר לא חשוב.\n"
+            "* נשתמש בנוסחה: $15 = \\frac{6 \\cdot 5}{2 \\cdot 1} = \\frac{!6}{!2!(6-2)} = \\binom{6}{2} $ \n"
+            "* סה\"כ: 6 + 15 = 21 צמדים שונים"
+        ),
+        unit="",
+        input_label="הכניסו את תשובתכם:",
+    ),
+    Question(
+        id="q2_dice",
+        prompt="""
         <div class='question-box'>
         <h3>שאלה 2️⃣</h3>
         כמה אופציות אפשריות לקבלת מספר המזל 9 בסכום הקוביות?
         </div>
-    """, unsafe_allow_html=True)
-
-    # Get the current attempt count from URL parameters
-    q2_attempt_count = int(st.query_params.get("q2_dice_attempts", "0"))
-
-    # Use a form for question 2
-    with st.form(key="question2_dice_form"):
-        q2_answer = st.number_input(
-            "הכניסו את תשובתכם:",
-            min_value=0.0,
-            max_value=100.0,
-            step=0.1,
-            key="q2_dice_input"
-        )
-
-        # Submit button (disabled if max attempts reached)
-        q2_submit = st.form_submit_button(
-            "בדיקת תשובה",
-            disabled=(q2_attempt_count >= 10 or st.query_params.get("q2_dice_status") == "success")
-        )
-
-        # Process form submission inside the form
-        if q2_submit:
-            # Check if answer is correct
-            is_correct = abs(q2_answer - correct_answers["q2_dice"]) < 0.1
-
-            if is_correct:
-                st.query_params["q2_dice_status"] = "success"
-            else:
-                # Increment attempt counter
-                q2_attempt_count += 1
-
-                # Update URL parameter
-                st.query_params["q2_dice_attempts"] = str(q2_attempt_count)
-
-                if q2_attempt_count >= 10:
-                    st.query_params["q2_dice_status"] = "failed"
-                else:
-                    st.query_params["q2_dice_status"] = "trying"
-
-        # Check if we need to show a previous result
-        if "q2_dice_status" in st.query_params:
-            status = st.query_params["q2_dice_status"]
-            if status == "success":
-                st.success(f"כל הכבוד! התשובה הנכונה היא {correct_answers['q2_dice']}. \n"
-                           "\n"
-                           "**הסבר:** במקרה הזה החישוב פשוט, אבל נחשב באמצעות תמורות (permutations) לשם התרגול:\n\n"
-                           "* ראשית, נמצא את כל הזוגות השונים שסכומם 9: (3,6), (4,5)\n"
-                           "* עבור כל זוג, נחשב את מספר התמורות האפשריות כשהסדר כן חשוב.\n"
-                           "* הנוסחה לתמורה של 2 איברים היא: \n"
-                           "$2 = \\frac{2 \\cdot 1}{1}  = \\frac{!2}{!0} = \\frac{!2}{!(2-2)}= N$\n"
-                           "* לכן:\n"
-                           "  * עבור הזוג (3,6): 2 תמורות - (3,6), (6,3)\n"
-                           "  * עבור הזוג (4,5): 2 תמורות - (4,5), (5,4)\n"
-                           "* סה״כ: 2 זוגות × 2 תמורות = 4 אפשרויות")
-            elif status == "failed":
-                st.error(f"כל הכבוד על הניסיון! בפעם הבאה תצליחו יותר. \n"
-                         "\n"
-                         f"התשובה הנכונה היא {correct_answers['q2_dice']}. \n"
-                         "\n"
-                         "**הסבר:** במקרה הזה החישוב פשוט, אבל נחשב באמצעות תמורות (permutations) לשם התרגול:\n\n"
-                         "* ראשית, נמצא את כל הזוגות השונים שסכומם 9: (3,6), (4,5)\n"
-                         "* עבור כל זוג, נחשב את מספר התמורות האפשריות כשהסדר כן חשוב.\n"
-                         "* הנוסחה לתמורה של 2 איברים היא: \n"
-                         "$2 = \\frac{2 \\cdot 1}{1}  = \\frac{!2}{!0} = \\frac{!2}{!(2-2)}= N$\n"
-                         "* לכן:\n"
-                         "  * עבור הזוג (3,6): 2 תמורות - (3,6), (6,3)\n"
-                         "  * עבור הזוג (4,5): 2 תמורות - (4,5), (5,4)\n"
-                         "* סה״כ: 2 זוגות × 2 תמורות = 4 אפשרויות")
-            elif status == "trying":
-                current_attempts = int(st.query_params.get("q2_dice_attempts", "0"))
-                remaining = 10 - current_attempts
-                st.error(f"לא מדויק. נסו שוב! נותרו {remaining} ניסיונות.")
-
-# Question 3
-with col1:
-    st.markdown("""
+    """,
+        answer=4,
+        explanation=(
+            "**הסבר:** במקרה הזה החישוב פשוט, אבל נחשב באמצעות תמורות (permutations) לשם התרגול:\n\n"
+            "* ראשית, נמצא את כל הזוגות השונים שסכומם 9: (3,6), (4,5)\n"
+            "* עבור כל זוג, נחשב את מספר התמורות האפשריות כשהסדר כן חשוב.\n"
+            "* הנוסחה לתמורה של 2 איברים היא: \n"
+            "$2 = \\frac{2 \\cdot 1}{1}  = \\frac{!2}{!0} = \\frac{!2}{!(2-2)}= N$\n"
+            "* לכן:\n"
+            "  * עבור הזוג (3,6): 2 תמורות - (3,6), (6,3)\n"
+            "  * עבור הזוג (4,5): 2 תמורות - (4,5), (5,4)\n"
+            "* סה״כ: 2 זוגות × 2 תמורות = 4 אפשרויות"
+        ),
+        unit="",
+        input_label="הכניסו את תשובתכם:",
+    ),
+    Question(
+        id="q3_dice",
+        prompt="""
         <div class='question-box'>
         <h3>שאלה 3️⃣</h3>
         מה ההסתברות לקבל מספר מזל כלשהו?
         </div>
-    """, unsafe_allow_html=True)
-
-    # Get the current attempt count from URL parameters
-    q3_attempt_count = int(st.query_params.get("q3_dice_attempts", "0"))
-
-    # Use a form for question 3
-    with st.form(key="question3_dice_form"):
-        q3_answer = st.number_input(
-            "הכניסו את תשובתכם באחוזים:",
-            min_value=0.0,
-            max_value=100.0,
-            step=0.1,
-            key="q3_dice_input"
-        )
-
-        # Submit button (disabled if max attempts reached)
-        q3_submit = st.form_submit_button(
-            "בדיקת תשובה",
-            disabled=(q3_attempt_count >= 10 or st.query_params.get("q3_dice_status") == "success")
-        )
-
-        # Process form submission inside the form
-        if q3_submit:
-            # Check if answer is correct
-            is_correct = abs(q3_answer - correct_answers["q3_dice"]) < 0.1
-
-            if is_correct:
-                st.query_params["q3_dice_status"] = "success"
-            else:
-                # Increment attempt counter
-                q3_attempt_count += 1
-
-                # Update URL parameter
-                st.query_params["q3_dice_attempts"] = str(q3_attempt_count)
-
-                if q3_attempt_count >= 10:
-                    st.query_params["q3_dice_status"] = "failed"
-                else:
-                    st.query_params["q3_dice_status"] = "trying"
-
-        # Check if we need to show a previous result
-        if "q3_dice_status" in st.query_params:
-            status = st.query_params["q3_dice_status"]
-            if status == "success":
-                st.success(
-                    f"כל הכבוד! התשובה הנכונה היא {correct_answers['q3_dice']:.0f}%.\n"
-                    "\n"
-                    "**הסבר:** נחשב את ההסתברות לקבל סכום של 6 או 9:\n"
-                    "\n"
-                    "* מספר האפשרויות לקבלת סכום 6:\n"
-                    "  * זוגות שונים: (1,5), (2,4), (4,2), (5,1) - כל אחד נספר בנפרד כי הקוביות שונות\n"
-                    "  * זוג זהה: (3,3) - נספר פעם אחת כי אותו מספר בשתי הקוביות\n"
-                    "  * סה\"כ 5 אפשרויות\n"
-                    "* מספר האפשרויות לקבלת סכום 9: (3,6), (4,5), (5,4), (6,3) = 4 אפשרויות\n"
-                    "* סך כל האפשרויות בהטלת 2 קוביות: 6 × 6 = 36 אפשרויות\n"
-                    "* לכן ההסתברות היא: $25\\% = 0.25 = \\frac{9}{36} = \\frac{5+4}{36}$"
-                )
-            elif status == "failed":
-                st.error(
-                    f"כל הכבוד על הניסיון! בפעם הבאה תצליחו יותר. \n"
-                    "\n"
-                    f"התשובה הנכונה היא {correct_answers['q3_dice']:.0f}%. \n"
-                    "\n"
-                    "**הסבר:** נחשב את ההסתברות לקבל סכום של 6 או 9:\n"
-                    "\n"
-                    "* מספר האפשרויות לקבלת סכום 6:\n"
-                    "  * זוגות שונים: (1,5), (2,4), (4,2), (5,1) - כל אחד נספר בנפרד כי הקוביות שונות\n"
-                    "  * זוג זהה: (3,3) - נספר פעם אחת כי אותו מספר בשתי הקוביות\n"
-                    "  * סה\"כ 5 אפשרויות\n"
-                    "* מספר האפשרויות לקבלת סכום 9: (3,6), (4,5), (5,4), (6,3) = 4 אפשרויות\n"
-                    "* סך כל האפשרויות בהטלת 2 קוביות: 6 × 6 = 36 אפשרויות\n"
-                    "* לכן ההסתברות היא: $25\\% = 0.25 = \\frac{9}{36} = \\frac{5+4}{36}$"
-                )
-            elif status == "trying":
-                current_attempts = int(st.query_params.get("q3_dice_attempts", "0"))
-                remaining = 10 - current_attempts
-                st.error(f"לא מדויק. נסו שוב! נותרו {remaining} ניסיונות.")
-
-# Question 4
-with col1:
-    st.markdown("""
+    """,
+        answer=25,
+        explanation=(
+            "**הסבר:** נחשב את ההסתברות לקבל סכום של 6 או 9:\n"
+            "\n"
+            "* מספר האפשרויות לקבלת סכום 6:\n"
+            "  * זוגות שונים: (1,5), (2,4), (4,2), (5,1) - כל אחד נספר בנפרד כי הקוביות שונות\n"
+            "  * זוג זהה: (3,3) - נספר פעם אחת כי אותו מספר בשתי הקוביות\n"
+            "  * סה\"כ 5 אפשרויות\n"
+            "* מספר האפשרויות לקבלת סכום 9: (3,6), (4,5), (5,4), (6,3) = 4 אפשרויות\n"
+            "* סך כל האפשרויות בהטלת 2 קוביות: 6 × 6 = 36 אפשרויות\n"
+            "* לכן ההסתברות היא: $25\\% = 0.25 = \\frac{9}{36} = \\frac{5+4}{36}$"
+        ),
+    ),
+    Question(
+        id="q4_dice",
+        prompt="""
         <div class='question-box'>
         <h3>שאלה 4️⃣</h3>
         לאחר מספר סיבובי משחקים, התחלתם לחשוד שאחת מהקוביות היא מזויפת אבל אתם לא בטוחים איזו מהן.
@@ -596,155 +492,43 @@ with col1:
          \n
          בהסתמך על ההטלות שתעדתם בלבד ומוצגות מטה, איזו קוביה ייתכן שהינה מזוייפת?
         </div>
-    """, unsafe_allow_html=True)
-
-    col1_dice, col2_dice = st.columns(2)
-
-    with col1_dice:
-        st.markdown("""
-        | הטלה | קובייה 1 | קובייה 2 |
-        |:---:|:---:|:---:|
-        | 1 | 3 | 6 |
-        | 2 | 5 | 4 |
-        | 3 | 6 | 6 |
-        | 4 | 2 | 3 |
-        | 5 | 1 | 5 |
-        | 6 | 4 | 6 |
-        | 7 | 3 | 2 |
-        | 8 | 5 | 5 |
-        | 9 | 2 | 6 |
-        | 10 | 6 | 1 |
-        | 11 | 1 | 5 |
-        | 12 | 4 | 6 |
-        """)
-
-    with col2_dice:
-        st.markdown("""
-        | הטלה | קובייה 1 | קובייה 2 |
-        |:---:|:---:|:---:|
-        | 13 | 2 | 4 |
-        | 14 | 5 | 6 |
-        | 15 | 3 | 3 |
-        | 16 | 6 | 5 |
-        | 17 | 4 | 6 |
-        | 18 | 1 | 2 |
-        | 19 | 3 | 5 |
-        | 20 | 5 | 6 |
-        | 21 | 2 | 1 |
-        | 22 | 6 | 5 |
-        | 23 | 4 | 6 |
-        | 24 | 1 | 4 |
-        """)
-
-    # Get the current attempt count from URL parameters
-    q4_attempt_count = int(st.query_params.get("q4_dice_attempts", "0"))
-
-    # Use a form for question 4
-    with st.form(key="question4_dice_form"):
-        q4_answer = st.number_input(
-            "הכניסו את מספר הקוביה שייתכן כי היא מזוייפת:",
-            min_value=0.0,
-            max_value=100.0,
-            step=0.1,
-            key="q4_dice_input"
-        )
-
-        # Submit button (disabled if max attempts reached)
-        q4_submit = st.form_submit_button(
-            "בדיקת תשובה",
-            disabled=(q4_attempt_count >= 10 or st.query_params.get("q4_dice_status") == "success")
-        )
-
-        # Process form submission inside the form
-        if q4_submit:
-            # Check if answer is correct
-            is_correct = abs(q4_answer - correct_answers["q4_dice"]) < 0.1
-
-            if is_correct:
-                st.query_params["q4_dice_status"] = "success"
-            else:
-                # Increment attempt counter
-                q4_attempt_count += 1
-
-                # Update URL parameter
-                st.query_params["q4_dice_attempts"] = str(q4_attempt_count)
-
-                if q4_attempt_count >= 10:
-                    st.query_params["q4_dice_status"] = "failed"
-                else:
-                    st.query_params["q4_dice_status"] = "trying"
-
-        # Check if we need to show a previous result
-        if "q4_dice_status" in st.query_params:
-            status = st.query_params["q4_dice_status"]
-            if status == "success":
-                st.success(f"כל הכבוד! התשובה הנכונה היא {correct_answers['q4_dice']:.0f}. \n"
-                           "\n"
-                           "**הסבר:**\n"
-                           "\n"
-                           "נבדוק את התדירות היחסית של כל מספר בכל קובייה:\n"
-                           "\n"
-                           "**קובייה 1:**\n"
-                           "* מספר 1: 4/24 = 16.7%\n"
-                           "* מספר 2: 4/24 = 16.7%\n"
-                           "* מספר 3: 4/24 = 16.7%\n"
-                           "* מספר 4: 4/24 = 16.7%\n"
-                           "* מספר 5: 4/24 = 16.7%\n"
-                           "* מספר 6: 4/24 = 16.7%\n"
-                           "\n"
-                           "התפלגות התוצאות בקובייה 1 אחידה ותואמת את ההסתברות התיאורטית של 1/6 = 16.7% לכל מספר.\n"
-                           "\n"
-                           "**קובייה 2:**\n"
-                           "* מספר 1: 2/24 = 8.3%\n"
-                           "* מספר 2: 2/24 = 8.3%\n"
-                           "* מספר 3: 2/24 = 8.3%\n"
-                           "* מספר 4: 3/24 = 12.5%\n"
-                           "* מספר 5: 6/24 = 25%\n"
-                           "* מספר 6: 9/24 = 37.5%\n"
-                           "\n"
-                           "התפלגות התוצאות בקובייה 2 מראה העדפה למספרים 5 ו-6 (במיוחד ל-6), ותדירות נמוכה יותר למספרים 1-4.\n"
-                           "זוהי סטייה מההסתברות התיאורטית של קובייה הוגנת (1/6 = 16.7% לכל מספר), ולכן ייתכן כי קוביה 2 מזוייפת."
-                           "\n"
-                           "יחד עם זאת, יש לשים לב כי לא באמת נוכל לקבוע זאת בוודאות וזוהי רק השערה שמסתמכת על 24 הטלות בלבד.")
-            elif status == "failed":
-                st.error(f"כל הכבוד על הניסיון! בפעם הבאה תצליחו יותר. \n"
-                         "\n"
-                         f"התשובה הנכונה היא {correct_answers['q4_dice']:.0f}. \n"
-                         "\n"
-                         "**הסבר:**\n"
-                         "\n"
-                         "נבדוק את התדירות היחסית של כל מספר בכל קובייה:\n"
-                         "\n"
-                         "**קובייה 1:**\n"
-                         "* מספר 1: 4/24 = 16.7%\n"
-                         "* מספר 2: 4/24 = 16.7%\n"
-                         "* מספר 3: 4/24 = 16.7%\n"
-                         "* מספר 4: 4/24 = 16.7%\n"
-                         "* מספר 5: 4/24 = 16.7%\n"
-                         "* מספר 6: 4/24 = 16.7%\n"
-                         "\n"
-                         "התפלגות התוצאות בקובייה 1 אחידה ותואמת את ההסתברות התיאורטית של 1/6 = 16.7% לכל מספר.\n"
-                         "\n"
-                         "**קובייה 2:**\n"
-                         "* מספר 1: 2/24 = 8.3%\n"
-                         "* מספר 2: 2/24 = 8.3%\n"
-                         "* מספר 3: 2/24 = 8.3%\n"
-                         "* מספר 4: 3/24 = 12.5%\n"
-                         "* מספר 5: 6/24 = 25%\n"
-                         "* מספר 6: 9/24 = 37.5%\n"
-                         "\n"
-                         "התפלגות התוצאות בקובייה 2 מראה העדפה למספרים 5 ו-6 (במיוחד ל-6), ותדירות נמוכה יותר למספרים 1-4.\n"
-                         "זוהי סטייה מההסתברות התיאורטית של קובייה הוגנת (1/6 = 16.7% לכל מספר), ולכן ייתכן כי קוביה 2 מזוייפת."
-                         "\n"
-                         "יחד עם זאת, יש לשים לב כי לא באמת נוכל לקבוע זאת בוודאות וזוהי רק השערה שמסתמכת על 24 הטלות בלבד.")
-            elif status == "trying":
-                current_attempts = int(st.query_params.get("q4_dice_attempts", "0"))
-                remaining = 10 - current_attempts
-                st.error(f"לא מדויק. נסו שוב! נותרו {remaining} ניסיונות.")
-
-# Question 5
-with col1:
-    st.markdown("""
+    """,
+        answer=2,
+        explanation=(
+            "**הסבר:**\n"
+            "\n"
+            "נבדוק את התדירות היחסית של כל מספר בכל קובייה:\n"
+            "\n"
+            "**קובייה 1:**\n"
+            "* מספר 1: 4/24 = 16.7%\n"
+            "* מספר 2: 4/24 = 16.7%\n"
+            "* מספר 3: 4/24 = 16.7%\n"
+            "* מספר 4: 4/24 = 16.7%\n"
+            "* מספר 5: 4/24 = 16.7%\n"
+            "* מספר 6: 4/24 = 16.7%\n"
+            "\n"
+            "התפלגות התוצאות בקובייה 1 אחידה ותואמת את ההסתברות התיאורטית של 1/6 = 16.7% לכל מספר.\n"
+            "\n"
+            "**קובייה 2:**\n"
+            "* מספר 1: 2/24 = 8.3%\n"
+            "* מספר 2: 2/24 = 8.3%\n"
+            "* מספר 3: 2/24 = 8.3%\n"
+            "* מספר 4: 3/24 = 12.5%\n"
+            "* מספר 5: 6/24 = 25%\n"
+            "* מספר 6: 9/24 = 37.5%\n"
+            "\n"
+            "התפלגות התוצאות בקובייה 2 מראה העדפה למספרים 5 ו-6 (במיוחד ל-6), ותדירות נמוכה יותר למספרים 1-4.\n"
+            "זוהי סטייה מההסתברות התיאורטית של קובייה הוגנת (1/6 = 16.7% לכל מספר), ולכן ייתכן כי קוביה 2 מזוייפת."
+            "\n"
+            "יחד עם זאת, יש לשים לב כי לא באמת נוכל לקבוע זאת בוודאות וזוהי רק השערה שמסתמכת על 24 הטלות בלבד."
+        ),
+        unit="",
+        input_label="הכניסו את מספר הקוביה שייתכן כי היא מזוייפת:",
+        details=show_recorded_rolls,
+    ),
+    Question(
+        id="q5_dice",
+        prompt="""
         <div class='question-box'>
         <h3>שאלה 5️⃣</h3>
         נתון כי הקוביה שחשדתם שהינה מזוייפת בשאלה הקודמת אכן מזוייפת, ותוצאות ההטלה שלה מתפלגות בהתאם למה שקיבלתם בשאלה הקודמת.
@@ -753,115 +537,42 @@ with col1:
         \n
         כדי להגיע לתשובה, יש לבצע את כל החישובים באחוזים בדיוק של 2 ספרות אחרי הנקודה.
         </div>
-    """, unsafe_allow_html=True)
+    """,
+        answer=19.43,
+        explanation=(
+            "**הסבר:**"
+            "\n"
+            "נחשב לפי התדירויות היחסיות שחישבנו בשאלה הקודמת:"
+            "\n"
+            "* עבור סכום 6:"
+            "\n"
+            "  * תוצאה (1,5): P(1 בקובייה 1) × P(5 בקובייה 2) = 8.33% ×  25.00% = 2.08% \n"
+            "  *  תוצאה (2,4): P(2 בקובייה 1) × P(4 בקובייה 2) = 8.33% × 12.50% = 1.04% \n"
+            "  *  תוצאה (3,3): P(3 בקובייה 1) × P(3 בקובייה 2) = 8.33% × 8.33% = 0.69% \n"
+            "  *  תוצאה (4,2): P(4 בקובייה 1) × P(2 בקובייה 2) = 12.50% × 8.33% = 1.04% \n"
+            "  *  תוצאה (5,1): P(5 בקובייה 1) × P(1 בקובייה 2) = 25.00% × 8.33% = 2.08% \n"
+            "\n"
+            "  סכום ההסתברויות עבור סכום 6:"
+            "\n"
+            "  2.08% + 1.04% + 0.69% + 1.04% + 2.08% = 6.93% \n"
+            "\n"
+            "* עבור סכום 9:"
+            "\n"
+            "  *  תוצאה (3,6): P(3 בקובייה 1) × P(6 בקובייה 2) = 8.33% × 37.50% = 3.12% \n"
+            "  *  תוצאה (4,5): P(4 בקובייה 1) × P(5 בקובייה 2) = 12.50% × 25.00% = 3.13% \n"
+            "  *  תוצאה (5,4): P(5 בקובייה 1) × P(4 בקובייה 2) = 25.00% × 12.50% = 3.13% \n"
+            "  *  תוצאה (6,3): P(6 בקובייה 1) × P(3 בקובייה 2) = 37.50% × 8.33% = 3.12% \n"
+            "\n"
+            "  סכום ההסתברויות עבור סכום 9:"
+            "  3.12% + 3.13% + 3.13% + 3.12% = 12.50% \n"
+            "\n"
+            "סכום כל ההסתברויות: 6.93% + 12.50% = 19.43% \n"
+        ),
+    ),
+]
 
-    # Get the current attempt count from URL parameters
-    q5_attempt_count = int(st.query_params.get("q5_dice_attempts", "0"))
-
-    # Use a form for question 5
-    with st.form(key="question5_dice_form"):
-        q5_answer = st.number_input(
-            "הכניסו את תשובתכם באחוזים:",
-            min_value=0.0,
-            max_value=100.0,
-            step=0.1,
-            key="q5_dice_input"
-        )
-
-        # Submit button (disabled if max attempts reached)
-        q5_submit = st.form_submit_button(
-            "בדיקת תשובה",
-            disabled=(q5_attempt_count >= 10 or st.query_params.get("q5_dice_status") == "success")
-        )
+with col1:
+    render_questions(questions)
 
-        # Process form submission inside the form
-        if q5_submit:
-            # Check if answer is correct
-            is_correct = abs(q5_answer - correct_answers["q5_dice"]) < 0.1
-
-            if is_correct:
-                st.query_params["q5_dice_status"] = "success"
-            else:
-                # Increment attempt counter
-                q5_attempt_count += 1
-
-                # Update URL parameter
-                st.query_params["q5_dice_attempts"] = str(q5_attempt_count)
-
-                if q5_attempt_count >= 10:
-                    st.query_params["q5_dice_status"] = "failed"
-                else:
-                    st.query_params["q5_dice_status"] = "trying"
-
-        # Check if we need to show a previous result
-        if "q5_dice_status" in st.query_params:
-            status = st.query_params["q5_dice_status"]
-            if status == "success":
-                st.success(f"כל הכבוד! התשובה הנכונה היא {correct_answers['q5_dice']}%."
-                           "\n"
-                           "\n"
-                           "**הסבר:**"
-                           "\n"
-                           "נחשב לפי התדירויות היחסיות שחישבנו בשאלה הקודמת:"
-                           "\n"
-                           "* עבור סכום 6:"
-                           "\n"
-                           "  * תוצאה (1,5): P(1 בקובייה 1) × P(5 בקובייה 2) = 8.33% ×  25.00% = 2.08% \n"
-                           "  *  תוצאה (2,4): P(2 בקובייה 1) × P(4 בקובייה 2) = 8.33% × 12.50% = 1.04% \n"
-                           "  *  תוצאה (3,3): P(3 בקובייה 1) × P(3 בקובייה 2) = 8.33% × 8.33% = 0.69% \n"
-                           "  *  תוצאה (4,2): P(4 בקובייה 1) × P(2 בקובייה 2) = 12.50% × 8.33% = 1.04% \n"
-                           "  *  תוצאה (5,1): P(5 בקובייה 1) × P(1 בקובייה 2) = 25.00% × 8.33% = 2.08% \n"
-                           "\n"
-                           "  סכום ההסתברויות עבור סכום 6:"
-                           "\n"
-                           "  2.08% + 1.04% + 0.69% + 1.04% + 2.08% = 6.93% \n"
-                           "\n"
-                           "* עבור סכום 9:"
-                           "\n"
-                           "  *  תוצאה (3,6): P(3 בקובייה 1) × P(6 בקובייה 2) = 8.33% × 37.50% = 3.12% \n"
-                           "  *  תוצאה (4,5): P(4 בקובייה 1) × P(5 בקובייה 2) = 12.50% × 25.00% = 3.13% \n"
-                           "  *  תוצאה (5,4): P(5 בקובייה 1) × P(4 בקובייה 2) = 25.00% × 12.50% = 3.13% \n"
-                           "  *  תוצאה (6,3): P(6 בקובייה 1) × P(3 בקובייה 2) = 37.50% × 8.33% = 3.12% \n"
-                           "\n"
-                           "  סכום ההסתברויות עבור סכום 9:"
-                           "  3.12% + 3.13% + 3.13% + 3.12% = 12.50% \n"
-                           "\n"
-                           "סכום כל ההסתברויות: 6.93% + 12.50% = 19.43% \n"
-                           )
-            elif status == "failed":
-                st.error(f"כל הכבוד על הניסיון! בפעם הבאה תצליחו יותר. \n"
-                         "\n"
-                         f"התשובה הנכונה היא {correct_answers['q5_dice']}%. \n"
-                         "\n"
-                         "**הסבר:**"
-                         "\n"
-                         "נחשב לפי התדירויות היחסיות שחישבנו בשאלה הקודמת:"
-                         "\n"
-                         "* עבור סכום 6:"
-                         "\n"
-                         "  * תוצאה (1,5): P(1 בקובייה 1) × P(5 בקובייה 2) = 8.33% ×  25.00% = 2.08% \n"
-                         "  *  תוצאה (2,4): P(2 בקובייה 1) × P(4 בקובייה 2) = 8.33% × 12.50% = 1.04% \n"
-                         "  *  תוצאה (3,3): P(3 בקובייה 1) × P(3 בקובייה 2) = 8.33% × 8.33% = 0.69% \n"
-                         "  *  תוצאה (4,2): P(4 בקובייה 1) × P(2 בקובייה 2) = 12.50% × 8.33% = 1.04% \n"
-                         "  *  תוצאה (5,1): P(5 בקובייה 1) × P(1 בקובייה 2) = 25.00% × 8.33% = 2.08% \n"
-                         "\n"
-                         "  סכום ההסתברויות עבור סכום 6:"
-                         "\n"
-                         "  2.08% + 1.04% + 0.69% + 1.04% + 2.08% = 6.93% \n"
-                         "\n"
-                         "* עבור סכום 9:"
-                         "\n"
-                         "  *  תוצאה (3,6): P(3 בקובייה 1) × P(6 בקובייה 2) = 8.33% × 37.50% = 3.12% \n"
-                         "  *  תוצאה (4,5): P(4 בקובייה 1) × P(5 בקובייה 2) = 12.50% × 25.00% = 3.13% \n"
-                         "  *  תוצאה (5,4): P(5 בקובייה 1) × P(4 בקובייה 2) = 25.00% × 12.50% = 3.13% \n"
-                         "  *  תוצאה (6,3): P(6 בקובייה 1) × P(3 בקובייה 2) = 37.50% × 8.33% = 3.12% \n"
-                         "\n"
-                         "  סכום ההסתברויות עבור סכום 9:"
-                         "  3.12% + 3.13% + 3.13% + 3.12% = 12.50% \n"
-                         "\n"
-                         "סכום כל ההסתברויות: 6.93% + 12.50% = 19.43% \n"
-                         )
-            elif status == "trying":
-                current_attempts = int(st.query_params.get("q5_dice_attempts", "0"))
-                remaining = 10 - current_attempts
-                st.error(f"לא מדויק. נסו שוב! נותרו {remaining} ניסיונות.")
\ No newline at end of file
+profiler.lap("practice")
+profiler.finish()
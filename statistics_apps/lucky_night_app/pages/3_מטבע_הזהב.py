@@ -1,30 +1,29 @@
 import streamlit as st
 import plotly.graph_objects as go
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.patches import Circle
-import math
-import os
-import random
-import pandas as pd
-from utils.helper_functions import setup_page, under_development_page
+from utils.assets import show_logo
+from utils.helper_functions import setup_page
+from lucky_night_core.coin_flips import FlipHistory, flip_coins, flips_until_heads, negative_binomial_pmf, run_lengths
+from utils.profiling import PageProfiler
+from utils.questions import Question, render_questions
+from utils.session_rng import game_rng, show_seed_panel
 
 
 # --- Helper Functions ---
 
 def reset_game():
     """Reset all game state variables."""
-    st.session_state.game_history_coin = []
+    st.session_state.game_history_coin = FlipHistory()
     st.session_state.score = 0
     st.session_state.flip_count = 0
 
 
-def flip_coin():
+def coin_face(is_heads):
     """
-    Simulate a coin flip.
+    Name the side of the coin of a flip.
     Returns: str - "עץ" or "פלי"
     """
-    return random.choice(["עץ", "פלי"])  # Return string directly instead of 0/1
+    return "עץ" if is_heads else "פלי"
 
 def create_coin_svg(result):
     """
@@ -57,29 +56,26 @@ def calculate_flip_distribution(history):
     """
     Calculate the distribution of coin flip results.
     Args:
-        history (list): List of dictionaries containing flip history
+        history (FlipHistory): The flip history
     Returns:
         tuple: Lists of results and their counts
     """
-    df = pd.DataFrame(history)
-    result_counts = df['תוצאה'].value_counts()
-    return result_counts.index.tolist(), result_counts.values.tolist()
+    return ["עץ", "פלי"], [history.heads_count, len(history) - history.heads_count]
 
 
 def calculate_success_rate(history):
     """
     Calculate the success rate of coin flips.
     Args:
-        history (list): List of dictionaries containing flip history
+        history (FlipHistory): The flip history
     Returns:
         dict: Success and failure percentages
     """
     if not history:
         return {'הצלחה': 0, 'כישלון': 0}
 
-    df = pd.DataFrame(history)
-    total_flips = len(df)
-    successes = len(df[df['תוצאה'] == 'עץ'])
+    total_flips = len(history)
+    successes = history.heads_count
 
     success_rate = (successes / total_flips) * 100
     failure_rate = 100 - success_rate
@@ -90,14 +86,13 @@ def calculate_success_rate(history):
     }
 
 # --- Page Content ---
+profiler = PageProfiler("coin")
 st.set_page_config(layout="wide")
 setup_page()
+profiler.lap("setup_page")
 
 # -- Sidebar --
-current_dir = os.path.dirname(os.path.abspath(__file__))
-
-logo_path = os.path.join(current_dir, 'bgu_logo.png')
-st.sidebar.image(logo_path)
+show_logo()
 st.sidebar.markdown("""
 
         <div style="text-align: center;">
@@ -105,9 +100,12 @@ st.sidebar.markdown("""
             <h4>362.1.3071</h4>
         </div>
     """, unsafe_allow_html=True)
+show_seed_panel()
 
 st.markdown('<div class="top-header"><h1>מטבע הזהב 🪙</h1></div>', unsafe_allow_html=True)
 
+profiler.lap("sidebar")
+
 # --- game explanation ---
 st.markdown('<div class="section-header"><h2>🎮 המשחק</h2></div>', unsafe_allow_html=True)
 
@@ -129,13 +127,15 @@ with col1:
         </div>
     """, unsafe_allow_html=True)
 
+profiler.lap("game explanation")
+
 # --- game-zone ---
 col1, col2 = st.columns([4, 1])
 
 with col1:
     # Initialize session state for game history and score
     if 'game_history_coin' not in st.session_state:
-        st.session_state.game_history_coin = []
+        st.session_state.game_history_coin = FlipHistory()
     if 'score' not in st.session_state:
         st.session_state.score = 0
     if 'flip_count' not in st.session_state:
@@ -145,9 +145,9 @@ with col1:
 
     with col_flips_input:
         num_flips = st.number_input(
-            "מספר הטלות (1-100):",
+            "מספר הטלות (1-1,000,000):",
             min_value=1,
-            max_value=100,
+            max_value=1_000_000,
             value=1,
             step=1
         )
@@ -161,19 +161,14 @@ with col1:
 
     if flip_button:
         st.markdown('ההטלה האחרונה:')
-        for _ in range(num_flips):
-            st.session_state.flip_count += 1
-            coin = flip_coin()
-            is_lucky = coin == "עץ"  # Compare with string instead of number
+        with profiler.section("game-zone/simulate"):
+            flips = flip_coins(num_flips, seed=game_rng("coin"))
+        st.session_state.flip_count += num_flips
+        st.session_state.score += int(np.count_nonzero(flips))
 
-            if is_lucky:
-                st.session_state.score += 1
-
-            # Add flip to history
-            st.session_state.game_history_coin.append({
-                'מספר הטלה': st.session_state.flip_count,
-                'תוצאה': coin  # Use coin directly since it's already the correct string
-            })
+        # Add the whole batch to history
+        st.session_state.game_history_coin.extend(flips)
+        coin = coin_face(flips[-1])
 
         # Display current flip with coin visualization (showing only the last flip)
         col_coin, col_score, col_space = st.columns([1, 1, 1])
@@ -216,15 +211,68 @@ with col1:
                     showlegend=False,
                     height=500,
                     yaxis=dict(
-                        dtick=50  # Set y-axis tick interval to 1
+                        dtick=50 if max(counts) <= 500 else None  # Fixed ticks only while the bars are short
                     ),
                     xaxis=dict(
                         dtick=1  # Set x-axis tick interval to 1
                     )
                 )
-                st.plotly_chart(fig, use_container_width=True)
+                with profiler.section("game-zone/plotly_chart"):
+                    st.plotly_chart(fig, width="stretch")
+
+    # Waiting-time analytics over the whole history
+    if st.session_state.game_history_coin:
+        all_flips = st.session_state.game_history_coin.flips
+        run_values, run_lengths_all = run_lengths(all_flips)
+        longest_heads = int(run_lengths_all[run_values].max()) if run_values.any() else 0
+        st.markdown(f"רצף העצים הארוך ביותר: {longest_heads}")
+
+        col_geometric, col_negative_binomial = st.columns(2)
+        with col_geometric:
+            st.markdown("מספר ההטלות עד לעץ הראשון (התפלגות גיאומטרית):")
+        with col_negative_binomial:
+            m_heads = st.slider("מספר ההטלות עד לעץ ה-m (התפלגות בינומית שלילית), m:",
+                                min_value=2, max_value=10, value=3)
+
+        for col, r in ((col_geometric, 1), (col_negative_binomial, m_heads)):
+            waits = flips_until_heads(all_flips, r)
+            with col:
+                if len(waits) == 0:
+                    st.write("עדיין אין מספיק הטלות.")
+                    continue
+
+                observed = np.bincount(waits)
+                x_values = np.arange(r, len(observed))
+                expected_counts = negative_binomial_pmf(x_values, r, 0.5) * len(waits)
 
+                fig = go.Figure(data=[
+                    go.Bar(x=x_values, y=observed[r:], name="מספר פעמים")
+                ])
+                fig.add_trace(
+                    go.Scatter(
+                        x=x_values,
+                        y=expected_counts,
+                        mode='lines+markers',
+                        name='התפלגות תיאורטית',
+                        line=dict(color='red', width=2)
+                    )
+                )
+                fig.update_layout(
+                    xaxis_title="מספר הטלות",
+                    yaxis_title="מספר פעמים",
+                    legend=dict(
+                        orientation="h",
+                        yanchor="bottom",
+                        y=1.02,
+                        xanchor="right",
+                        x=1
+                    ),
+                    height=400
+                )
+                with profiler.section("game-zone/plotly_chart"):
+                    st.plotly_chart(fig, width="stretch")
 
+profiler.lap("game-zone")
 
 
 # --- Theory Section ---
@@ -292,6 +340,8 @@ with col1:
         </div>
     """, unsafe_allow_html=True)
 
+profiler.lap("theory")
+
 # --- Practice Section ---
 st.markdown('<div class="section-header"><h2>✍️ בואו נתרגל!</h2></div>', unsafe_allow_html=True)
 
@@ -307,523 +357,162 @@ with col1:
         </div>
     """, unsafe_allow_html=True)
 
-# Definition of correct answers
-correct_answers_coin = {
-    "q1": 31.25,
-    "q2": 22.66,
-    "q3": 2.92,
-    "q4": 0.37,
-    "q5": 6.25
-}
-
-# Question 1
-with col1:
-    st.markdown("""
+# Practice questions
+questions = [
+    Question(
+        id="q1_coin",
+        prompt="""
         <div class='question-box'>
         <h3>שאלה 1️⃣</h3>
          מה ההסתברות לזכות בנקודה בדיוק פעמיים מתוך 5 הטלות?
         </div>
-    """, unsafe_allow_html=True)
-
-    # Get the current attempt count from URL parameters
-    q1_attempt_count = int(st.query_params.get("q1_attempts_coin", "0"))
-
-    # Use a form for question 1
-    with st.form(key="question1_coin_form"):
-        q1_answer = st.number_input(
-            "הכניסו את תשובתכם באחוזים:",
-            min_value=0.0,
-            max_value=100.0,
-            step=0.1,
-            key="q1_coin_input"
-        )
-
-        # Submit button (disabled if max attempts reached)
-        q1_submit = st.form_submit_button(
-            "בדיקת תשובה",
-            disabled=(q1_attempt_count >= 10 or st.query_params.get("q1_status_coin") == "success")
-        )
-
-        # Process form submission inside the form
-        if q1_submit:
-            # Check if answer is correct
-            is_correct = abs(q1_answer - correct_answers_coin["q1"]) < 0.1
-
-            if is_correct:
-                st.query_params["q1_status_coin"] = "success"
-            else:
-                # Increment attempt counter
-                q1_attempt_count += 1
-
-                # Update URL parameter
-                st.query_params["q1_attempts_coin"] = str(q1_attempt_count)
-
-                if q1_attempt_count >= 10:
-                    st.query_params["q1_status_coin"] = "failed"
-                else:
-                    st.query_params["q1_status_coin"] = "trying"
-
-        # Check if we need to show a previous result
-        if "q1_status_coin" in st.query_params:
-            status = st.query_params["q1_status_coin"]
-            if status == "success":
-                st.success(
-                    f"כל הכבוד! התשובה הנכונה היא {correct_answers_coin['q1']}%.\n"
-                    "\n"
-                    "**הסבר:** זוהי שאלה על התפלגות בינומית.\n"
-                    "אנחנו מחפשים את ההסתברות לקבל בדיוק 2 הצלחות מתוך 5 ניסיונות.\n"
-                    "\n"
-                    "נגדיר את המשתנה המקרי X כמספר ההצלחות (מספר הפעמים שיתקבל 'עץ') מתוך 5 ניסיונות.\n"
-                    "בהתחשב בכך שההטלות בלתי תלויות, X מתפלג לפי התפלגות בינומית:\n"
-                    "\n"
-                    "X ~ B(5, 0.5)\n"
-                    "\n"
-                    "כלומר, מספר ההצלחות מתוך 5 ניסיונות, כאשר ההסתברות להצלחה בהטלה בודדת היא 0.5.\n"
-                    "\n"
-                    "נשתמש בנוסחה להתפלגות בינומית: P(X=k) = C(n,k) * p^k * (1-p)^(n-k)\n"
-                    "כאשר:\n"
-                    "- n = 5 (מספר ההטלות)\n"
-                    "- k = 2 (מספר ההצלחות הרצוי)\n"
-                    "- p = 0.5 (הסתברות להצלחה בהטלה בודדת)\n"
-                    "\n"
-                    "P(X=2) = C(5,2) * (0.5)^2 * (0.5)^3\n"
-                    "= 10 * 0.25 * 0.125\n"
-                    "= 0.3125 = 31.25%\n"
-                )
-            elif status == "failed":
-                st.error(
-                    f"כל הכבוד על הניסיון! בפעם הבאה תצליחו יותר.\n"
-                    "\n"
-                    f"התשובה הנכונה היא {correct_answers_coin['q1']}%.\n"
-                    "\n"
-                    "**הסבר:** זוהי שאלה על התפלגות בינומית.\n"
-                    "אנחנו מחפשים את ההסתברות לקבל בדיוק 2 הצלחות מתוך 5 ניסיונות.\n"
-                    "\n"
-                    "נגדיר את המשתנה המקרי X כמספר ההצלחות (מספר הפעמים שיתקבל 'עץ') מתוך 5 ניסיונות.\n"
-                    "בהתחשב בכך שההטלות בלתי תלויות, X מתפלג לפי התפלגות בינומית:\n"
-                    "\n"
-                    "X ~ B(5, 0.5)\n"
-                    "\n"
-                    "כלומר, מספר ההצלחות מתוך 5 ניסיונות, כאשר ההסתברות להצלחה בהטלה בודדת היא 0.5.\n"
-                    "\n"
-                    "נשתמש בנוסחה להתפלגות בינומית: P(X=k) = C(n,k) * p^k * (1-p)^(n-k)\n"
-                    "כאשר:\n"
-                    "- n = 5 (מספר ההטלות)\n"
-                    "- k = 2 (מספר ההצלחות הרצוי)\n"
-                    "- p = 0.5 (הסתברות להצלחה בהטלה בודדת)\n"
-                    "\n"
-                    "P(X=2) = C(5,2) * (0.5)^2 * (0.5)^3\n"
-                    "= 10 * 0.25 * 0.125\n"
-                    "= 0.3125 = 31.25%\n"
-                )
-            elif status == "trying":
-                current_attempts = int(st.query_params.get("q1_attempts_coin", "0"))
-                remaining = 10 - current_attempts
-                st.error(f"לא מדויק. נסו שוב! נותרו {remaining} ניסיונות.")
-
-# Question 2
-with col1:
-    st.markdown("""
+    """,
+        answer=31.25,
+        explanation=(
+            "**הסבר:** זוהי שאלה על התפלגות בינומית.\n"
+            "אנחנו מחפשים את ההסתברות לקבל בדיוק 2 הצלחות מתוך 5 ניסיונות.\n"
+            "\n"
+            "נגדיר את המשתנה המקרי X כמספר ההצלחות (מספר הפעמים שיתקבל 'עץ') מתוך 5 ניסיונות.\n"
+            "בהתחשב בכך שההטלות בלתי תלויות, X מתפלג לפי התפלגות בינומית:\n"
+            "\n"
+            "X ~ B(5, 0.5)\n"
+            "\n"
+            "כלומר, מספר ההצלחות מתוך 5 ניסיונות, כאשר ההסתברות להצלחה בהטלה בודדת היא 0.5.\n"
+            "\n"
+            "נשתמש בנוסחה להתפלגות בינומית: P(X=k) = C(n,k) * p^k * (1-p)^(n-k)\n"
+            "כאשר:\n"
+            "- n = 5 (מספר ההטלות)\n"
+            "- k = 2 (מספר ההצלחות הרצוי)\n"
+            "- p = 0.5 (הסתברות להצלחה בהטלה בודדת)\n"
+            "\n"
+            "P(X=2) = C(5,2) * (0.5)^2 * (0.5)^3\n"
+            "= 10 * 0.25 * 0.125\n"
+            "= 0.3125 = 31.25%\n"
+        ),
+    ),
+    Question(
+        id="q2_coin",
+        prompt="""
         <div class='question-box'>
         <h3>שאלה 2️⃣</h3>
         מה ההסתברות שתזכו ב-5 נקודות לפחות כאשר תטילו את המטבע 7 פעמים?
         </div>
-    """, unsafe_allow_html=True)
-
-    # Get the current attempt count from URL parameters
-    q2_attempt_count = int(st.query_params.get("q2_attempts_coin", "0"))
-
-    # Use a form for question 2
-    with st.form(key="question2_coin_form"):
-        q2_answer = st.number_input(
-            "הכניסו את תשובתכם באחוזים:",
-            min_value=0.0,
-            max_value=100.0,
-            step=0.1,
-            key="q2_coin_input"
-        )
-
-        # Submit button (disabled if max attempts reached)
-        q2_submit = st.form_submit_button(
-            "בדיקת תשובה",
-            disabled=(q2_attempt_count >= 10 or st.query_params.get("q2_status_coin") == "success")
-        )
-
-        # Process form submission inside the form
-        if q2_submit:
-            # Check if answer is correct
-            is_correct = abs(q2_answer - correct_answers_coin["q2"]) < 0.1
-
-            if is_correct:
-                st.query_params["q2_status_coin"] = "success"
-            else:
-                # Increment attempt counter
-                q2_attempt_count += 1
-
-                # Update URL parameter
-                st.query_params["q2_attempts_coin"] = str(q2_attempt_count)
-
-                if q2_attempt_count >= 10:
-                    st.query_params["q2_status_coin"] = "failed"
-                else:
-                    st.query_params["q2_status_coin"] = "trying"
-
-        # Check if we need to show a previous result
-        if "q2_status_coin" in st.query_params:
-            status = st.query_params["q2_status_coin"]
-            if status == "success":
-                st.success(
-                    f"כל הכבוד! התשובה הנכונה היא {correct_answers_coin['q2']}%.\n"
-                    "\n"
-                    "**הסבר:** זוהי שאלה על התפלגות בינומית מצטברת.\n"
-                    "אנחנו מחפשים את ההסתברות לקבל 5 או יותר הצלחות מתוך 7 ניסיונות.\n"
-                    "\n"
-                    "המשתנה המקרי X מתפלג לפי התפלגות בינומית:\n"
-                    "X ~ B(7, 0.5)\n"
-                    "\n"
-                    "ההסתברות לקבל לפחות 5 נקודות מתוך 7 הטלות הינה:"
-                    "\n"
-                    "\n"
-                    "P(X≥5) = P(X=5) + P(X=6) + P(X=7)\n"
-                    " ,כאשר:\n"
-                    "- n = 7 (מספר ההטלות)\n"
-                    "- p = 0.5 (הסתברות להצלחה בהטלה בודדת)\n"
-                    "\n"
-                    "P(X=5) = C(7,5) * (0.5)^5 * (0.5)^2 = 0.1641"
-                    "\n\n"
-                    "P(X=6) = C(7,6) * (0.5)^6 * (0.5)^1 = 0.0547"
-                    "\n\n"
-                    "P(X=7) = C(7,7) * (0.5)^7 * (0.5)^0 = 0.0078"
-                    "\n\n"
-                    "סכום כל ההסתברויות: P(X ≥ 5) = 0.1641 + 0.0547 + 0.0078 = 0.2266\n"
-                    "\n"
-                    "ההסתברות לזכות ב-5 נקודות לפחות היא 0.2266, או **22.66%**."
-                )
-            elif status == "failed":
-                st.error(
-                    f"כל הכבוד על הניסיון! בפעם הבאה תצליחו יותר.\n"
-                    "\n"
-                    f"התשובה הנכונה היא {correct_answers_coin['q2']}%.\n"
-                    "\n"
-                    "**הסבר:** זוהי שאלה על התפלגות בינומית מצטברת.\n"
-                    "אנחנו מחפשים את ההסתברות לקבל 5 או יותר הצלחות מתוך 7 ניסיונות.\n"
-                    "\n"
-                    "המשתנה המקרי X מתפלג לפי התפלגות בינומית:\n"
-                    "X ~ B(7, 0.5)\n"
-                    "\n"
-                    "ההסתברות לקבל לפחות 5 נקודות מתוך 7 הטלות הינה:"
-                    "\n"
-                    "\n"
-                    "P(X≥5) = P(X=5) + P(X=6) + P(X=7)\n"
-                    " ,כאשר:\n"
-                    "- n = 7 (מספר ההטלות)\n"
-                    "- p = 0.5 (הסתברות להצלחה בהטלה בודדת)\n"
-                    "\n"
-                    "P(X=5) = C(7,5) * (0.5)^5 * (0.5)^2 = 0.1641"
-                    "\n\n"
-                    "P(X=6) = C(7,6) * (0.5)^6 * (0.5)^1 = 0.0547"
-                    "\n\n"
-                    "P(X=7) = C(7,7) * (0.5)^7 * (0.5)^0 = 0.0078"
-                    "\n\n"
-                    "סכום כל ההסתברויות: P(X ≥ 5) = 0.1641 + 0.0547 + 0.0078 = 0.2266\n"
-                    "\n"
-                    "ההסתברות לזכות ב-5 נקודות לפחות היא 0.2266, או **22.66%**."
-                )
-            elif status == "trying":
-                current_attempts = int(st.query_params.get("q2_attempts_coin", "0"))
-                remaining = 10 - current_attempts
-                st.error(f"לא מדויק. נסו שוב! נותרו {remaining} ניסיונות.")
-
-# Question 3
-with col1:
-    st.markdown("""
+    """,
+        answer=22.66,
+        explanation=(
+            "**הסבר:** זוהי שאלה על התפלגות בינומית מצטברת.\n"
+            "אנחנו מחפשים את ההסתברות לקבל 5 או יותר הצלחות מתוך 7 ניסיונות.\n"
+            "\n"
+            "המשתנה המקרי X מתפלג לפי התפלגות בינומית:\n"
+            "X ~ B(7, 0.5)\n"
+            "\n"
+            "ההסתברות לקבל לפחות 5 נקודות מתוך 7 הטלות הינה:"
+            "\n"
+            "\n"
+            "P(X≥5) = P(X=5) + P(X=6) + P(X=7)\n"
+            " ,כאשר:\n"
+            "- n = 7 (מספר ההטלות)\n"
+            "- p = 0.5 (הסתברות להצלחה בהטלה בודדת)\n"
+            "\n"
+            "P(X=5) = C(7,5) * (0.5)^5 * (0.5)^2 = 0.1641"
+            "\n\n"
+            "P(X=6) = C(7,6) * (0.5)^6 * (0.5)^1 = 0.0547"
+            "\n\n"
+            "P(X=7) = C(7,7) * (0.5)^7 * (0.5)^0 = 0.0078"
+            "\n\n"
+            "סכום כל ההסתברויות: P(X ≥ 5) = 0.1641 + 0.0547 + 0.0078 = 0.2266\n"
+            "\n"
+            "ההסתברות לזכות ב-5 נקודות לפחות היא 0.2266, או **22.66%**."
+        ),
+    ),
+    Question(
+        id="q3_coin",
+        prompt="""
         <div class='question-box'>
         <h3>שאלה 3️⃣</h3>
         כעת קיבלתם מטבע לא הוגן שמציג עץ רק ב-30% מהפעמים.
         מה ההסתברות שתצטרכו בדיוק 8 הטלות כדי לקבל 5 נקודות?
         </div>
-    """, unsafe_allow_html=True)
-
-    # Get the current attempt count from URL parameters
-    q3_attempt_count = int(st.query_params.get("q3_attempts_coin", "0"))
-
-    # Use a form for question 3
-    with st.form(key="question3_coin_form"):
-        q3_answer = st.number_input(
-            "הכניסו את תשובתכם באחוזים:",
-            min_value=0.0,
-            max_value=100.0,
-            step=0.1,
-            key="q3_coin_input"
-        )
-
-        # Submit button (disabled if max attempts reached)
-        q3_submit = st.form_submit_button(
-            "בדיקת תשובה",
-            disabled=(q3_attempt_count >= 10 or st.query_params.get("q3_status_coin") == "success")
-        )
-
-        # Process form submission inside the form
-        if q3_submit:
-            # Check if answer is correct
-            is_correct = abs(q3_answer - correct_answers_coin["q3"]) < 0.1
-
-            if is_correct:
-                st.query_params["q3_status_coin"] = "success"
-            else:
-                # Increment attempt counter
-                q3_attempt_count += 1
-
-                # Update URL parameter
-                st.query_params["q3_attempts_coin"] = str(q3_attempt_count)
-
-                if q3_attempt_count >= 10:
-                    st.query_params["q3_status_coin"] = "failed"
-                else:
-                    st.query_params["q3_status_coin"] = "trying"
-
-        # Check if we need to show a previous result
-        if "q3_status_coin" in st.query_params:
-            status = st.query_params["q3_status_coin"]
-            if status == "success":
-                st.success(
-                    f"כל הכבוד! התשובה הנכונה היא {correct_answers_coin['q3']}%.\n"
-                    "\n"
-                    "**הסבר:** זוהי שאלה על התפלגות בינומית שלילית.\n"
-                    "אנחנו מחפשים את ההסתברות שיידרשו בדיוק 8 ניסיונות כדי לקבל בדיוק 5 הצלחות (5 נקודות).\n"
-                    "\n"
-                    "המשתנה המקרי X מתפלג לפי התפלגות בינומית שלילית עם פרמטרים:\n"
-                    "X ~ NB(5, 0.3)\n"
-                    "כאשר n = 8 (מספר הניסיונות הכוללים) ו- p = 0.3 (הסתברות להצלחה).\n"
-                    "\n"
-                    "נחשב את ההסתברות לקבל בדיוק 5 הצלחות מתוך 8 ניסיונות:\n"
-                    "\n"
-                    "P(X = 8) = C(8 - 1, 5 - 1) * (0.3)^5 * (0.7)^3 = 0.0292\n"
-                    "\n"
-                    "ההסתברות שיידרשו בדיוק 8 ניסיונות כדי לקבל 5 נקודות היא 0.0292, או **2.92%**."
-                )
-            elif status == "failed":
-                st.error(
-                    f"כל הכבוד על הניסיון! בפעם הבאה תצליחו יותר.\n"
-                    "\n"
-                    f"התשובה הנכונה היא {correct_answers_coin['q3']}%.\n"
-                    "\n"
-                    "**הסבר:** זוהי שאלה על התפלגות בינומית שלילית.\n"
-                    "אנחנו מחפשים את ההסתברות שיידרשו בדיוק 8 ניסיונות כדי לקבל בדיוק 5 הצלחות (5 נקודות).\n"
-                    "\n"
-                    "המשתנה המקרי X מתפלג לפי התפלגות בינומית שלילית עם פרמטרים:\n"
-                    "X ~ NB(5, 0.3)\n"
-                    "כאשר n = 8 (מספר הניסיונות הכוללים) ו- p = 0.3 (הסתברות להצלחה).\n"
-                    "\n"
-                    "נחשב את ההסתברות לקבל בדיוק 5 הצלחות מתוך 8 ניסיונות:\n"
-                    "\n"
-                    "P(X = 8) = C(8 - 1, 5 - 1) * (0.3)^5 * (0.7)^3 = 0.0292\n"
-                    "\n"
-                    "ההסתברות שיידרשו בדיוק 8 ניסיונות כדי לקבל 5 נקודות היא 0.0292, או **2.92%**."
-                )
-            elif status == "trying":
-                current_attempts = int(st.query_params.get("q3_attempts_coin", "0"))
-                remaining = 10 - current_attempts
-                st.error(f"לא מדויק. נסו שוב! נותרו {remaining} ניסיונות.")
-
-# Question 4
-with col1:
-    st.markdown("""
+    """,
+        answer=2.92,
+        explanation=(
+            "**הסבר:** זוהי שאלה על התפלגות בינומית שלילית.\n"
+            "אנחנו מחפשים את ההסתברות שיידרשו בדיוק 8 ניסיונות כדי לקבל בדיוק 5 הצלחות (5 נקודות).\n"
+            "\n"
+            "המשתנה המקרי X מתפלג לפי התפלגות בינומית שלילית עם פרמטרים:\n"
+            "X ~ NB(5, 0.3)\n"
+            "כאשר n = 8 (מספר הניסיונות הכוללים) ו- p = 0.3 (הסתברות להצלחה).\n"
+            "\n"
+            "נחשב את ההסתברות לקבל בדיוק 5 הצלחות מתוך 8 ניסיונות:\n"
+            "\n"
+            "P(X = 8) = C(8 - 1, 5 - 1) * (0.3)^5 * (0.7)^3 = 0.0292\n"
+            "\n"
+            "ההסתברות שיידרשו בדיוק 8 ניסיונות כדי לקבל 5 נקודות היא 0.0292, או **2.92%**."
+        ),
+    ),
+    Question(
+        id="q4_coin",
+        prompt="""
         <div class='question-box'>
         <h3>שאלה 4️⃣</h3>
         מטילים את אותו מטבע לא הוגן 15 פעמים.
         מה הסיכוי שתקבלו בין 10 ל-12 נקודות?
         </div>
-    """, unsafe_allow_html=True)
-
-    # Get the current attempt count from URL parameters
-    q4_attempt_count = int(st.query_params.get("q4_attempts_coin", "0"))
-
-    # Use a form for question 4
-    with st.form(key="question4_coin_form"):
-        q4_answer = st.number_input(
-            "הכניסו את תשובתכם באחוזים:",
-            min_value=0.0,
-            max_value=100.0,
-            step=0.1,
-            key="q4_coin_input"
-        )
-
-        # Submit button (disabled if max attempts reached)
-        q4_submit = st.form_submit_button(
-            "בדיקת תשובה",
-            disabled=(q4_attempt_count >= 10 or st.query_params.get("q4_status_coin") == "success")
-        )
-
-        # Process form submission inside the form
-        if q4_submit:
-            # Check if answer is correct
-            is_correct = abs(q4_answer - correct_answers_coin["q4"]) < 0.1
-
-            if is_correct:
-                st.query_params["q4_status_coin"] = "success"
-            else:
-                # Increment attempt counter
-                q4_attempt_count += 1
-
-                # Update URL parameter
-                st.query_params["q4_attempts_coin"] = str(q4_attempt_count)
-
-                if q4_attempt_count >= 10:
-                    st.query_params["q4_status_coin"] = "failed"
-                else:
-                    st.query_params["q4_status_coin"] = "trying"
-
-        # Check if we need to show a previous result
-        if "q4_status_coin" in st.query_params:
-            status = st.query_params["q4_status_coin"]
-            if status == "success":
-                st.success(
-                    f"כל הכבוד! התשובה הנכונה היא {correct_answers_coin['q4']}%.\n"
-                    "\n"
-                    "**הסבר:** זוהי שאלה על התפלגות בינומית.\n"
-                    "אנחנו מחפשים את ההסתברות לקבל בין 10 ל-12 הצלחות מתוך 15 ניסיונות.\n"
-                    "\n"
-                    "המשתנה המקרי X מתפלג לפי התפלגות בינומית עם פרמטרים:\n"
-                    "X ~ B(15, 0.3)\n"
-                    "כאשר n = 15 (מספר ההטלות) ו- p = 0.3 (הסתברות להצלחה).\n"
-                    "\n"
-                    "נחשב את ההסתברויות עבור 10, 11 ו-12 הצלחות:\n"
-                    "\n"
-                    "P(X=10) = C(15, 10) * (0.3)^10 * (0.7)^5 = 0.0030\n"
-                    "\n"
-                    "P(X=11) = C(15, 11) * (0.3)^11 * (0.7)^4 = 0.0006\n"
-                    "\n"
-                    "P(X=12) = C(15, 12) * (0.3)^12 * (0.7)^3 = 0.0001\n"
-                    "\n"
-                    "הסכום הכולל: P(10 ≤ X ≤ 12) = 0.0030 + 0.0006 + 0.0001 = 0.0037\n"
-                    "\n"
-                    "ההסתברות לקבל בין 10 ל-12 נקודות היא 0.0037, או **0.37%**."
-                )
-            elif status == "failed":
-                st.error(
-                    f"כל הכבוד על הניסיון! בפעם הבאה תצליחו יותר.\n"
-                    "\n"
-                    f"התשובה הנכונה היא {correct_answers_coin['q4']}%.\n"
-                    "\n"
-                    "**הסבר:** זוהי שאלה על התפלגות בינומית.\n"
-                    "אנחנו מחפשים את ההסתברות לקבל בין 10 ל-12 הצלחות מתוך 15 ניסיונות.\n"
-                    "\n"
-                    "המשתנה המקרי X מתפלג לפי התפלגות בינומית עם פרמטרים:\n"
-                    "X ~ B(15, 0.3)\n"
-                    "כאשר n = 15 (מספר ההטלות) ו- p = 0.3 (הסתברות להצלחה).\n"
-                    "\n"
-                    "נחשב את ההסתברויות עבור 10, 11 ו-12 הצלחות:\n"
-                    "\n"
-                    "P(X=10) = C(15, 10) * (0.3)^10 * (0.7)^5 = 0.0030\n"
-                    "\n"
-                    "P(X=11) = C(15, 11) * (0.3)^11 * (0.7)^4 = 0.0006\n"
-                    "\n"
-                    "P(X=12) = C(15, 12) * (0.3)^12 * (0.7)^3 = 0.0001\n"
-                    "\n"
-                    "הסכום הכולל: P(10 ≤ X ≤ 12) = 0.0030 + 0.0006 + 0.0001 = 0.0037\n"
-                    "\n"
-                    "ההסתברות לקבל בין 10 ל-12 נקודות היא 0.0037, או **0.37%**."
-                )
-            elif status == "trying":
-                current_attempts = int(st.query_params.get("q4_attempts_coin", "0"))
-                remaining = 10 - current_attempts
-                st.error(f"לא מדויק. נסו שוב! נותרו {remaining} ניסיונות.")
-
-# Question 5
-with col1:
-    st.markdown("""
+    """,
+        answer=0.37,
+        explanation=(
+            "**הסבר:** זוהי שאלה על התפלגות בינומית.\n"
+            "אנחנו מחפשים את ההסתברות לקבל בין 10 ל-12 הצלחות מתוך 15 ניסיונות.\n"
+            "\n"
+            "המשתנה המקרי X מתפלג לפי התפלגות בינומית עם פרמטרים:\n"
+            "X ~ B(15, 0.3)\n"
+            "כאשר n = 15 (מספר ההטלות) ו- p = 0.3 (הסתברות להצלחה).\n"
+            "\n"
+            "נחשב את ההסתברויות עבור 10, 11 ו-12 הצלחות:\n"
+            "\n"
+            "P(X=10) = C(15, 10) * (0.3)^10 * (0.7)^5 = 0.0030\n"
+            "\n"
+            "P(X=11) = C(15, 11) * (0.3)^11 * (0.7)^4 = 0.0006\n"
+            "\n"
+            "P(X=12) = C(15, 12) * (0.3)^12 * (0.7)^3 = 0.0001\n"
+            "\n"
+            "הסכום הכולל: P(10 ≤ X ≤ 12) = 0.0030 + 0.0006 + 0.0001 = 0.0037\n"
+            "\n"
+            "ההסתברות לקבל בין 10 ל-12 נקודות היא 0.0037, או **0.37%**."
+        ),
+    ),
+    Question(
+        id="q5_coin",
+        prompt="""
         <div class='question-box'>
         <h3>שאלה 5️⃣</h3>
         נחזור למטבע ההוגן.
         מה ההסתברות שתצליחו לזכות בנקודה רק אחרי 4 הטלות?
         </div>
-    """, unsafe_allow_html=True)
-
-    # Get the current attempt count from URL parameters
-    q5_attempt_count = int(st.query_params.get("q5_attempts_coin", "0"))
-
-    # Use a form for question 5
-    with st.form(key="question5_coin_form"):
-        q5_answer = st.number_input(
-            "הכניסו את תשובתכם באחוזים:",
-            min_value=0.0,
-            max_value=100.0,
-            step=0.1,
-            key="q5_coin_input"
-        )
+    """,
+        answer=6.25,
+        explanation=(
+            "**הסבר:** זוהי שאלה על הסתברות גיאומטרית.\n"
+            "ההסתברות הגיאומטרית עוסקת במצבים שבהם אנחנו רוצים לדעת מה ההסתברות לקבל את ההצלחה הראשונה בהטלה ה-k.\n"
+            "\n"
+            "במקרה שלנו, אנחנו מחפשים את ההסתברות שההצלחה הראשונה (כלומר, 'עץ') תקרה בהטלה ה-4.\n"
+            "\n"
+            "הנוסחה להסתברות גיאומטרית היא:\n"
+            "P(X = k) = (1 - p)^(k-1) * p\n"
+            "כאשר:\n"
+            "- p = 0.5 (ההסתברות להצלחה בהטלה)\n"
+            "- k = 4 (ההטלה הראשונה בה נקבל 'עץ')\n"
+            "\n"
+            "נחשב את ההסתברות:\n"
+            "P(X = 4) = (1 - 0.5)^(4-1) * 0.5 = (0.5)^3 * 0.5 = 0.0625\n"
+            "\n"
+            "ההסתברות לקבל 'עץ' לראשונה בהטלה ה-4 היא 0.0625, או **6.25%**."
+        ),
+    ),
+]
 
-        # Submit button (disabled if max attempts reached)
-        q5_submit = st.form_submit_button(
-            "בדיקת תשובה",
-            disabled=(q5_attempt_count >= 10 or st.query_params.get("q5_status_coin") == "success")
-        )
+with col1:
+    render_questions(questions)
 
-        # Process form submission inside the form
-        if q5_submit:
-            # Check if answer is correct
-            is_correct = abs(q5_answer - correct_answers_coin["q5"]) < 0.1
-
-            if is_correct:
-                st.query_params["q5_status_coin"] = "success"
-            else:
-                # Increment attempt counter
-                q5_attempt_count += 1
-
-                # Update URL parameter
-                st.query_params["q5_attempts_coin"] = str(q5_attempt_count)
-
-                if q5_attempt_count >= 10:
-                    st.query_params["q5_status_coin"] = "failed"
-                else:
-                    st.query_params["q5_status_coin"] = "trying"
-
-        # Check if we need to show a previous result
-        if "q5_status_coin" in st.query_params:
-            status = st.query_params["q5_status_coin"]
-            if status == "success":
-                st.success(
-                    f"כל הכבוד! התשובה הנכונה היא {correct_answers_coin['q5']}%.\n"
-                    "\n"
-                    "**הסבר:** זוהי שאלה על הסתברות גיאומטרית.\n"
-                    "ההסתברות הגיאומטרית עוסקת במצבים שבהם אנחנו רוצים לדעת מה ההסתברות לקבל את ההצלחה הראשונה בהטלה ה-k.\n"
-                    "\n"
-                    "במקרה שלנו, אנחנו מחפשים את ההסתברות שההצלחה הראשונה (כלומר, 'עץ') תקרה בהטלה ה-4.\n"
-                    "\n"
-                    "הנוסחה להסתברות גיאומטרית היא:\n"
-                    "P(X = k) = (1 - p)^(k-1) * p\n"
-                    "כאשר:\n"
-                    "- p = 0.5 (ההסתברות להצלחה בהטלה)\n"
-                    "- k = 4 (ההטלה הראשונה בה נקבל 'עץ')\n"
-                    "\n"
-                    "נחשב את ההסתברות:\n"
-                    "P(X = 4) = (1 - 0.5)^(4-1) * 0.5 = (0.5)^3 * 0.5 = 0.0625\n"
-                    "\n"
-                    "ההסתברות לקבל 'עץ' לראשונה בהטלה ה-4 היא 0.0625, או **6.25%**."
-                )
-            elif status == "failed":
-                st.error(
-                    f"כל הכבוד על הניסיון! בפעם הבאה תצליחו יותר.\n"
-                    "\n"
-                    f"התשובה הנכונה היא {correct_answers_coin['q5']}%.\n"
-                    "\n"
-                    "**הסבר:** זוהי שאלה על הסתברות גיאומטרית.\n"
-                    "ההסתברות הגיאומטרית עוסקת במצבים שבהם אנחנו רוצים לדעת מה ההסתברות לקבל את ההצלחה הראשונה בהטלה ה-k.\n"
-                    "\n"
-                    "במקרה שלנו, אנחנו מחפשים את ההסתברות שההצלחה הראשונה (כלומר, 'עץ') תקרה בהטלה ה-4.\n"
-                    "\n"
-                    "הנוסחה להסתברות גיאומטרית היא:\n"
-                    "P(X = k) = (1 - p)^(k-1) * p\n"
-                    "כאשר:\n"
-                    "- p = 0.5 (ההסתברות להצלחה בהטלה)\n"
-                    "- k = 4 (ההטלה הראשונה בה נקבל 'עץ')\n"
-                    "\n"
-                    "נחשב את ההסתברות:\n"
-                    "P(X = 4) = (1 - 0.5)^(4-1) * 0.5 = (0.5)^3 * 0.5 = 0.0625\n"
-                    "\n"
-                    "ההסתברות לקבל 'עץ' לראשונה בהטלה ה-4 היא 0.0625, או **6.25%**."
-                )
-            elif status == "trying":
-                current_attempts = int(st.query_params.get("q5_attempts_coin", "0"))
-                remaining = 10 - current_attempts
-                st.error(f"לא מדויק. נסו שוב! נותרו {remaining} ניסיונות.")
\ No newline at end of file
+profiler.lap("practice")
+profiler.finish()
@@ -0,0 +1,39 @@
+"""
+Tests of the session seed read from the ?seed= query parameter.
+
+Run from the lucky_night_app directory:
+    python -m pytest tests
+"""
+
+import os
+import sys
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lucky_night_core.rng import MAX_SEED
+
+SCRIPT = """
+from utils.session_rng import show_seed_panel
+
+show_seed_panel()
+"""
+
+
+def run_with_seed(seed):
+    app = AppTest.from_string(SCRIPT)
+    app.query_params["seed"] = seed
+    app.run()
+    assert not app.exception  # The replay form must accept the seed it shows
+    return app.session_state["session_rng"].seed
+
+
+def test_seed_from_query_params():
+    assert run_with_seed("1234") == 1234
+
+
+@pytest.mark.parametrize("seed", [str(MAX_SEED), "123456789", "-5", "abc", "²"])
+def test_invalid_seed_gets_a_fresh_one(seed):
+    assert 0 <= run_with_seed(seed) < MAX_SEED
@@ -0,0 +1,117 @@
+"""
+Server-side storage of the attempt counts and statuses of the practice questions.
+
+By default the state lives in memory, in the user's session, so it survives
+switching between the game pages without touching the URL. Setting the
+LUCKY_NIGHT_ANSWER_DB environment variable to a file path keeps it in a local
+SQLite file instead, so it also survives a page refresh.
+"""
+
+import contextlib
+import os
+import sqlite3
+import uuid
+
+import streamlit as st
+
+# Environment variable holding the path of the optional SQLite file
+ANSWER_DB_ENV = "LUCKY_NIGHT_ANSWER_DB"
+
+# The only query parameter left in the URL (SQLite backend only)
+SESSION_PARAM = "sid"
+
+
+class MemoryAnswerStore:
+    """
+    Attempt counts and statuses of the questions, kept in memory.
+    """
+
+    def __init__(self):
+        self._state = {}  # question id -> (attempts, status)
+
+    def get(self, question_id):
+        """
+        Return the state of a question.
+
+        Returns:
+            tuple: Number of wrong attempts and the status ("success", "trying", "failed" or None)
+        """
+        return self._state.get(question_id, (0, None))
+
+    def set(self, question_id, attempts, status):
+        """Update the state of a question."""
+        self._state[question_id] = (attempts, status)
+
+    def flush(self):
+        """Write pending changes to the backend (nothing to do in memory)."""
+
+
+class SQLiteAnswerStore(MemoryAnswerStore):
+    """
+    Attempt counts and statuses of the questions, kept in a local SQLite file.
+
+    The rows of the session are read once, when the store is created. Changes
+    are kept in memory and written in a single transaction by flush().
+    """
+
+    def __init__(self, path, session_id):
+        super().__init__()
+        self.path = path
+        self.session_id = session_id
+        self._dirty = set()
+
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS answer_state ("
+                "session_id TEXT, question_id TEXT, attempts INTEGER, status TEXT, "
+                "PRIMARY KEY (session_id, question_id))"
+            )
+            rows = conn.execute(
+                "SELECT question_id, attempts, status FROM answer_state WHERE session_id = ?",
+                (session_id,)
+            ).fetchall()
+        self._state = {question_id: (attempts, status) for question_id, attempts, status in rows}
+
+    @contextlib.contextmanager
+    def _connect(self):
+        """Open a connection that commits the transaction and closes when the block ends."""
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def set(self, question_id, attempts, status):
+        super().set(question_id, attempts, status)
+        self._dirty.add(question_id)
+
+    def flush(self):
+        if not self._dirty:
+            return
+
+        rows = [(self.session_id, question_id, *self._state[question_id]) for question_id in self._dirty]
+        with self._connect() as conn:
+            conn.executemany("INSERT OR REPLACE INTO answer_state VALUES (?, ?, ?, ?)", rows)
+        self._dirty.clear()
+
+
+def get_answer_store():
+    """
+    Return the answer store of the current session, creating it on first use.
+
+    The store is kept in st.session_state, so all the game pages share it.
+    """
+    if "answer_store" not in st.session_state:
+        path = os.environ.get(ANSWER_DB_ENV)
+        if path:
+            # A short key in the URL lets a refreshed page find its rows again
+            session_id = st.query_params.get(SESSION_PARAM)
+            if session_id is None:
+                session_id = uuid.uuid4().hex[:12]
+                st.query_params[SESSION_PARAM] = session_id
+            st.session_state.answer_store = SQLiteAnswerStore(path, session_id)
+        else:
+            st.session_state.answer_store = MemoryAnswerStore()
+
+    return st.session_state.answer_store
@@ -0,0 +1,56 @@
+"""
+Process-wide cache of the static images of the app (logo, home page picture).
+
+st.image with a file path re-reads the file on every rerun and, when the image
+is wider than the page, decodes it, scales it down and encodes it again. Here
+every image is read once per process and scaled to the width it is displayed
+at, so a rerun only hands the ready bytes to Streamlit. Streamlit stores them
+under a hash of their content (/media/<hash>.png), and identical bytes get
+the same URL for every session, so the browser caches them.
+"""
+
+import functools
+import io
+import os
+
+import streamlit as st
+from PIL import Image
+
+# Directory of the main script, where the images live
+ASSET_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Widest Streamlit ever shows an image (larger images are scaled down by st.image)
+MAX_DISPLAY_WIDTH = 1460
+
+# The sidebar is ~336px wide, twice that keeps the logo sharp on high-DPI screens
+LOGO_WIDTH = 672
+
+
+@functools.lru_cache(maxsize=None)
+def load_image(name, width=MAX_DISPLAY_WIDTH):
+    """
+    Read an image of the app once and encode it at its display resolution.
+
+    Args:
+        name (str): File name, relative to the app directory
+        width (int): Largest width the image is displayed at; wider images are scaled down
+
+    Returns:
+        bytes: PNG bytes, at most width pixels wide
+    """
+    path = os.path.join(ASSET_DIR, name)
+    with Image.open(path) as image:
+        if image.format == "PNG" and image.width <= width:
+            with open(path, "rb") as f:
+                return f.read()
+
+        if image.width > width:
+            image = image.resize((width, round(image.height * width / image.width)), Image.BILINEAR)
+        buffer = io.BytesIO()
+        image.save(buffer, format="PNG")
+        return buffer.getvalue()
+
+
+def show_logo():
+    """Show the university logo at the top of the sidebar."""
+    st.sidebar.image(load_image("bgu_logo.png", LOGO_WIDTH))
@@ -1,15 +1,13 @@
+import re
+
 import streamlit as st
 
 """
 This module contains helper functions that are used across multiple pages.
 """
 
-"""
-Set up the page with custom CSS styles.
-"""
-def setup_page():
-    st.markdown("""
-        <style>
+# Styles shared by every page
+PAGE_CSS = """
             @import url('https://fonts.googleapis.com/css2?family=Rubik:wght@400;500;600&display=swap');
 
             .stApp {
@@ -147,8 +145,28 @@ def setup_page():
                 height: 150px; /* Set desired height */
                 object-fit: cover; /* Ensures the image fits nicely */
             }
-        </style>
-    """, unsafe_allow_html=True)
+"""
+
+
+def minify_css(css):
+    """Drop the comments and the whitespace that CSS does not need."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.strip()
+
+
+# Built once per process. Streamlit removes every element a rerun does not
+# send again, so the style block still goes out on each rerun, but minified.
+_PAGE_STYLE = f"<style>{minify_css(PAGE_CSS)}</style>"
+
+
+"""
+Set up the page with custom CSS styles.
+"""
+def setup_page():
+    st.markdown(_PAGE_STYLE, unsafe_allow_html=True)
 
 def under_development_page():
     col1, col2 = st.columns([1, 4])
@@ -0,0 +1,117 @@
+"""
+Opt-in timing of the page reruns, section by section.
+
+Profiling is off unless the LUCKY_NIGHT_PROFILE environment variable is set to 1.
+When it is on, every page run records the duration of its sections into a
+process-wide ring buffer per (page, section), and a debug panel in the sidebar
+shows the p50/p95 of every section and offers them as a JSON download.
+
+A page creates a PageProfiler at the top of its content and either closes a
+section with lap() (the time since the previous lap) or wraps a hot spot with
+the section() context manager. finish() records the whole rerun.
+"""
+
+import collections
+import contextlib
+import json
+import os
+import threading
+import time
+
+import streamlit as st
+
+PROFILE_ENV = "LUCKY_NIGHT_PROFILE"
+
+# Number of durations kept per (page, section)
+RING_SIZE = 500
+
+_durations = collections.defaultdict(lambda: collections.deque(maxlen=RING_SIZE))
+_lock = threading.Lock()
+
+
+def profiling_enabled():
+    return os.environ.get(PROFILE_ENV) == "1"
+
+
+def record(page, section, seconds):
+    """Add a duration to the ring buffer of (page, section)."""
+    with _lock:
+        _durations[(page, section)].append(seconds)
+
+
+def summary():
+    """
+    Summarize the recorded durations.
+
+    Returns:
+        dict: page -> section -> {"count", "p50_ms", "p95_ms"}
+    """
+    import numpy as np  # Only needed when the summary is shown, and profiling is off by default
+
+    with _lock:
+        snapshot = {key: np.array(values) for key, values in _durations.items()}
+
+    result = {}
+    for (page, section), values in snapshot.items():
+        p50, p95 = np.percentile(values, [50, 95]) * 1000
+        result.setdefault(page, {})[section] = {
+            "count": len(values),
+            "p50_ms": round(float(p50), 2),
+            "p95_ms": round(float(p95), 2),
+        }
+    return result
+
+
+def reset():
+    """Forget every recorded duration."""
+    with _lock:
+        _durations.clear()
+
+
+class PageProfiler:
+    """
+    Timer of a single page run. Does nothing when profiling is off.
+    """
+
+    def __init__(self, page):
+        self.page = page
+        self.enabled = profiling_enabled()
+        self._start = self._last_lap = time.perf_counter()
+
+    def lap(self, section):
+        """Record the time since the previous lap (or the start of the run) under section."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        record(self.page, section, now - self._last_lap)
+        self._last_lap = now
+
+    @contextlib.contextmanager
+    def section(self, section):
+        """Record the duration of the block under section."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            record(self.page, section, time.perf_counter() - start)
+
+    def finish(self):
+        """Record the whole run and show the debug panel."""
+        if not self.enabled:
+            return
+        record(self.page, "total", time.perf_counter() - self._start)
+        show_debug_panel()
+
+
+def show_debug_panel():
+    """Sidebar panel with the p50/p95 of every section and a JSON dump of them."""
+    stats = summary()
+    with st.sidebar.expander("⏱️ Profiling", expanded=False):
+        rows = [{"page": page, "section": section, **values}
+                for page, sections in stats.items() for section, values in sections.items()]
+        st.dataframe(rows, hide_index=True, width="stretch")
+        st.download_button("JSON", json.dumps(stats, ensure_ascii=False, indent=2),
+                           file_name="profile.json", mime="application/json")
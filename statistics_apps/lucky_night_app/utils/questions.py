@@ -0,0 +1,131 @@
+"""
+Declarative practice questions and the single renderer shared by all the game pages.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import streamlit as st
+
+from utils.answer_store import get_answer_store
+
+
+@dataclass(frozen=True)
+class Question:
+    """
+    A practice question with a numeric answer.
+
+    Attributes:
+        id (str): Unique id, also the prefix of the question's widget and state keys
+        prompt (str): HTML markdown of the question box
+        answer (float): The correct answer
+        explanation (str): Markdown explanation shown once the question is solved or failed
+        unit (str): Unit shown after the answer ("%" or "")
+        tolerance (float): Maximal distance from the answer that counts as correct
+        max_attempts (int): Number of wrong attempts allowed
+        input_label (str): Label of the answer input
+        details (callable): Optional, renders extra content under the prompt (tables etc.)
+        figure (callable): Optional, returns image bytes shown next to the explanation.
+                           Called only when the explanation is shown.
+    """
+    id: str
+    prompt: str
+    answer: float
+    explanation: str
+    unit: str = "%"
+    tolerance: float = 0.1
+    max_attempts: int = 10
+    input_label: str = "הכניסו את תשובתכם באחוזים:"
+    details: Optional[Callable[[], None]] = None
+    figure: Optional[Callable[[], bytes]] = None
+
+    @property
+    def answer_text(self):
+        return f"{self.answer:g}{self.unit}"
+
+
+def _show_explanation(question, message, show):
+    """Show the result message, next to the question's figure if it has one."""
+    if question.figure is None:
+        show(message)
+        return
+
+    col_message, col_figure = st.columns(2)
+    with col_message:
+        show(message)
+    with col_figure:
+        st.image(question.figure(), width="stretch")
+
+
+def render_question(question, store):
+    """
+    Render a single question: prompt, answer form and the result of the last attempt.
+
+    Args:
+        question (Question): The question to render
+        store (MemoryAnswerStore): Where the attempt count and status of the question are kept
+    """
+    st.markdown(question.prompt, unsafe_allow_html=True)
+    if question.details is not None:
+        question.details()
+
+    attempt_count, status = store.get(question.id)
+
+    with st.form(key=f"{question.id}_form"):
+        user_answer = st.number_input(
+            question.input_label,
+            min_value=0.0,
+            max_value=100.0,
+            step=0.1,
+            key=f"{question.id}_input"
+        )
+
+        # Submit button (disabled if max attempts reached)
+        submitted = st.form_submit_button(
+            "בדיקת תשובה",
+            disabled=(attempt_count >= question.max_attempts or status == "success")
+        )
+
+        # Only the submitted question is checked
+        if submitted:
+            if abs(user_answer - question.answer) < question.tolerance:
+                status = "success"
+            else:
+                attempt_count += 1
+                status = "failed" if attempt_count >= question.max_attempts else "trying"
+            store.set(question.id, attempt_count, status)
+
+        if status == "success":
+            _show_explanation(question,
+                              f"כל הכבוד! התשובה הנכונה היא {question.answer_text}. \n"
+                              "\n"
+                              f"{question.explanation}",
+                              st.success)
+        elif status == "failed":
+            _show_explanation(question,
+                              f"כל הכבוד על הניסיון! בפעם הבאה תצליחו יותר. \n"
+                              "\n"
+                              f"התשובה הנכונה היא {question.answer_text}. \n"
+                              "\n"
+                              f"{question.explanation}",
+                              st.error)
+        elif status == "trying":
+            remaining = question.max_attempts - attempt_count
+            st.error(f"לא מדויק. נסו שוב! נותרו {remaining} ניסיונות.")
+
+
+def render_questions(questions, store=None):
+    """
+    Render the practice questions of a page and write their changed state in one batch.
+
+    Args:
+        questions (list): The Question entries of the page
+        store (MemoryAnswerStore): Answer state backend, the session's store by default
+    """
+    if store is None:
+        store = get_answer_store()
+
+    for question in questions:
+        render_question(question, store)
+
+    store.flush()
@@ -0,0 +1,49 @@
+"""
+The random streams of the current session, and the sidebar panel to replay a seed.
+
+Every session gets its own lucky_night_core.rng.SessionRNG. A student can read
+its seed in the sidebar, and an instructor who enters that seed under "replay"
+(or opens the page with ?seed=<seed> in the URL) and plays the same games
+gets the same results.
+"""
+
+import streamlit as st
+
+from lucky_night_core.rng import MAX_SEED, SessionRNG
+
+# Query parameter that starts a session from a given seed
+SEED_PARAM = "seed"
+
+
+def get_session_rng():
+    """
+    Return the SessionRNG of the current session, creating it on first use.
+
+    The generators are kept in st.session_state, so all the game pages share them.
+    """
+    if "session_rng" not in st.session_state:
+        seed = st.query_params.get(SEED_PARAM)
+        # A seed the replay form could not show (not a number, or out of range) gets a fresh one
+        valid = seed is not None and seed.isdecimal() and int(seed) < MAX_SEED
+        st.session_state.session_rng = SessionRNG(int(seed) if valid else None)
+
+    return st.session_state.session_rng
+
+
+def game_rng(game):
+    """The generator of a game in the current session."""
+    return get_session_rng().generator(game)
+
+
+def show_seed_panel():
+    """Sidebar panel with the session seed and a form to replay another one."""
+    session_rng = get_session_rng()
+    with st.sidebar.expander("🎲 מספר ההגרלה (seed)", expanded=False):
+        st.write(f"ה-seed של הסשן: **{session_rng.seed}**")
+        with st.form("replay_seed_form"):
+            seed = st.number_input("שחזור seed:", 0, MAX_SEED - 1, session_rng.seed, step=1)
+            if st.form_submit_button("שחזור"):
+                # Restart every game stream, so the same games give the same results
+                st.session_state.session_rng = SessionRNG(seed)
+                st.rerun()
+        st.caption("כדי לקבל את אותן תוצאות יש להתחיל משחק חדש ולשחק את אותם משחקים באותו סדר.")
@@ -1,24 +1,17 @@
 import streamlit as st
-import os
-from PIL import Image
-
-import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.patches import Circle
-import math
-import time
 
+from utils.assets import load_image, show_logo
 from utils.helper_functions import setup_page
+from utils.profiling import PageProfiler
 
 
 def main():
+    profiler = PageProfiler("home")
     st.set_page_config(page_title="ליל המזל 🎲", layout="wide")
     setup_page()
+    profiler.lap("setup_page")
 
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-
-    logo_path = os.path.join(current_dir, 'bgu_logo.png')
-    st.sidebar.image(logo_path)
+    show_logo()
     st.sidebar.markdown("""
     
         <div style="text-align: center;">
@@ -33,10 +26,10 @@ def main():
     col1, col2, col3 = st.columns([1, 4, 1])
 
     with col2:
-        image_path = os.path.join(current_dir, 'home_page_introduction.png')
-
-        st.image(image_path)
+        st.image(load_image('home_page_introduction.png'))
 
+    profiler.lap("content")
+    profiler.finish()
 
 
 if __name__ == "__main__":